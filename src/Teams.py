@@ -3,7 +3,7 @@
 import streamlit as st
 
 from page_managers import TeamManager
-from utils import GraphType
+from utils import event_data_status, GraphType, show_profile, start_profiling
 
 # Configuration for Streamlit
 st.set_page_config(
@@ -11,6 +11,7 @@ st.set_page_config(
     page_title="Teams",
     page_icon="🤖",
 )
+profile = start_profiling("Teams")
 team_manager = TeamManager()
 
 if __name__ == '__main__':
@@ -75,3 +76,6 @@ if __name__ == '__main__':
         team_manager.generate_qualitative_graphs(
             team_number,
         )
+
+    # Show where the time went during this rerun if it's being profiled.
+    show_profile(profile, event_data_status())
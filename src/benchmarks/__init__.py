@@ -0,0 +1 @@
+"""Benchmarks used to measure the performance of FalconVis' data pipeline (run from the `src` directory)."""
@@ -0,0 +1,318 @@
+"""Benchmarks FalconVis' data pipeline end to end on synthetic events, from ingesting the data to building graphs.
+
+Times parsing the scouting data, every per-team `CalculatedStats` method across all teams, `quantile_stat`,
+`chance_of_bonuses`, `chance_of_winning`, the Ranking Simulator, the picklist and the graph builders in
+`utils.graphing` at each event size. The results are written as JSON and compared against a stored baseline,
+so a change that slows down any stage shows up as a regression.
+
+Run with `python -m benchmarks.pipeline` from the `src` directory, adding `--save-baseline` to store the results
+as the baseline that later runs are compared against (baselines are only comparable on the same machine).
+"""
+
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from statistics import median
+from time import perf_counter
+from typing import Callable
+
+from page_managers.picklist_manager import PicklistManager
+from page_managers.ranking_simulator_manager import RankingSimulatorManager
+from utils import (
+    bar_graph,
+    box_plot,
+    CalculatedStats,
+    Criteria,
+    data_version,
+    EventData,
+    line_graph,
+    multi_line_graph,
+    populate_missing_data,
+    Queries,
+    result_cache,
+    retrieve_team_list,
+    stacked_bar_graph
+)
+from utils.functions import (
+    _parse_note_scouting_data,
+    _parse_pit_scouting_data,
+    _parse_scouting_data,
+    _parse_tba_event_matches
+)
+
+from .synthetic_event import EVENT_SIZES, generate_synthetic_event, SyntheticEvent
+
+__all__ = [
+    "compare_to_baseline",
+    "run_benchmarks"
+]
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+MATCHES_PER_TEAM = 12
+REPEAT = 5
+
+# Slowdowns smaller than this are noise rather than regressions, however large they are relative to the baseline.
+MINIMUM_REGRESSION_SECONDS = 0.005
+
+# The per-team `CalculatedStats` methods, each timed across every team at the event.
+PER_TEAM_METHODS = {
+    "data_for_team": lambda stats, team: stats.data_for_team(team),
+    "average_points_contributed": lambda stats, team: stats.average_points_contributed(team),
+    "points_contributed_by_match": lambda stats, team: stats.points_contributed_by_match(team),
+    "average_cycles": lambda stats, team: stats.average_cycles(team),
+    "average_passing_cycles": lambda stats, team: stats.average_passing_cycles(team),
+    "average_cycles_for_structure": lambda stats, team: stats.average_cycles_for_structure(
+        team, Queries.TELEOP_SPEAKER
+    ),
+    "average_potential_amplification_periods": lambda stats, team: stats.average_potential_amplification_periods(
+        team
+    ),
+    "cycles_by_match": lambda stats, team: stats.cycles_by_match(team),
+    "passing_shots_by_match": lambda stats, team: stats.passing_shots_by_match(team),
+    "cycles_by_structure_per_match": lambda stats, team: stats.cycles_by_structure_per_match(
+        team, (Queries.AUTO_SPEAKER, Queries.TELEOP_SPEAKER)
+    ),
+    "potential_amplification_periods_by_match": lambda stats, team: stats.potential_amplification_periods_by_match(
+        team
+    ),
+    "average_coop_bonus_rate": lambda stats, team: stats.average_coop_bonus_rate(team),
+    "reaches_coop_bonus_by_match": lambda stats, team: stats.reaches_coop_bonus_by_match(team),
+    "average_driver_rating": lambda stats, team: stats.average_driver_rating(team),
+    "average_feeding_cycles_without_full_field": lambda stats, team: (
+        stats.average_feeding_cycles_without_full_field(team)
+    ),
+    "average_defense_time": lambda stats, team: stats.average_defense_time(team),
+    "average_defense_skill": lambda stats, team: stats.average_defense_skill(team),
+    "average_counter_defense_skill": lambda stats, team: stats.average_counter_defense_skill(team),
+    "average_stat": lambda stats, team: stats.average_stat(team, Queries.TELEOP_TRAP, Criteria.BOOLEAN_CRITERIA),
+    "cumulative_stat": lambda stats, team: stats.cumulative_stat(
+        team, Queries.CLIMBED_CHAIN, Criteria.BOOLEAN_CRITERIA
+    ),
+    "stat_per_match": lambda stats, team: stats.stat_per_match(team, Queries.CLIMBED_CHAIN),
+    "driving_index": lambda stats, team: stats.driving_index(team)
+}
+
+
+def _time(function: Callable[[], object], repeat: int) -> dict:
+    """Times a function, returning the duration of each run in seconds along with their minimum and median.
+
+    The results shared through `result_cache` are cleared before every run, so each run computes them again.
+    """
+    runs = []
+
+    for _ in range(repeat):
+        result_cache.clear()
+        start = perf_counter()
+        function()
+        runs.append(perf_counter() - start)
+
+    return {"min": min(runs), "median": median(runs), "runs": runs}
+
+
+def _event_data_from(event: SyntheticEvent) -> EventData:
+    """Parses the payloads of a synthetic event into the event data the pages receive."""
+    match_schedule, match_data = _parse_tba_event_matches(event.event_matches)
+    sources = (
+        _parse_scouting_data(event.scouting_data),
+        _parse_note_scouting_data(event.scouting_data),
+        _parse_pit_scouting_data(event.pit_scouting_data),
+        match_schedule,
+        match_data
+    )
+    return EventData(*sources, version=data_version(*sources))
+
+
+def _benchmark_event(event: SyntheticEvent, repeat: int) -> dict[str, dict]:
+    """Times every stage of the pipeline on one synthetic event (see the module docstring)."""
+    results = {
+        "ingest.parse_scouting_data": _time(lambda: _parse_scouting_data(event.scouting_data), repeat),
+        "ingest.parse_tba_event_matches": _time(lambda: _parse_tba_event_matches(event.event_matches), repeat)
+    }
+
+    event_data = _event_data_from(event)
+    results["ingest.data_version"] = _time(lambda: data_version(*event_data[:-1]), repeat)
+
+    teams = retrieve_team_list(event_data.scouting_data)
+    # Every alliance in the schedule, alternating between the Red and Blue Alliance of each match.
+    alliances = [
+        list(alliance)
+        for red_alliance, blue_alliance in zip(
+            event_data.match_schedule["red_alliance"], event_data.match_schedule["blue_alliance"]
+        )
+        for alliance in (red_alliance, blue_alliance)
+    ]
+
+    # Statistics computed once per version of the event data, from a fresh instance each run.
+    results["calculated_stats.event_table"] = _time(
+        lambda: CalculatedStats(event_data.scouting_data).event_table(), repeat
+    )
+
+    calculated_stats = CalculatedStats(event_data.scouting_data)
+    calculated_stats.event_table()
+
+    for name, method in PER_TEAM_METHODS.items():
+        results[f"calculated_stats.{name}"] = _time(
+            lambda: [method(calculated_stats, team) for team in teams], repeat
+        )
+
+    results["calculated_stats.quantile_stat"] = _time(
+        lambda: calculated_stats.quantile_stat(0.5, lambda self, team: self.average_cycles(team)), repeat
+    )
+    results["calculated_stats.chance_of_bonuses"] = _time(
+        lambda: [calculated_stats.chance_of_bonuses(alliance) for alliance in alliances], repeat
+    )
+    results["calculated_stats.chance_of_winning"] = _time(
+        lambda: [
+            calculated_stats.chance_of_winning(red_alliance, blue_alliance)
+            for red_alliance, blue_alliance in zip(alliances[::2], alliances[1::2])
+        ],
+        repeat
+    )
+
+    # Pages, built from the same event data (not cached outside of a Streamlit server, and `result_cache` is cleared).
+    matches_played = event_data.match_data["match_number"].max()
+    results["ranking_simulator.generate_simulated_rankings"] = _time(
+        lambda: RankingSimulatorManager(event_data).generate_simulated_rankings(matches_played), repeat
+    )
+
+    picklist_manager = PicklistManager(event_data)
+    results["picklist.generate_picklist"] = _time(
+        lambda: picklist_manager.generate_picklist(list(picklist_manager.requested_stats)), repeat
+    )
+
+    # Graphs, shaped like the graphs the Teams, Match and Event pages build.
+    points_by_team = [calculated_stats.average_points_contributed(team) for team in teams]
+    cycles_by_team = [calculated_stats.cycles_by_match(team) for team in teams]
+    points_by_mode = [
+        [calculated_stats.average_stat(team, field) for team in teams]
+        for field in (Queries.AUTO_POINTS, Queries.TELEOP_POINTS, Queries.ENDGAME_POINTS)
+    ]
+
+    results["graphing.bar_graph"] = _time(
+        lambda: bar_graph(teams, points_by_team, x_axis_label="Teams", y_axis_label="Points"), repeat
+    )
+    results["graphing.box_plot"] = _time(lambda: box_plot(teams, cycles_by_team), repeat)
+    results["graphing.line_graph"] = _time(
+        lambda: line_graph(
+            range(len(cycles_by_team[0])), cycles_by_team[0].tolist(), x_axis_label="Match Index", y_axis_label="Cycles"
+        ),
+        repeat
+    )
+    results["graphing.multi_line_graph"] = _time(
+        lambda: multi_line_graph(
+            *populate_missing_data(cycles_by_team[:3]),
+            x_axis_label="Match Index",
+            y_axis_label=[str(team) for team in teams[:3]],
+            y_axis_title="Cycles"
+        ),
+        repeat
+    )
+    results["graphing.stacked_bar_graph"] = _time(
+        lambda: stacked_bar_graph(
+            teams,
+            points_by_mode,
+            x_axis_label="Teams",
+            y_axis_label=[Queries.AUTO, Queries.TELEOP, Queries.ENDGAME],
+            y_axis_title="Points"
+        ),
+        repeat
+    )
+
+    return results
+
+
+def run_benchmarks(sizes: tuple[int, ...] = EVENT_SIZES[:3], repeat: int = REPEAT) -> dict:
+    """Times every stage of the pipeline on a synthetic event of each size.
+
+    :param sizes: The number of teams at each synthetic event.
+    :param repeat: The number of times each stage is timed.
+    :return: The results, keyed by "<teams>/<stage>" under "results", along with the environment they were run in.
+    """
+    results = {}
+
+    for teams in sizes:
+        # Half of the matches have been played, so the Ranking Simulator has matches left to simulate.
+        matches = teams * MATCHES_PER_TEAM // 6
+        event = generate_synthetic_event(teams, MATCHES_PER_TEAM, matches_played=matches // 2)
+
+        for stage, timing in _benchmark_event(event, repeat).items():
+            results[f"{teams}/{stage}"] = timing
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results
+    }
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Compares the fastest run of each stage against the baseline.
+
+    :param results: The results of `run_benchmarks`.
+    :param baseline: The results of a previous run of `run_benchmarks` to compare against.
+    :param threshold: How much slower than the baseline a stage can get before it's a regression (0.2 for 20%).
+    :return: The stages that regressed.
+    """
+    regressions = []
+
+    for stage, timing in results["results"].items():
+        if (baseline_timing := baseline["results"].get(stage)) is None:
+            continue
+
+        change = timing["min"] / baseline_timing["min"] - 1
+        regressed = change > threshold and timing["min"] - baseline_timing["min"] > MINIMUM_REGRESSION_SECONDS
+
+        if regressed:
+            regressions.append(stage)
+
+        print(
+            f"{stage:<70} {baseline_timing['min'] * 1000:>10.2f} ms -> {timing['min'] * 1000:>10.2f} ms "
+            f"({change:+.0%}){'  REGRESSION' if regressed else ''}"
+        )
+
+    return regressions
+
+
+def main() -> None:
+    """Runs the benchmarks, writes their results and compares them against the baseline."""
+    parser = ArgumentParser(description="Benchmarks FalconVis' data pipeline on synthetic events.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=EVENT_SIZES[:3], help="The number of teams per event.")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", help="Where to write the results as JSON.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="The results to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Stores the results as the baseline.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="The slowdown reported as a regression.")
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(tuple(arguments.sizes), arguments.repeat)
+
+    for path in filter(None, (arguments.output, arguments.baseline if arguments.save_baseline else None)):
+        with open(path, "w") as results_file:
+            json.dump(results, results_file, indent=2)
+
+        print(f"Wrote the results to {path}")
+
+    if arguments.save_baseline:
+        return
+
+    if not os.path.exists(arguments.baseline):
+        print(f"No baseline at {arguments.baseline} (store one with --save-baseline).")
+        return
+
+    with open(arguments.baseline) as baseline_file:
+        regressions = compare_to_baseline(results, json.load(baseline_file), arguments.threshold)
+
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed by more than {arguments.threshold:.0%}.")
+        sys.exit(1)
+
+    print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmarks a cold start from the scouting data JSON against a cold start from its columnar snapshot.
+
+Run with `python -m benchmarks.snapshot_cold_start` from the `src` directory.
+"""
+
+from tempfile import TemporaryDirectory
+from timeit import timeit
+
+from utils import read_snapshot, write_snapshot
+from utils.functions import _parse_scouting_data
+
+from .synthetic_event import generate_synthetic_event
+
+TEAMS = 80
+MATCHES_PER_TEAM = 12
+REPEAT = 10
+
+
+def main() -> None:
+    """Times loading the scouting data from its raw JSON payload and from its snapshot."""
+    payload = generate_synthetic_event(TEAMS, MATCHES_PER_TEAM).scouting_data
+    scouting_data = _parse_scouting_data(payload)
+
+    with TemporaryDirectory() as snapshot_directory:
+        write_snapshot("scouting_data", scouting_data, directory=snapshot_directory)
+
+        json_time = timeit(lambda: _parse_scouting_data(payload), number=REPEAT) / REPEAT
+        snapshot_time = timeit(
+            lambda: read_snapshot("scouting_data", directory=snapshot_directory),
+            number=REPEAT
+        ) / REPEAT
+
+        assert read_snapshot("scouting_data", directory=snapshot_directory).equals(scouting_data)
+
+    print(f"{TEAMS} teams x {MATCHES_PER_TEAM} matches ({len(scouting_data)} rows, {len(payload) / 1024:.0f} KiB JSON)")
+    print(f"From JSON:     {json_time * 1000:.2f} ms")
+    print(f"From snapshot: {snapshot_time * 1000:.2f} ms")
+    print(f"Speedup:       {json_time / snapshot_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
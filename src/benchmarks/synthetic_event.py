@@ -0,0 +1,333 @@
+"""Generates synthetic events shaped like the data FalconVis retrieves from GitHub and TBA.
+
+Each event is written as a directory that FalconVis can read its data from instead of GitHub and TBA, by setting
+the `FALCONVIS_LOCAL_DATA` environment variable to the directory (see `create_data_sources`). The directory can also
+be served by a local stand-in server (`python -m http.server --directory <directory>`) with
+`FALCONVIS_DATA_SOURCE=local_http`.
+
+Run with `python -m benchmarks.synthetic_event <directory> --teams 400` from the `src` directory.
+"""
+
+import json
+import os
+from argparse import ArgumentParser
+from typing import NamedTuple
+
+import numpy as np
+from pandas import DataFrame
+
+from utils import Criteria, DataKind, EventSpecificConstants, GeneralConstants, local_path, Queries
+
+__all__ = [
+    "EVENT_SIZES",
+    "generate_synthetic_event",
+    "SyntheticEvent",
+    "write_synthetic_event"
+]
+
+# The number of teams at the events used to test FalconVis at scale, from a regional up to several championships.
+EVENT_SIZES = (40, 80, 400, 4000)
+
+TEAMS_PER_MATCH = 6
+
+# Phrases that scouts write in their notes, mixing the terms used for sentiment analysis with neutral ones.
+_NOTE_PHRASES = [
+    "consistent shooter", "fast cycles", "good driver", "amazing auto", "scores well from the podium",
+    "slow intake", "missed a few shots", "got stuck on a note", "drops notes", "disabled for a bit",
+    "played some defense", "fed notes to the amp", "went under the stage", "climbed at the end", "tipped over"
+]
+
+
+class SyntheticEvent(NamedTuple):
+    """The raw payloads of a synthetic event, as they would be downloaded from GitHub and TBA.
+
+    The notes are part of the scouting data, which the note scouting data is parsed from like at a real event.
+    """
+
+    scouting_data: bytes
+    pit_scouting_data: bytes
+    event_matches: bytes
+
+
+def _generate_schedule(teams: np.ndarray, matches_per_team: int, rng: np.random.Generator) -> np.ndarray:
+    """Schedules every team into `matches_per_team` matches (one row of six teams per match, red alliance first).
+
+    Teams are dealt out in shuffled rounds, reshuffling a round whenever a team would end up twice in one match.
+    Like at real events, a few teams play an extra (surrogate) match when the slots don't divide evenly.
+    """
+    slots = []
+    surrogate_round = len(teams) * matches_per_team % TEAMS_PER_MATCH != 0
+
+    for round_number in range(matches_per_team + surrogate_round):
+        open_slots = -len(slots) % TEAMS_PER_MATCH
+        partial_match = set(slots[len(slots) - TEAMS_PER_MATCH + open_slots:]) if open_slots else set()
+        order = rng.permutation(teams).tolist()
+
+        while partial_match.intersection(order[:open_slots]):
+            order = rng.permutation(teams).tolist()
+
+        slots.extend(order if round_number < matches_per_team else order[:open_slots])
+
+    return np.array(slots).reshape(-1, TEAMS_PER_MATCH)
+
+
+def _observe(true_values: np.ndarray, scouts_per_robot: int, noise: float, rng: np.random.Generator) -> np.ndarray:
+    """Repeats each true count once per scout, miscounting by one with a probability of `noise`."""
+    observed = np.repeat(true_values, scouts_per_robot)
+    miscounts = rng.choice([-1, 1], observed.size) * (rng.random(observed.size) < noise)
+    return np.clip(observed + miscounts, 0, None)
+
+
+def _observe_flags(true_flags: np.ndarray, scouts_per_robot: int, noise: float, rng: np.random.Generator) -> np.ndarray:
+    """Repeats each true flag once per scout, recording it wrong with a probability of half of `noise`."""
+    observed = np.repeat(true_flags, scouts_per_robot)
+    return observed ^ (rng.random(observed.size) < noise / 2)
+
+
+def _observe_ratings(
+    true_ratings: np.ndarray,
+    criteria: dict,
+    scouts_per_robot: int,
+    noise: float,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Repeats each true rating (0 being the worst) once per scout, rating it off by `noise` on average."""
+    ratings = sorted(criteria, key=criteria.get)
+    observed = np.repeat(true_ratings, scouts_per_robot)
+    observed = observed + rng.normal(0, noise * 2, observed.size)
+    return np.array(ratings)[np.clip(np.rint(observed), 0, len(ratings) - 1).astype(int)]
+
+
+def _generate_notes(count: int, noise: float, rng: np.random.Generator) -> np.ndarray:
+    """Generates `count` notes, most of them empty, with more notes written at higher levels of noise."""
+    phrase_counts = rng.binomial(3, min(0.15 + noise / 2, 1), count)
+    phrases = rng.choice(_NOTE_PHRASES, (count, 3))
+    return np.array([", ".join(row[:phrase_count]) for row, phrase_count in zip(phrases, phrase_counts)])
+
+
+def _event_matches(
+    schedule: np.ndarray,
+    points: np.ndarray,
+    notes_scored: np.ndarray,
+    climbed: np.ndarray,
+    endgame_points: np.ndarray,
+    matches_played: int,
+    rng: np.random.Generator
+) -> list[dict]:
+    """Creates TBA's event matches payload, with results for the first `matches_played` matches."""
+    event_matches = []
+    alliance_positions = {Queries.RED_ALLIANCE: slice(0, 3), Queries.BLUE_ALLIANCE: slice(3, 6)}
+
+    for match_index, teams in enumerate(schedule):
+        played = match_index < matches_played
+        scores = {
+            alliance: int(points[match_index, positions].sum() + rng.poisson(GeneralConstants.AVERAGE_FOUL_RATE))
+            if played else -1
+            for alliance, positions in alliance_positions.items()
+        }
+        reached_coop = bool(rng.random() < 0.3)
+        best_score = max(scores.values())
+        score_breakdown = {}
+
+        for alliance, positions in alliance_positions.items():
+            melody = bool(notes_scored[match_index, positions].sum() >= 18)
+            ensemble = bool(
+                climbed[match_index, positions].sum() >= 2 and endgame_points[match_index, positions].sum() >= 10
+            )
+            win_rp = (scores[alliance] == best_score) * (1 if len(set(scores.values())) == 1 else 2)
+            score_breakdown[alliance] = {
+                "totalPoints": scores[alliance],
+                "rp": int(win_rp + melody + ensemble),
+                "melodyBonusAchieved": melody,
+                "ensembleBonusAchieved": ensemble,
+                "coopertitionBonusAchieved": reached_coop
+            }
+
+        winners = [alliance for alliance, score in scores.items() if score == best_score]
+        event_matches.append(
+            {
+                "key": f"{EventSpecificConstants.EVENT_CODE}_qm{match_index + 1}",
+                "event_key": EventSpecificConstants.EVENT_CODE,
+                "comp_level": "qm",
+                "set_number": 1,
+                "match_number": match_index + 1,
+                "alliances": {
+                    alliance: {"team_keys": [f"frc{team}" for team in teams[positions]], "score": scores[alliance]}
+                    for alliance, positions in alliance_positions.items()
+                },
+                "winning_alliance": winners[0] if played and len(winners) == 1 else "",
+                "score_breakdown": score_breakdown if played else None
+            }
+        )
+
+    return event_matches
+
+
+def generate_synthetic_event(
+    teams: int = 80,
+    matches_per_team: int = 12,
+    scouts_per_robot: int = 1,
+    noise: float = 0.1,
+    matches_played: int | None = None,
+    seed: int = 0
+) -> SyntheticEvent:
+    """Generates the scouting (with its notes), pit scouting and TBA data of a synthetic event.
+
+    Each team has a hidden skill that its robot performs around in every match. Every robot in a match is scouted by
+    `scouts_per_robot` scouts, who each miscount, misjudge and misrate what they see depending on `noise`. The TBA
+    results are scored from what the robots actually did, so the scouting data predicts them like it would at a real
+    event.
+
+    :param teams: The number of teams at the event.
+    :param matches_per_team: The number of qualification matches each team plays.
+    :param scouts_per_robot: The number of scouting submissions for each robot in each match.
+    :param noise: How often scouts make mistakes, from 0 (never) to 1.
+    :param matches_played: The number of qualification matches played so far, defaulting to all of them.
+    :param seed: The seed used for the random number generator.
+    :return: The raw payloads of the synthetic event.
+    """
+    if teams < TEAMS_PER_MATCH:
+        raise ValueError(f"An event needs at least {TEAMS_PER_MATCH} teams, got {teams}.")
+
+    rng = np.random.default_rng(seed)
+    team_numbers = np.sort(rng.choice(np.arange(1, max(10_000, teams * 3)), teams, replace=False))
+    skills = rng.beta(2, 3, teams)
+
+    schedule = _generate_schedule(team_numbers, matches_per_team, rng)
+    matches_played = len(schedule) if matches_played is None else min(matches_played, len(schedule))
+
+    # What each robot actually did in each match (one row per match, one column per station).
+    skill = skills[np.searchsorted(team_numbers, schedule)]
+    shape = schedule.shape
+    auto_speaker = rng.poisson(0.5 + 3 * skill)
+    auto_amp = rng.poisson(0.4 * (1 - skill))
+    left_starting_zone = rng.random(shape) < 0.7 + 0.3 * skill
+    used_centerline = rng.random(shape) < 0.6 * skill
+    teleop_speaker = rng.poisson(1 + 12 * skill)
+    teleop_amp = rng.poisson(1 + 4 * rng.random(shape))
+    teleop_trap = rng.random(shape) < 0.15 * skill
+    teleop_passing = rng.poisson(2 * (1 - skill))
+    climbed = rng.random(shape) < 0.3 + 0.6 * skill
+    harmonized = climbed & (rng.random(shape) < 0.2)
+    parked = ~climbed & (rng.random(shape) < 0.5)
+    disabled = rng.random(shape) < 0.03
+
+    endgame_points = 3 * climbed + parked + 2 * harmonized
+    points = (
+        5 * auto_speaker + 2 * auto_amp + 2 * left_starting_zone
+        + 2 * teleop_speaker + teleop_amp + 5 * teleop_trap
+        + endgame_points
+    )
+    notes_scored = auto_speaker + auto_amp + teleop_speaker + teleop_amp
+
+    # What the scouts saw, for the matches played so far.
+    played = slice(0, matches_played)
+    submissions = matches_played * TEAMS_PER_MATCH * scouts_per_robot
+    match_numbers = np.repeat(np.arange(1, matches_played + 1), TEAMS_PER_MATCH * scouts_per_robot)
+    stations = np.tile(np.repeat(np.arange(TEAMS_PER_MATCH), scouts_per_robot), matches_played)
+    scout_ids = stations * scouts_per_robot + np.tile(np.arange(scouts_per_robot), matches_played * TEAMS_PER_MATCH)
+    driver_ratings = np.clip(skill[played].ravel() * 4 + rng.normal(0, 0.5, skill[played].size), 0, 4)
+
+    def observe(values: np.ndarray) -> np.ndarray:
+        return _observe(values[played].ravel(), scouts_per_robot, noise, rng)
+
+    def observe_flags(flags: np.ndarray) -> np.ndarray:
+        return _observe_flags(flags[played].ravel(), scouts_per_robot, noise, rng)
+
+    def observe_ratings(ratings: np.ndarray, criteria: dict) -> np.ndarray:
+        return _observe_ratings(ratings, criteria, scouts_per_robot, noise, rng)
+
+    scouting_data = DataFrame({
+        Queries.MATCH_KEY: [f"qm{match_number}" for match_number in match_numbers],
+        Queries.TEAM_NUMBER: np.repeat(schedule[played].ravel(), scouts_per_robot),
+        Queries.SCOUT_ID: [f"scout{scout_id}" for scout_id in scout_ids],
+        Queries.AUTO_SPEAKER: observe(auto_speaker),
+        Queries.AUTO_AMP: observe(auto_amp),
+        Queries.AUTO_USED_CENTERLINE: observe_flags(used_centerline),
+        Queries.LEFT_STARTING_ZONE: observe_flags(left_starting_zone),
+        Queries.TELEOP_SPEAKER: observe(teleop_speaker),
+        Queries.TELEOP_AMP: observe(teleop_amp),
+        Queries.TELEOP_TRAP: observe(teleop_trap.astype(int)),
+        Queries.TELEOP_PASSING: observe(teleop_passing),
+        Queries.PARKED_UNDER_STAGE: observe_flags(parked),
+        Queries.CLIMBED_CHAIN: observe_flags(climbed),
+        Queries.HARMONIZED_ON_CHAIN: observe_flags(harmonized),
+        Queries.CLIMB_SPEED: np.where(
+            np.repeat(climbed[played].ravel(), scouts_per_robot), rng.choice(["Slow", "Fast"], submissions), ""
+        ),
+        Queries.DRIVER_RATING: observe_ratings(driver_ratings, Criteria.DRIVER_RATING_CRITERIA),
+        Queries.DEFENSE_TIME: observe_ratings(
+            rng.uniform(0, 2, driver_ratings.size), Criteria.DEFENSE_TIME_CRITERIA
+        ),
+        Queries.DEFENSE_SKILL: observe_ratings(driver_ratings, Criteria.BASIC_RATING_CRITERIA),
+        Queries.COUNTER_DEFENSE_SKIll: observe_ratings(driver_ratings, Criteria.BASIC_RATING_CRITERIA),
+        Queries.DISABLE: observe_flags(disabled),
+        Queries.AUTO_NOTES: _generate_notes(submissions, noise, rng),
+        Queries.TELEOP_NOTES: _generate_notes(submissions, noise, rng),
+        Queries.ENDGAME_NOTES: _generate_notes(submissions, noise, rng),
+        Queries.RATING_NOTES: _generate_notes(submissions, noise, rng)
+    })
+    pit_scouting_data = DataFrame({
+        "Team Number": team_numbers,
+        "Drivetrain Type": rng.choice(["Swerve", "Tank", "Mecanum"], teams, p=[0.8, 0.15, 0.05]),
+        "Drivetrain Width": rng.integers(24, 33, teams),
+        "Robot Weight": rng.integers(90, 126, teams),
+        "Programming Language": rng.choice(["Java", "Kotlin", "C++", "Python"], teams, p=[0.7, 0.1, 0.15, 0.05])
+    })
+    event_matches = _event_matches(schedule, points, notes_scored, climbed, endgame_points, matches_played, rng)
+
+    return SyntheticEvent(
+        scouting_data.to_json(orient="records").encode(),
+        pit_scouting_data.to_csv(index=False).encode(),
+        json.dumps(event_matches).encode()
+    )
+
+
+def write_synthetic_event(directory: str, event: SyntheticEvent) -> None:
+    """Writes a synthetic event to a directory, laid out like `LocalDirectorySource` reads each kind of data.
+
+    :param directory: The directory to write the event to (set `FALCONVIS_LOCAL_DATA` to it to use the event).
+    :param event: The synthetic event to write.
+    """
+    paths = {
+        local_path(DataKind.SCOUTING_DATA): event.scouting_data,
+        local_path(DataKind.PIT_SCOUTING_DATA): event.pit_scouting_data,
+        local_path(DataKind.EVENT_MATCHES): event.event_matches
+    }
+
+    for path, payload in paths.items():
+        path = os.path.join(directory, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "wb") as file:
+            file.write(payload)
+
+
+def main() -> None:
+    """Generates a synthetic event and writes it to the directory passed in."""
+    parser = ArgumentParser(description="Generates a synthetic event for FalconVis to read instead of GitHub/TBA.")
+    parser.add_argument("directory", help="The directory to write the event to.")
+    parser.add_argument("--teams", type=int, default=80, help=f"The number of teams (e.g. {EVENT_SIZES}).")
+    parser.add_argument("--matches-per-team", type=int, default=12)
+    parser.add_argument("--scouts-per-robot", type=int, default=1)
+    parser.add_argument("--noise", type=float, default=0.1)
+    parser.add_argument("--matches-played", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    write_synthetic_event(
+        arguments.directory,
+        generate_synthetic_event(
+            arguments.teams,
+            arguments.matches_per_team,
+            arguments.scouts_per_robot,
+            arguments.noise,
+            arguments.matches_played,
+            arguments.seed
+        )
+    )
+    print(f"Wrote a synthetic event with {arguments.teams} teams to {arguments.directory}")
+
+
+if __name__ == "__main__":
+    main()
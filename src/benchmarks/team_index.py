@@ -0,0 +1,40 @@
+"""Benchmarks per-team lookups with the per-team row index against a full-frame boolean mask.
+
+Run with `python -m benchmarks.team_index` from the `src` directory.
+"""
+
+from timeit import timeit
+
+from utils import CalculatedStats, retrieve_team_list, scouting_data_for_team
+from utils.functions import _parse_scouting_data
+
+from .synthetic_event import generate_synthetic_event
+
+TEAMS = 80
+MATCHES_PER_TEAM = 12
+REPEAT = 20
+
+
+def main() -> None:
+    """Times looking up the submissions of every team at an event with both lookup methods."""
+    scouting_data = _parse_scouting_data(generate_synthetic_event(TEAMS, MATCHES_PER_TEAM).scouting_data)
+    calculated_stats = CalculatedStats(scouting_data)
+    teams = retrieve_team_list(scouting_data)
+
+    masked_time = timeit(
+        lambda: [scouting_data_for_team(team, scouting_data) for team in teams],
+        number=REPEAT
+    ) / REPEAT
+    indexed_time = timeit(
+        lambda: [calculated_stats.data_for_team(team) for team in teams],
+        number=REPEAT
+    ) / REPEAT
+
+    print(f"{TEAMS} teams x {MATCHES_PER_TEAM} matches ({len(scouting_data)} rows)")
+    print(f"Boolean mask:   {masked_time * 1000:.2f} ms for all teams")
+    print(f"Per-team index: {indexed_time * 1000:.2f} ms for all teams")
+    print(f"Speedup:        {masked_time / indexed_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
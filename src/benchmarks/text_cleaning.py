@@ -0,0 +1,60 @@
+"""Benchmarks cleaning the text in scouting data with `clean_text_columns` against a per-value regex loop.
+
+Run with `python -m benchmarks.text_cleaning` from the `src` directory.
+"""
+
+import json
+from re import sub
+from timeit import timeit
+
+from pandas import DataFrame
+
+from utils import clean_text_columns, Queries
+
+from .synthetic_event import generate_synthetic_event
+
+TEAMS = 80
+MATCHES_PER_TEAM = 12
+REPEAT = 10
+NOTE = "Fast cycles\x07 on the amp side,\x1b slowed down\x00 by defense"
+
+
+def clean_per_value(submissions: list[dict]) -> list[dict]:
+    """Removes control characters from every string value in each submission with a regex (the old cleaning)."""
+    for submission in submissions:
+        for key, value in submission.items():
+            if isinstance(value, str):
+                submission[key] = sub(r'[\x00-\x1F\x7F-\x9F]', '', value)
+
+    return submissions
+
+
+def main() -> None:
+    """Times cleaning the scouting data with both methods, with and without control characters in the notes."""
+    for description, note in (("Clean notes", NOTE.replace("\x07", "").replace("\x1b", "").replace("\x00", "")),
+                              ("Notes with control characters", NOTE)):
+        scouting_data = DataFrame.from_dict(
+            json.loads(generate_synthetic_event(TEAMS, MATCHES_PER_TEAM).scouting_data)
+        ).assign(
+            **{field: note for field in (Queries.AUTO_NOTES, Queries.TELEOP_NOTES, Queries.RATING_NOTES)}
+        )
+        submissions = scouting_data.to_dict(orient="records")
+        string_values = sum(isinstance(value, str) for submission in submissions for value in submission.values())
+
+        per_value_time = timeit(
+            lambda: clean_per_value([dict(submission) for submission in submissions]),
+            number=REPEAT
+        ) / REPEAT
+        vectorized_time = timeit(
+            lambda: clean_text_columns(scouting_data),
+            number=REPEAT
+        ) / REPEAT
+
+        print(f"{description}: {TEAMS} teams x {MATCHES_PER_TEAM} matches ({string_values} strings)")
+        print(f"  Per-value regex:    {per_value_time * 1000:.2f} ms ({string_values / per_value_time / 1e6:.2f}M strings/s)")
+        print(f"  clean_text_columns: {vectorized_time * 1000:.2f} ms ({string_values / vectorized_time / 1e6:.2f}M strings/s)")
+        print(f"  Speedup:            {per_value_time / vectorized_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
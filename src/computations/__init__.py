@@ -0,0 +1,7 @@
+"""The computations behind each page, returning data and figures so they can run without a Streamlit session."""
+
+from .event import *
+from .match import *
+from .picklist import *
+from .ranking_simulator import *
+from .team import *
@@ -0,0 +1,302 @@
+"""Runs the computations behind FalconVis' pages for every team and match at once, without a Streamlit session.
+
+Loads the event data once, which warms the fetch cache and the snapshots the app starts from, then builds the
+metrics, figures and tables of the Teams, Match, Event, Picklist and Ranking Simulation pages for every team and
+match across a pool of processes. Figures are written as HTML (or Plotly JSON with `--format json`), tables as CSV
+and everything else as JSON, into a directory per team and per match.
+
+Run with `PYTHONPATH=src python -m computations.batch` from the root of the repository (where the app is run from,
+so the caches warmed are the ones the app reads), adding `--warm-only` to stop once the event data is loaded.
+"""
+
+import json
+import os
+from argparse import ArgumentParser
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from time import perf_counter
+from typing import Callable
+
+from plotly.graph_objects import Figure
+
+from utils import (
+    fetch_event_data,
+    GeneralConstants,
+    GraphType,
+    project_rankings,
+    retrieve_calculated_stats,
+    retrieve_match_predictions,
+    retrieve_team_list,
+    simulate_rankings
+)
+
+from .event import distribution_box_plot, event_breakdown, event_distributions
+from .match import (
+    alliance_autonomous_graphs,
+    alliance_dashboard,
+    alliance_qualitative_graphs,
+    alliance_teleop_graphs,
+    match_prediction_graphs,
+    predict_match,
+    prediction_lookup,
+    summarize_alliance
+)
+from .picklist import generate_picklist, PICKLIST_STATS
+from .ranking_simulator import simulate_rankings_from
+from .team import (
+    analyze_team_notes,
+    team_autonomous_graph,
+    team_metrics,
+    team_qualitative_graphs,
+    team_quantile_stats,
+    team_teleop_graphs
+)
+
+__all__ = ["run_batch"]
+
+SIMULATIONS = 10_000
+
+# The state shared by every task a worker process runs, set up once per process by `_initialize_worker`.
+_worker_state = {}
+
+
+def _initialize_worker(event_data, match_predictions, output_directory: str, options: dict) -> None:
+    """Sets up a worker process, calculating the statistics of the event once for every task it runs."""
+    _worker_state.update(
+        event_data=event_data,
+        calculated_stats=retrieve_calculated_stats(event_data),
+        lookup=prediction_lookup(match_predictions),
+        output_directory=output_directory,
+        **options
+    )
+
+
+def _write_json(path: str, data) -> None:
+    """Writes data as JSON, converting NumPy scalars into the Python types they hold."""
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2, default=lambda value: value.item())
+
+
+def _write_figures(directory: str, build_figures: Callable[[], dict[str, Figure]]) -> int:
+    """Builds figures and writes them in the format requested, returning the number of files written.
+
+    Nothing is built with `--skip-figures`, since building the figures takes most of the time of each report.
+    """
+    if _worker_state["skip_figures"]:
+        return 0
+
+    figures = build_figures()
+
+    for name, figure in figures.items():
+        if _worker_state["format"] == "json":
+            figure.write_json(os.path.join(directory, f"{name}.json"))
+        else:
+            figure.write_html(os.path.join(directory, f"{name}.html"), include_plotlyjs="cdn")
+
+    return len(figures)
+
+
+def _team_report(team_number: int, event_medians: dict[str, float]) -> int:
+    """Writes the metrics, notes and figures of a team, returning the number of files written."""
+    calculated_stats = _worker_state["calculated_stats"]
+    type_of_graph = _worker_state["type_of_graph"]
+    directory = os.path.join(_worker_state["output_directory"], "teams", str(team_number))
+    os.makedirs(directory, exist_ok=True)
+
+    _write_json(
+        os.path.join(directory, "metrics.json"),
+        {"metrics": team_metrics(calculated_stats, team_number), "event_medians": event_medians}
+    )
+    _write_json(
+        os.path.join(directory, "notes.json"),
+        [notes._asdict() for notes in analyze_team_notes(calculated_stats, team_number)]
+    )
+
+    def build_figures() -> dict[str, Figure]:
+        cycles_over_time, climb_speeds = team_teleop_graphs(calculated_stats, team_number, type_of_graph)
+        driver_rating, defense_skill, counter_defense_skill = team_qualitative_graphs(calculated_stats, team_number)
+        return {
+            "autonomous": team_autonomous_graph(calculated_stats, team_number, type_of_graph),
+            "teleop_cycles": cycles_over_time,
+            "climb_speeds": climb_speeds,
+            "driver_rating": driver_rating,
+            "defense_skill": defense_skill,
+            "counter_defense_skill": counter_defense_skill
+        }
+
+    return 2 + _write_figures(directory, build_figures)
+
+
+def _match_report(match_key: str, red_alliance: list[int], blue_alliance: list[int]) -> int:
+    """Writes the prediction, alliance dashboards and figures of a match, returning the number of files written."""
+    calculated_stats = _worker_state["calculated_stats"]
+    lookup = _worker_state["lookup"]
+    type_of_graph = _worker_state["type_of_graph"]
+    directory = os.path.join(_worker_state["output_directory"], "matches", match_key)
+    os.makedirs(directory, exist_ok=True)
+
+    _write_json(
+        os.path.join(directory, "prediction.json"),
+        {
+            "prediction": predict_match(calculated_stats, red_alliance, blue_alliance, lookup)._asdict(),
+            **{
+                alliance_color: {
+                    "teams": alliance,
+                    **summarize_alliance(calculated_stats, alliance)._asdict(),
+                    **alliance_dashboard(calculated_stats, alliance, lookup)._asdict()
+                }
+                for alliance_color, alliance in (("red", red_alliance), ("blue", blue_alliance))
+            }
+        }
+    )
+
+    def build_figures() -> dict[str, Figure]:
+        structure_breakdown, *alliance_distributions = match_prediction_graphs(
+            calculated_stats, red_alliance, blue_alliance, type_of_graph
+        )
+        figures = {
+            "structure_breakdown": structure_breakdown,
+            **dict(zip(("auto_distribution", "teleop_distribution", "total_distribution"), alliance_distributions))
+        }
+
+        for alliance_color, alliance, color_gradient in (
+            ("red", red_alliance, GeneralConstants.RED_ALLIANCE_GRADIENT),
+            ("blue", blue_alliance, GeneralConstants.BLUE_ALLIANCE_GRADIENT)
+        ):
+            alliance_figures = (
+                *alliance_autonomous_graphs(calculated_stats, alliance, type_of_graph, color_gradient),
+                *alliance_teleop_graphs(calculated_stats, alliance, type_of_graph, color_gradient),
+                *alliance_qualitative_graphs(calculated_stats, alliance, color_gradient)
+            )
+            figures |= {
+                f"{alliance_color}_{name}": figure
+                for name, figure in zip(
+                    (
+                        "best_autos", "auto_breakdown", "centerline_autos",
+                        "speaker_cycles", "amplification_periods", "passing_cycles", "climbs", "climb_speeds",
+                        "driver_ratings", "defense_ratings", "disables"
+                    ),
+                    alliance_figures
+                )
+            }
+
+        return figures
+
+    return 1 + _write_figures(directory, build_figures)
+
+
+def _event_report() -> int:
+    """Writes the event breakdown, the distributions across the event and the picklist."""
+    event_data = _worker_state["event_data"]
+    calculated_stats = _worker_state["calculated_stats"]
+    teams = retrieve_team_list(event_data.scouting_data)
+    directory = os.path.join(_worker_state["output_directory"], "event")
+    os.makedirs(directory, exist_ok=True)
+
+    _write_json(os.path.join(directory, "breakdown.json"), event_breakdown(calculated_stats))
+    generate_picklist(calculated_stats, teams, list(PICKLIST_STATS)).to_csv(
+        os.path.join(directory, "picklist.csv"), index=False
+    )
+
+    return 2 + _write_figures(
+        directory,
+        lambda: {
+            f"{distribution.name}_distribution": distribution_box_plot(distribution)
+            for distribution in event_distributions(calculated_stats, teams, _worker_state["type_of_graph"])
+        }
+    )
+
+
+def run_batch(
+    output_directory: str = GeneralConstants.REPORTS_DIRECTORY,
+    type_of_graph: GraphType = GraphType.CYCLE_CONTRIBUTIONS,
+    file_format: str = "html",
+    skip_figures: bool = False,
+    processes: int | None = None,
+    simulations: int = SIMULATIONS,
+    warm_only: bool = False
+) -> int:
+    """Loads the event data and writes the reports of every team and match, along with the event-wide reports.
+
+    :param output_directory: Where to write the reports.
+    :param type_of_graph: The type of graphs to create (cycle contributions / point contributions).
+    :param file_format: The format figures are written in ("html" or "json").
+    :param skip_figures: Whether to only write the data behind the figures, without building them.
+    :param processes: The number of processes the teams and matches are split across (one per CPU if not given).
+    :param simulations: The number of times the remaining matches are simulated for the rank distribution.
+    :param warm_only: Whether to stop once the event data is loaded, which warms the fetch cache and snapshots.
+    :return: The number of files written.
+    """
+    start = perf_counter()
+    event_data = fetch_event_data()
+    print(f"Loaded version {event_data.version} of the event data in {perf_counter() - start:.2f} s.")
+
+    if warm_only:
+        return 0
+
+    # Computed once here rather than in every worker, since they're shared by every team and match.
+    match_predictions = retrieve_match_predictions(event_data)
+    event_medians = team_quantile_stats(retrieve_calculated_stats(event_data)).thresholds.loc[0.5].to_dict()
+    options = {"type_of_graph": type_of_graph, "format": file_format, "skip_figures": skip_figures}
+
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_initialize_worker,
+        initargs=(event_data, match_predictions, output_directory, options)
+    ) as executor:
+        futures = [executor.submit(_event_report)]
+        futures += [
+            executor.submit(_team_report, team, event_medians)
+            for team in retrieve_team_list(event_data.scouting_data)
+        ]
+        futures += [
+            executor.submit(_match_report, match.match_key, list(match.red_alliance), list(match.blue_alliance))
+            for match in event_data.match_schedule.itertuples()
+        ]
+        files_written = sum(future.result() for future in as_completed(futures))
+
+    # The rank distribution splits its simulations across processes itself, so it runs once the pool is done.
+    if not event_data.match_data.empty:
+        last_match_played = event_data.match_data["match_number"].max()
+        simulation = simulate_rankings_from(event_data, last_match_played, match_predictions)
+        directory = os.path.join(output_directory, "event")
+        simulation.expected_rankings.to_csv(os.path.join(directory, "expected_rankings.csv"), index=False)
+        project_rankings(*simulation[:3]).to_csv(os.path.join(directory, "ranking_projection.csv"), index=False)
+        simulate_rankings(*simulation[:3], simulations=simulations, processes=processes).to_csv(
+            os.path.join(directory, "rank_distribution.csv"), index=False
+        )
+        files_written += 3
+
+    print(
+        f"Wrote {files_written:,} files for {len(futures) - 1:,} teams and matches to {output_directory} "
+        f"in {perf_counter() - start:.2f} s."
+    )
+    return files_written
+
+
+def main() -> None:
+    """Parses the arguments passed in and writes the reports."""
+    parser = ArgumentParser(description="Runs the computations behind FalconVis' pages for every team and match.")
+    parser.add_argument("--output", default=GeneralConstants.REPORTS_DIRECTORY, help="Where to write the reports.")
+    parser.add_argument(
+        "--type", choices=["cycles", "points"], default="cycles", help="Whether graphs show cycles or points."
+    )
+    parser.add_argument("--format", choices=["html", "json"], default="html", help="The format figures are written in.")
+    parser.add_argument("--skip-figures", action="store_true", help="Only writes the data behind the figures.")
+    parser.add_argument("--processes", type=int, help="The number of processes to use (one per CPU by default).")
+    parser.add_argument("--simulations", type=int, default=SIMULATIONS)
+    parser.add_argument("--warm-only", action="store_true", help="Only loads the event data to warm the caches.")
+    arguments = parser.parse_args()
+
+    run_batch(
+        arguments.output,
+        GraphType.CYCLE_CONTRIBUTIONS if arguments.type == "cycles" else GraphType.POINT_CONTRIBUTIONS,
+        arguments.format,
+        arguments.skip_figures,
+        arguments.processes,
+        arguments.simulations,
+        arguments.warm_only
+    )
+
+
+if __name__ == "__main__":
+    main()
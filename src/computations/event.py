@@ -0,0 +1,137 @@
+"""Defines the computations behind the `Event` page, returning data and figures rather than rendering them."""
+
+from typing import NamedTuple
+
+from numpy import mean
+from pandas import Series
+from plotly.graph_objects import Figure
+
+from utils import box_plot, CalculatedStats, GraphType, profiled, Queries, shared_result
+
+__all__ = [
+    "distribution_box_plot",
+    "event_breakdown",
+    "event_distributions",
+    "EventDistribution",
+    "sort_distributions"
+]
+
+# The number of top teams whose cycles are averaged in the event breakdown (likely alliance captains and picks).
+TOP_TEAM_CUTOFFS = (8, 16, 24)
+
+
+class EventDistribution(NamedTuple):
+    """The distribution of a stat across the matches of every team at an event, from the best team to the worst."""
+
+    name: str  # Identifies the distribution on the `Event` page (e.g. "auto" or "speaker")
+    title: str
+    y_axis_label: str
+    teams: list[int]
+    distributions: list[Series]
+
+
+@profiled("computations")
+@shared_result
+def event_breakdown(calculated_stats: CalculatedStats) -> dict[int, float]:
+    """Calculates the average teleop cycles of the top teams at the event.
+
+    :param calculated_stats: The statistics of the event.
+    :return: The average teleop cycles of the top teams, keyed by each cutoff in `TOP_TEAM_CUTOFFS`.
+    """
+    average_cycles_per_team = (
+        calculated_stats.event_table(["average_teleop_cycles"])["average_teleop_cycles"]
+        .sort_values(ascending=False)
+        .tolist()
+    )
+    return {cutoff: mean(average_cycles_per_team[:cutoff]) for cutoff in TOP_TEAM_CUTOFFS}
+
+
+def sort_distributions(teams: list[int], distributions: list[Series]) -> tuple[list[int], list[Series]]:
+    """Sorts the distributions of each team by their median (then their mean), from the highest to the lowest.
+
+    :param teams: The teams the distributions belong to.
+    :param distributions: The distribution of each team (in order of `teams`).
+    :return: The teams and their distributions, sorted.
+    """
+    sorted_distributions = sorted(
+        zip(teams, distributions),
+        key=lambda pair: (pair[1].median(), pair[1].mean()),
+        reverse=True
+    )
+    return [team for team, _ in sorted_distributions], [distribution for _, distribution in sorted_distributions]
+
+
+@profiled("computations")
+@shared_result
+def event_distributions(
+    calculated_stats: CalculatedStats,
+    teams: list[int],
+    type_of_graph: GraphType
+) -> list[EventDistribution]:
+    """Calculates the distributions shown on the `Event` page, each sorted from the best team to the worst.
+
+    :param calculated_stats: The statistics of the event.
+    :param teams: The teams at the event.
+    :param type_of_graph: The type of graphs to display (cycle contributions / point contributions), which only
+        changes the autonomous and teleop distributions.
+    :return: The autonomous, teleop, Speaker and Amp distributions.
+    """
+    display_cycle_contributions = type_of_graph == GraphType.CYCLE_CONTRIBUTIONS
+    y_axis_label = "Cycle Distribution" if display_cycle_contributions else "Point Distribution"
+    distributions = []
+
+    for name, mode in (("auto", Queries.AUTO), ("teleop", Queries.TELEOP)):
+        distributions.append(
+            EventDistribution(
+                name,
+                f"{'Cycle' if display_cycle_contributions else 'Point'} Contributions in {mode}",
+                y_axis_label,
+                *sort_distributions(
+                    teams,
+                    [
+                        (
+                            calculated_stats.cycles_by_match(team, mode)
+                            if display_cycle_contributions
+                            else calculated_stats.points_contributed_by_match(team, mode)
+                        )
+                        for team in teams
+                    ]
+                )
+            )
+        )
+
+    for name, title, structures in (
+        ("speaker", "Speaker Cycle Distributions by Team", (Queries.AUTO_SPEAKER, Queries.TELEOP_SPEAKER)),
+        ("amp", "Amp Cycle Distributions By Team", (Queries.AUTO_AMP, Queries.TELEOP_AMP))
+    ):
+        distributions.append(
+            EventDistribution(
+                name,
+                title,
+                "Cycle Distribution",
+                *sort_distributions(
+                    teams, [calculated_stats.cycles_by_structure_per_match(team, structures) for team in teams]
+                )
+            )
+        )
+
+    return distributions
+
+
+def distribution_box_plot(distribution: EventDistribution, start: int = 0, stop: int | None = None) -> Figure:
+    """Creates the box plot of a distribution across the event, optionally for a range of its teams.
+
+    :param distribution: The distribution to plot.
+    :param start: The index of the first team plotted.
+    :param stop: The index after the last team plotted, defaulting to every team after `start`.
+    :return: The figure.
+    """
+    return box_plot(
+        distribution.teams[start:stop],
+        distribution.distributions[start:stop],
+        x_axis_label="Teams",
+        y_axis_label=distribution.y_axis_label,
+        title=distribution.title
+    ).update_layout(
+        showlegend=False
+    )
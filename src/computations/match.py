@@ -0,0 +1,537 @@
+"""Defines the computations behind the `Match` pages, returning data and figures rather than rendering them."""
+
+from typing import NamedTuple
+
+import numpy as np
+from pandas import DataFrame
+from plotly.graph_objects import Figure
+
+from utils import (
+    bar_graph,
+    box_plot,
+    CalculatedStats,
+    Criteria,
+    GeneralConstants,
+    GraphType,
+    multi_line_graph,
+    populate_missing_data,
+    profiled,
+    Queries,
+    shared_result,
+    stacked_bar_graph
+)
+
+__all__ = [
+    "alliance_autonomous_graphs",
+    "alliance_dashboard",
+    "alliance_qualitative_graphs",
+    "alliance_teleop_graphs",
+    "AllianceDashboard",
+    "AllianceSummary",
+    "match_prediction_graphs",
+    "MatchPrediction",
+    "predict_match",
+    "PredictionLookup",
+    "prediction_lookup",
+    "summarize_alliance"
+]
+
+
+class MatchPrediction(NamedTuple):
+    """The predicted outcome of a match."""
+
+    red_win_chance: float
+    blue_win_chance: float
+    red_score: float
+    blue_score: float
+
+
+class PredictionLookup(NamedTuple):
+    """The precomputed predictions of the match schedule (see `retrieve_match_predictions`), keyed by alliance."""
+
+    predictions_by_alliances: dict[tuple[tuple, tuple], MatchPrediction]  # Keyed by the (Red, Blue) alliances
+    coop_chance_by_alliance: dict[tuple, float]
+
+
+class AllianceSummary(NamedTuple):
+    """The breakdown of an alliance shown next to its predicted score."""
+
+    average_points_contributed: list[float]  # In order of the teams on the alliance
+    best_to_defend: int
+
+
+class AllianceDashboard(NamedTuple):
+    """The metrics shown for an alliance on the `Match` page."""
+
+    cyclers: list[int]  # From the fastest cycler to the slowest
+    chance_of_coop: float
+
+
+def prediction_lookup(match_predictions: DataFrame) -> PredictionLookup:
+    """Keys the predictions of the match schedule by the alliances in each match.
+
+    :param match_predictions: The predictions of the match schedule (see `retrieve_match_predictions`).
+    :return: The predictions and chances of reaching the co-op bonus, keyed by alliance.
+    """
+    predictions_by_alliances = {}
+    coop_chance_by_alliance = {}
+
+    for prediction in match_predictions.itertuples():
+        predictions_by_alliances[(prediction.red_alliance, prediction.blue_alliance)] = MatchPrediction(
+            prediction.red_win_chance, prediction.blue_win_chance, prediction.red_score, prediction.blue_score
+        )
+        coop_chance_by_alliance[prediction.red_alliance] = prediction.red_coop_chance
+        coop_chance_by_alliance[prediction.blue_alliance] = prediction.blue_coop_chance
+
+    return PredictionLookup(predictions_by_alliances, coop_chance_by_alliance)
+
+
+@profiled("computations")
+def predict_match(
+    calculated_stats: CalculatedStats,
+    red_alliance: list[int],
+    blue_alliance: list[int],
+    lookup: PredictionLookup | None = None
+) -> MatchPrediction:
+    """Predicts the outcome of a match.
+
+    Matches in the schedule are already predicted, so they're looked up; hypothetical matches are predicted on
+    the spot.
+
+    :param calculated_stats: The statistics of the event.
+    :param red_alliance: The three teams on the Red Alliance.
+    :param blue_alliance: The three teams on the Blue Alliance.
+    :param lookup: The predictions of the match schedule, if any.
+    :return: Each alliance's chance of winning and predicted score.
+    """
+    if lookup is not None and (
+        prediction := lookup.predictions_by_alliances.get((tuple(red_alliance), tuple(blue_alliance)))
+    ) is not None:
+        return prediction
+
+    return MatchPrediction(*calculated_stats.chance_of_winning(red_alliance, blue_alliance))
+
+
+@profiled("computations")
+@shared_result
+def summarize_alliance(calculated_stats: CalculatedStats, alliance: list[int]) -> AllianceSummary:
+    """Summarizes what each team on an alliance contributes and which team is the best to defend.
+
+    :param calculated_stats: The statistics of the event.
+    :param alliance: The three teams on the alliance.
+    :return: The average points contributed by each team and the team that's best to defend.
+    """
+    average_points_contributed = [
+        round(np.mean(calculated_stats.points_contributed_by_match(team)), 1)
+        for team in alliance
+    ]
+    best_to_defend = sorted(
+        [
+            (
+                team,
+                calculated_stats.average_driver_rating(team),
+                calculated_stats.average_counter_defense_skill(team)
+            )
+            for team in alliance
+        ],
+        key=lambda info: info[1] / info[2],
+    )[-1][0]
+
+    return AllianceSummary(average_points_contributed, best_to_defend)
+
+
+@profiled("computations")
+@shared_result
+def match_prediction_graphs(
+    calculated_stats: CalculatedStats,
+    red_alliance: list[int],
+    blue_alliance: list[int],
+    type_of_graph: GraphType
+) -> tuple[Figure, Figure, Figure, Figure]:
+    """Creates the graphs comparing the two alliances in a match.
+
+    :param calculated_stats: The statistics of the event.
+    :param red_alliance: The three teams on the Red Alliance.
+    :param blue_alliance: The three teams on the Blue Alliance.
+    :param type_of_graph: The type of graphs to create (cycle contributions / point contributions).
+    :return: The structure breakdown of the six teams, and the distributions of each alliance's contributions
+        during autonomous, teleop and both combined.
+    """
+    combined_teams = red_alliance + blue_alliance
+    display_cycle_contributions = type_of_graph == GraphType.CYCLE_CONTRIBUTIONS
+    color_sequence = ["#781212", "#163ba1"]  # Bright red  # Bright blue
+
+    # Breaks down where the different teams scored among the six teams
+    structure_breakdown = [
+        [
+            calculated_stats.cycles_by_structure_per_match(team, structures).sum()
+            for team in combined_teams
+        ]
+        if structures != Queries.TELEOP_PASSING
+        else [
+            calculated_stats.stat_per_match(team, structures).sum()
+            for team in combined_teams
+        ]
+        for structures in (
+            (Queries.AUTO_AMP, Queries.TELEOP_AMP),
+            (Queries.AUTO_SPEAKER, Queries.TELEOP_SPEAKER),
+            Queries.TELEOP_PASSING
+        )
+    ]
+    structure_breakdown_graph = stacked_bar_graph(
+        combined_teams,
+        structure_breakdown,
+        "Teams",
+        ["# of Amp Cycles", "# of Speaker Cycles", "# of Feeding Cycles"],
+        "Total Cycles Scored into Structures",
+        title="Structure Breakdown",
+        color_map={
+            "# of Amp Cycles": GeneralConstants.GOLD_GRADIENT[0],
+            "# of Speaker Cycles": GeneralConstants.GOLD_GRADIENT[1],
+            "# of Feeding Cycles": GeneralConstants.GOLD_GRADIENT[2]
+        },
+    ).update_layout(xaxis={"categoryorder": "total descending"})
+
+    # Breaks down cycles/point contributions among both alliances in Autonomous and Teleop.
+    cycles_by_mode = {}
+
+    for mode in (Queries.AUTO, Queries.TELEOP):
+        cycles_by_mode[mode] = [
+            [
+                (
+                    calculated_stats.cycles_by_match(team, mode)
+                    if display_cycle_contributions
+                    else calculated_stats.points_contributed_by_match(team, mode)
+                )
+                for team in alliance
+            ]
+            for alliance in (red_alliance, blue_alliance)
+        ]
+
+    # Combines them into cumulative cycles/point contributions (auto and teleop)
+    cumulative_cycles_by_alliance = [
+        [
+            auto_cycles + teleop_cycles
+            for auto_cycles, teleop_cycles in zip(auto_cycles_in_alliance, teleop_cycles_in_alliance)
+        ]
+        for auto_cycles_in_alliance, teleop_cycles_in_alliance in zip(
+            cycles_by_mode[Queries.AUTO], cycles_by_mode[Queries.TELEOP]
+        )
+    ]
+    alliance_distribution_graphs = []
+
+    for period, cycles_by_alliance in (
+        ("Autonomous", cycles_by_mode[Queries.AUTO]),
+        ("Teleop", cycles_by_mode[Queries.TELEOP]),
+        ("Auto + Teleop", cumulative_cycles_by_alliance)
+    ):
+        alliance_distributions = [
+            np.repeat(*calculated_stats.sum_distribution(*cycles_in_alliance))
+            for cycles_in_alliance in cycles_by_alliance
+        ]
+        alliance_distribution_graphs.append(
+            box_plot(
+                ["Red Alliance", "Blue Alliance"],
+                alliance_distributions,
+                y_axis_label=(
+                    "Notes Scored"
+                    if display_cycle_contributions
+                    else "Points Contributed"
+                ),
+                title=(
+                    f"Notes During {period} (N={len(alliance_distributions[0])})"
+                    if display_cycle_contributions
+                    else f"Points Contributed During {period} (N={len(alliance_distributions[0])})"
+                ),
+                color_sequence=color_sequence,
+            )
+        )
+
+    return structure_breakdown_graph, *alliance_distribution_graphs
+
+
+@profiled("computations")
+def alliance_dashboard(
+    calculated_stats: CalculatedStats,
+    team_numbers: list[int],
+    lookup: PredictionLookup | None = None
+) -> AllianceDashboard:
+    """Ranks the teams on an alliance by how fast they cycle and finds its chance of reaching the co-op bonus.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_numbers: The three teams on the alliance.
+    :param lookup: The predictions of the match schedule, which the chance of alliances in it is looked up from.
+    :return: The teams from the fastest cycler to the slowest and the chance of reaching the co-op bonus.
+    """
+    fastest_cyclers = sorted(
+        {
+            team: calculated_stats.driving_index(team) for team in team_numbers
+        }.items(),
+        key=lambda pair: pair[1],
+        reverse=True
+    )
+    chance_of_coop = lookup.coop_chance_by_alliance.get(tuple(team_numbers)) if lookup is not None else None
+
+    if chance_of_coop is None:
+        chance_of_coop = calculated_stats.chance_of_coop_bonus(team_numbers)
+
+    return AllianceDashboard([team for team, _ in fastest_cyclers], chance_of_coop)
+
+
+@profiled("computations")
+@shared_result
+def alliance_autonomous_graphs(
+    calculated_stats: CalculatedStats,
+    team_numbers: list[int],
+    type_of_graph: GraphType,
+    color_gradient: list[str]
+) -> tuple[Figure, Figure, Figure]:
+    """Creates the autonomous graphs of an alliance.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_numbers: The teams to create the graphs for.
+    :param type_of_graph: The type of graphs to create (cycle contributions / point contributions).
+    :param color_gradient: The color gradient to use for graphs, depending on the alliance.
+    :return: The best auto of each team, the breakdown of their auto cycles and their centerline autos.
+    """
+    display_cycle_contributions = type_of_graph == GraphType.CYCLE_CONTRIBUTIONS
+
+    # Best auto configuration graph
+    best_autos_by_team = sorted(
+        [
+            (
+                team_number,
+                (
+                    calculated_stats.cycles_by_match(team_number, Queries.AUTO)
+                    if display_cycle_contributions
+                    else calculated_stats.points_contributed_by_match(team_number, Queries.AUTO)
+                ).max()
+            )
+            for team_number in team_numbers
+        ],
+        key=lambda pair: pair[1],
+        reverse=True
+    )
+    best_autos_graph = bar_graph(
+        [pair[0] for pair in best_autos_by_team],
+        [pair[1] for pair in best_autos_by_team],
+        x_axis_label="Teams",
+        y_axis_label=(
+            "# of Cycles in Auto"
+            if display_cycle_contributions
+            else "# of Points in Auto"
+        ),
+        title="Best Auto Configuration",
+        color=color_gradient
+    )
+
+    # Auto cycle breakdown graph
+    average_speaker_cycles_by_team = [
+        calculated_stats.average_cycles_for_structure(team, Queries.AUTO_SPEAKER)
+        * (1 if display_cycle_contributions else 5)
+        for team in team_numbers
+    ]
+    average_amp_cycles_by_team = [
+        calculated_stats.average_cycles_for_structure(team, Queries.AUTO_AMP)
+        * (1 if display_cycle_contributions else 2)
+        for team in team_numbers
+    ]
+    auto_cycles_breakdown_graph = stacked_bar_graph(
+        team_numbers,
+        [average_speaker_cycles_by_team, average_amp_cycles_by_team],
+        "Teams",
+        [
+            ("Avg. Speaker Cycles" if display_cycle_contributions else "Avg. Speaker Points"),
+            ("Avg. Amp Cycles" if display_cycle_contributions else "Avg. Amp Points")
+        ],
+        ("Total Auto Cycles" if display_cycle_contributions else "Total Auto Points"),
+        title="Auto Scoring Breakdown",
+        color_map={
+            ("Avg. Speaker Cycles" if display_cycle_contributions else "Avg. Speaker Points"): color_gradient[1],
+            ("Avg. Amp Cycles" if display_cycle_contributions else "Avg. Amp Points"): color_gradient[2]
+        }
+    ).update_layout(xaxis={"categoryorder": "total descending"})
+
+    # Number of times they intook from the centerline by team
+    autos_in_centerline_by_team = [
+        calculated_stats.cumulative_stat(team, Queries.AUTO_USED_CENTERLINE, Criteria.BOOLEAN_CRITERIA)
+        for team in team_numbers
+    ]
+    centerline_autos_graph = bar_graph(
+        team_numbers,
+        autos_in_centerline_by_team,
+        x_axis_label="Teams",
+        y_axis_label="# of Centerline Autos Achieved",
+        title="Centerline Autos Achieved By Team",
+        color=color_gradient[-1]
+    ).update_layout(xaxis={"categoryorder": "total descending"})
+
+    return best_autos_graph, auto_cycles_breakdown_graph, centerline_autos_graph
+
+
+def _color_by_mean(team_numbers: list[int], values_by_team: list, gradient: list[str]) -> dict[int, str]:
+    """Colors each team by the mean of its values, from the first color in the gradient (lowest) to the last."""
+    best_teams = sorted(zip(team_numbers, values_by_team), key=lambda pair: pair[1].mean())
+    return {team: color for (team, _), color in zip(best_teams, gradient)}
+
+
+@profiled("computations")
+@shared_result
+def alliance_teleop_graphs(
+    calculated_stats: CalculatedStats,
+    team_numbers: list[int],
+    type_of_graph: GraphType,
+    color_gradient: list[str]
+) -> tuple[Figure, Figure, Figure, Figure, Figure]:
+    """Creates the teleop graphs of an alliance.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_numbers: The teams to create the graphs for.
+    :param type_of_graph: The type of graphs to create (cycle contributions / point contributions).
+    :param color_gradient: The color gradient to use for graphs, depending on the alliance.
+    :return: The Speaker cycles, potential amplification periods and passing cycles of each team over time, and the
+        breakdown of their climbs and climb speeds.
+    """
+    teams_data = [calculated_stats.data_for_team(team) for team in team_numbers]
+    display_cycle_contributions = type_of_graph == GraphType.CYCLE_CONTRIBUTIONS
+    short_gradient = [
+        GeneralConstants.LIGHT_RED,
+        GeneralConstants.RED_TO_GREEN_GRADIENT[2],
+        GeneralConstants.LIGHT_GREEN
+    ]
+
+    # The teleop speaker cycles of each team over time
+    cycles_by_team = [
+        calculated_stats.cycles_by_structure_per_match(team, Queries.TELEOP_SPEAKER)
+        * (1 if display_cycle_contributions else 2)
+        for team in team_numbers
+    ]
+    speaker_cycles_graph = multi_line_graph(
+        *populate_missing_data(cycles_by_team),
+        x_axis_label="Match Index",
+        y_axis_label=team_numbers,
+        y_axis_title=(
+            "# of Cycles"
+            if display_cycle_contributions
+            else "Points Contributed"
+        ),
+        title=(
+            "Teleop Speaker Cycles Over Time"
+            if display_cycle_contributions
+            else "Points Contributed in the Speaker Over Time"
+        ),
+        color_map=_color_by_mean(team_numbers, cycles_by_team, short_gradient)
+    )
+
+    # The potential amplification periods of each team over time
+    amp_periods_by_team = [
+        calculated_stats.potential_amplification_periods_by_match(team)
+        for team in team_numbers
+    ]
+    amp_periods_graph = multi_line_graph(
+        *populate_missing_data(amp_periods_by_team),
+        x_axis_label="Match Index",
+        y_axis_label=team_numbers,
+        y_axis_title="# of Potential Amplification Periods",
+        title="Potential Amplification Periods Produced by Alliance",
+        color_map=_color_by_mean(team_numbers, amp_periods_by_team, short_gradient)
+    )
+
+    # The passing cycles of each team over time
+    passing_shots_by_team = [
+        calculated_stats.passing_shots_by_match(team)
+        for team in team_numbers
+    ]
+    passing_shots_graph = multi_line_graph(
+        *populate_missing_data(passing_shots_by_team),
+        x_axis_label="Match Index",
+        y_axis_label=team_numbers,
+        y_axis_title="# of Cycles",
+        title="Passing Cycles by Alliance",
+        color_map=_color_by_mean(team_numbers, passing_shots_by_team, short_gradient)
+    )
+
+    # The climbs of each team, split into normal and harmonized climbs
+    harmonized_climbs_by_team = [
+        team_data[Queries.HARMONIZED_ON_CHAIN].sum()
+        for team_data in teams_data
+    ]
+    normal_climbs_by_team = [
+        team_data[Queries.CLIMBED_CHAIN].sum() - harmonized_climbs
+        for team_data, harmonized_climbs in zip(teams_data, harmonized_climbs_by_team)
+    ]
+    climbs_graph = stacked_bar_graph(
+        team_numbers,
+        [normal_climbs_by_team, harmonized_climbs_by_team],
+        x_axis_label="Teams",
+        y_axis_label=["Normal Climbs", "Harmonized Climbs"],
+        y_axis_title="# of Climb Types",
+        title="Climbs by Team",
+        color_map={"Normal Climbs": color_gradient[0], "Harmonized Climbs": color_gradient[1]}
+    )
+
+    # The climb speeds of each team
+    slow_climbs = [
+        (team_data[Queries.CLIMB_SPEED] == "Slow").sum()
+        for team_data in teams_data
+    ]
+    fast_climbs = [
+        (team_data[Queries.CLIMB_SPEED] == "Fast").sum()
+        for team_data in teams_data
+    ]
+    climb_speeds_graph = stacked_bar_graph(
+        team_numbers,
+        [slow_climbs, fast_climbs],
+        x_axis_label="Teams",
+        y_axis_label=["Slow Climbs", "Fast Climbs"],
+        y_axis_title="# of Climb Speeds",
+        title="Climb Speeds by Team",
+        color_map={"Slow Climbs": GeneralConstants.LIGHT_RED, "Fast Climbs": GeneralConstants.LIGHT_GREEN}
+    )
+
+    return speaker_cycles_graph, amp_periods_graph, passing_shots_graph, climbs_graph, climb_speeds_graph
+
+
+@profiled("computations")
+@shared_result
+def alliance_qualitative_graphs(
+    calculated_stats: CalculatedStats,
+    team_numbers: list[int],
+    color_gradient: list[str]
+) -> tuple[Figure, Figure, Figure]:
+    """Creates the qualitative graphs of an alliance.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_numbers: The teams to create the graphs for.
+    :param color_gradient: The color gradient to use for graphs, depending on the alliance.
+    :return: The average driver rating, average defense rating and disables of each team.
+    """
+    driver_rating_graph = bar_graph(
+        team_numbers,
+        [calculated_stats.average_driver_rating(team) for team in team_numbers],
+        x_axis_label="Teams",
+        y_axis_label="Driver Rating (1-5)",
+        title="Average Driver Rating by Team",
+        color=color_gradient[0]
+    )
+    defense_rating_graph = bar_graph(
+        team_numbers,
+        [calculated_stats.average_defense_skill(team) for team in team_numbers],
+        x_axis_label="Teams",
+        y_axis_label="Defense Rating (1-5)",
+        title="Average Defense Rating by Team",
+        color=color_gradient[1]
+    )
+    disables_graph = bar_graph(
+        team_numbers,
+        [
+            calculated_stats.cumulative_stat(team, Queries.DISABLE, Criteria.BOOLEAN_CRITERIA)
+            for team in team_numbers
+        ],
+        x_axis_label="Teams",
+        y_axis_label="Disables",
+        title="Disables by Team",
+        color=color_gradient[2]
+    )
+
+    return driver_rating_graph, defense_rating_graph, disables_graph
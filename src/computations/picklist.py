@@ -0,0 +1,64 @@
+"""Defines the computations behind the `Picklist` page, returning the picklist rather than rendering it."""
+
+from pandas import DataFrame
+
+from utils import CalculatedStats, profiled, shared_result
+
+__all__ = ["generate_picklist", "PICKLIST_STATS"]
+
+# Maps the stats that can be requested in the picklist to their columns in the event table (or how they're
+# calculated from it).
+PICKLIST_STATS = {
+    "Average Points Contributed": "average_points_contributed",
+    "Average Auto Cycles": "average_auto_cycles",
+    "Average Teleop Cycles": "average_teleop_cycles",
+    "Average Speaker Cycles": "average_cycles_for_AutoSpeaker+TeleopSpeaker",
+    "Average Amp Cycles": "average_cycles_for_AutoAmp+TeleopAmp",
+    "Average Feeding Cycles": "average_feeding_cycles_without_full_field",
+    "Avg. Adjusted Teleop Cycles (w/ Feeding)": (
+        lambda event_table: (
+            event_table["average_teleop_cycles"]
+            + event_table["average_feeding_cycles_without_full_field"] / 2
+        )
+    ),
+    "Average Trap Cycles": "average_cycles_for_TeleopTrap",
+    "# of Times Climbed": "times_climbed",
+    "# of Times Harmonized": "times_harmonized",
+    "# of Disables": "times_disabled",
+    "Average Driver Rating": "average_driver_rating",
+    "Average Defense Skill": "average_defense_skill",
+    "Average Defense Time": "average_defense_time",
+    "Average Counter Defense Skill": "average_counter_defense_skill"
+}
+
+
+@profiled("computations")
+@shared_result
+def generate_picklist(
+    calculated_stats: CalculatedStats,
+    teams: list[int],
+    stats_requested: list[str],
+    decimals: int = 2
+) -> DataFrame:
+    """Generates the picklist containing the statistics requested and the team number.
+
+    :param calculated_stats: The statistics of the event.
+    :param teams: The teams to include in the picklist.
+    :param stats_requested: The name of the statistics requested (matches the keys in `PICKLIST_STATS`).
+    :param decimals: The number of decimal places each statistic is rounded to.
+    :return: The picklist, with a row per team.
+    """
+    event_table = calculated_stats.event_table()
+    requested_picklist = DataFrame(
+        {
+            # We make it a string because otherwise Notion won't recognize the value.
+            "Team Number": [f"FRC {team}" for team in teams]
+        }
+    )
+
+    for stat_name in stats_requested:
+        stat = PICKLIST_STATS[stat_name]
+        stat_by_team = stat(event_table) if callable(stat) else event_table[stat]
+        requested_picklist[stat_name] = stat_by_team.reindex(teams).round(decimals).to_numpy()
+
+    return requested_picklist
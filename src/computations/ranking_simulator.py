@@ -0,0 +1,178 @@
+"""Defines the computations behind the `Ranking Simulation` page, returning the rankings rather than rendering them."""
+
+from typing import NamedTuple
+
+import numpy as np
+from pandas import concat, DataFrame
+
+from utils import (
+    alliance_incidence,
+    EventData,
+    profiled,
+    retrieve_match_data_appearances,
+    retrieve_match_predictions,
+    retrieve_match_schedule_appearances,
+    retrieve_team_list,
+    shared_result,
+    simulate_rankings
+)
+
+__all__ = ["current_rankings", "rank_distribution_from", "RankingSimulation", "simulate_rankings_from"]
+
+
+class RankingSimulation(NamedTuple):
+    """The rankings up to a match and what's needed to simulate the rest of the qualification matches from it.
+
+    `rankings`, `remaining_matches` and `match_predictions` are passed as is to `project_rankings` and
+    `simulate_rankings`.
+    """
+
+    rankings: DataFrame  # The current rankings (see `current_rankings`)
+    remaining_matches: DataFrame  # The qualification matches from the match simulated from onwards
+    match_predictions: DataFrame  # The predictions of every match in the schedule, indexed by match key
+    expected_rankings: DataFrame  # The average ranking points, coopertition and match score expected of each team
+
+
+@profiled("computations")
+@shared_result
+def current_rankings(event_data: EventData, to_match: int) -> DataFrame:
+    """Ranks the teams by the results of the matches played up to a match.
+
+    :param event_data: The event data to rank the teams from.
+    :param to_match: The number of the last match counted.
+    :return: The average ranking points, coopertition and match score of each team (with the number of matches they
+        played), sorted by the ranking order.
+    """
+    teams = retrieve_team_list(event_data.scouting_data)
+    matches_played = event_data.match_data
+    appearances = retrieve_match_data_appearances(event_data)
+
+    if matches_played.empty:
+        return DataFrame(
+            {"team": teams, "rp": np.nan, "coop": np.nan, "match_score": np.nan, "matches_played": 0}
+        )
+
+    # Attach the result of the alliance each team played on to each of its appearances.
+    results_by_alliance = concat(
+        [
+            DataFrame(
+                {
+                    "match_key": matches_played["match_key"],
+                    "alliance": alliance,
+                    "match_number": matches_played["match_number"],
+                    "rp": matches_played[f"{alliance}_alliance_rp"],
+                    "coop": matches_played["reached_coop"].astype(float),
+                    "match_score": matches_played[f"{alliance}_score"]
+                }
+            )
+            for alliance in ("red", "blue")
+        ]
+    )
+    results_by_team = appearances.reset_index().merge(results_by_alliance, on=["match_key", "alliance"])
+    results_by_team = results_by_team[results_by_team["match_number"] <= to_match]
+
+    rankings = results_by_team.groupby("team").agg(
+        rp=("rp", "mean"),
+        coop=("coop", "mean"),
+        match_score=("match_score", "mean"),
+        matches_played=("match_key", "count")
+    ).reindex(teams)
+    rankings["matches_played"] = rankings["matches_played"].fillna(0).astype(int)
+
+    # Sort orders
+    return rankings.rename_axis("team").reset_index().sort_values(
+        by=["rp", "coop", "match_score"], ascending=False, kind="stable"
+    ).reset_index(drop=True)
+
+
+@profiled("computations")
+@shared_result
+def simulate_rankings_from(
+    event_data: EventData,
+    to_match: int,
+    match_predictions: DataFrame | None = None
+) -> RankingSimulation:
+    """Finds the rankings up to a match and the rankings expected once every remaining match is played.
+
+    :param event_data: The event data to simulate the rankings from.
+    :param to_match: The number of the match to simulate from.
+    :param match_predictions: The predictions of the match schedule, defaulting to `retrieve_match_predictions`.
+    :return: The current and expected rankings, along with the remaining matches and their predictions.
+    """
+    rankings = current_rankings(event_data, to_match)
+    match_schedule = event_data.match_schedule
+    teams = rankings["team"].tolist()
+
+    # Every match in the schedule is predicted once per scouting data refresh, so each match is a lookup.
+    if match_predictions is None:
+        match_predictions = retrieve_match_predictions(event_data)
+
+    qualification_matches = match_schedule[match_schedule["match_key"].str.startswith("qm")]
+    matches_left = qualification_matches[
+        qualification_matches["match_key"].str.replace("qm", "").astype(int) >= to_match
+    ]
+    predictions_left = match_predictions.reindex(matches_left["match_key"].tolist())
+
+    # Sum the expected outcome of each team's remaining matches through the (match x team) alliance matrices.
+    appearances = retrieve_match_schedule_appearances(event_data)
+    match_keys = matches_left["match_key"].tolist()
+    red_incidence = alliance_incidence(appearances, match_keys, teams, "red").T
+    blue_incidence = alliance_incidence(appearances, match_keys, teams, "blue").T
+    expected_rps = {
+        alliance_color: (
+            predictions_left[f"{alliance_color}_melody_chance"]
+            + predictions_left[f"{alliance_color}_ensemble_chance"]
+            + predictions_left[f"{alliance_color}_win_chance"] * 2
+        ).to_numpy()
+        for alliance_color in ("red", "blue")
+    }
+
+    matches_played = rankings["matches_played"].to_numpy()
+    total_matches_played = (
+        matches_played + red_incidence @ np.ones(len(matches_left)) + blue_incidence @ np.ones(len(matches_left))
+    )
+    total_rps = (
+        rankings["rp"].to_numpy() * matches_played
+        + red_incidence @ expected_rps["red"]
+        + blue_incidence @ expected_rps["blue"]
+    )
+    total_coop = (
+        rankings["coop"].to_numpy() * matches_played
+        + red_incidence @ predictions_left["red_coop_chance"].to_numpy()
+        + blue_incidence @ predictions_left["blue_coop_chance"].to_numpy()
+    )
+    total_score = (
+        rankings["match_score"].to_numpy() * matches_played
+        + red_incidence @ predictions_left["red_score"].to_numpy()
+        + blue_incidence @ predictions_left["blue_score"].to_numpy()
+    )
+
+    expected_rankings = DataFrame(
+        {
+            "Team": teams,
+            "Average Ranking Points": total_rps / total_matches_played,
+            "Average Coopertition": total_coop / total_matches_played,
+            "Average Match Score": total_score / total_matches_played
+        }
+    ).sort_values(
+        by=["Average Ranking Points", "Average Coopertition", "Average Match Score"],
+        ascending=False,
+        kind="stable"
+    )
+
+    return RankingSimulation(rankings, matches_left, match_predictions, expected_rankings)
+
+
+@profiled("computations")
+@shared_result
+def rank_distribution_from(event_data: EventData, to_match: int, simulations: int = 10_000) -> DataFrame:
+    """Simulates the remaining qualification matches from a match to find where each team is likely to rank.
+
+    :param event_data: The event data to simulate the rankings from.
+    :param to_match: The number of the match to simulate from.
+    :param simulations: The number of times to simulate the remaining matches.
+    :return: The expected rank, median rank and the chance of ranking in the top 8 and 16 of each team (see
+        `simulate_rankings`).
+    """
+    rankings, remaining_matches, match_predictions, _ = simulate_rankings_from(event_data, to_match)
+    return simulate_rankings(rankings, remaining_matches, match_predictions, simulations=simulations)
@@ -0,0 +1,307 @@
+"""Defines the computations behind the `Teams` page, returning data and figures rather than rendering them."""
+
+import re
+from typing import NamedTuple
+
+from plotly.graph_objects import Figure
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from utils import (
+    bar_graph,
+    CalculatedStats,
+    Criteria,
+    GeneralConstants,
+    GraphType,
+    multi_line_graph,
+    profiled,
+    QuantileStats,
+    Queries,
+    shared_result,
+    stacked_bar_graph
+)
+
+__all__ = [
+    "AnnotatedNotes",
+    "analyze_team_notes",
+    "team_autonomous_graph",
+    "team_metrics",
+    "team_qualitative_graphs",
+    "team_quantile_stats",
+    "team_teleop_graphs"
+]
+
+# The stats each team is compared against on the `Teams` page, mapped to how they're calculated for a team.
+TEAM_QUANTILE_STATS = {
+    "average_points_contributed": "average_points_contributed",
+    "average_auto_speaker_cycles": "average_cycles_for_AutoSpeaker",
+    "average_auto_amp_cycles": "average_cycles_for_AutoAmp",
+    "average_teleop_speaker_cycles": "average_cycles_for_TeleopSpeaker",
+    "average_teleop_amp_cycles": "average_cycles_for_TeleopAmp",
+    "average_feeding_cycles": "average_cycles_for_TeleopPassing",
+    "iqr_of_points_contributed": lambda self, team: self.calculate_iqr(self.points_contributed_by_match(team)),
+    "times_climbed": "times_climbed",
+    "times_harmonized": "times_harmonized",
+    "times_disabled": "times_disabled",
+    "times_left_starting_zone": "times_left_starting_zone",
+    "times_went_to_centerline": "times_went_to_centerline"
+}
+
+
+class AnnotatedNotes(NamedTuple):
+    """The notes taken on a team in one match, with their positive and negative terms highlighted."""
+
+    match_key: str
+    annotated_words: list  # Words, or (word, label, background color) tuples for highlighted terms
+    positivity_score: float  # From -1 (negative) to 1 (positive)
+
+
+@profiled("computations")
+@shared_result
+def team_quantile_stats(calculated_stats: CalculatedStats) -> QuantileStats:
+    """Calculates the medians of the stats that teams are compared against on the `Teams` page.
+
+    :param calculated_stats: The statistics of the event.
+    :return: A `QuantileStats` containing the median of each stat in `TEAM_QUANTILE_STATS` across the event.
+    """
+    return calculated_stats.quantile_stats(TEAM_QUANTILE_STATS, quantiles=[0.5])
+
+
+@profiled("computations")
+@shared_result
+def team_metrics(calculated_stats: CalculatedStats, team_number: int) -> dict[str, float]:
+    """Calculates the metrics shown for a team on the `Teams` page.
+
+    Each metric compared against the event is keyed by its name in `TEAM_QUANTILE_STATS`.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_number: The team to calculate the metrics for.
+    :return: The value of each metric.
+    """
+    return {
+        "average_points_contributed": calculated_stats.average_points_contributed(team_number),
+        "average_auto_speaker_cycles": calculated_stats.average_cycles_for_structure(
+            team_number, Queries.AUTO_SPEAKER
+        ),
+        "average_auto_amp_cycles": calculated_stats.average_cycles_for_structure(team_number, Queries.AUTO_AMP),
+        "average_teleop_speaker_cycles": calculated_stats.average_cycles_for_structure(
+            team_number, Queries.TELEOP_SPEAKER
+        ),
+        "average_teleop_amp_cycles": calculated_stats.average_cycles_for_structure(team_number, Queries.TELEOP_AMP),
+        "average_feeding_cycles": calculated_stats.cycles_by_structure_per_match(
+            team_number, Queries.TELEOP_PASSING
+        ).mean(),
+        "iqr_of_points_contributed": calculated_stats.calculate_iqr(
+            calculated_stats.points_contributed_by_match(team_number)
+        ),
+        "average_trap_cycles": calculated_stats.average_stat(
+            team_number, Queries.TELEOP_TRAP, Criteria.BOOLEAN_CRITERIA
+        ),
+        **{
+            stat: calculated_stats.cumulative_stat(team_number, field, Criteria.BOOLEAN_CRITERIA)
+            for stat, field in (
+                ("times_climbed", Queries.CLIMBED_CHAIN),
+                ("times_harmonized", Queries.HARMONIZED_ON_CHAIN),
+                ("times_disabled", Queries.DISABLE),
+                ("times_left_starting_zone", Queries.LEFT_STARTING_ZONE),
+                ("times_went_to_centerline", Queries.AUTO_USED_CENTERLINE)
+            )
+        }
+    }
+
+
+@profiled("computations")
+@shared_result
+def team_autonomous_graph(calculated_stats: CalculatedStats, team_number: int, type_of_graph: GraphType) -> Figure:
+    """Creates the graph of a team's Speaker/Amp cycles (or points) during autonomous over time.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_number: The team to create the graph for.
+    :param type_of_graph: The type of graph to create (cycle contributions / point contributions).
+    :return: The figure.
+    """
+    using_cycle_contributions = type_of_graph == GraphType.CYCLE_CONTRIBUTIONS
+
+    speaker_cycles_by_match = calculated_stats.cycles_by_structure_per_match(
+        team_number,
+        Queries.AUTO_SPEAKER
+    ) * (1 if using_cycle_contributions else 5)
+    amp_cycles_by_match = calculated_stats.cycles_by_structure_per_match(
+        team_number,
+        Queries.AUTO_AMP
+    ) * (1 if using_cycle_contributions else 2)
+    line_names = [
+        ("# of Speaker Cycles" if using_cycle_contributions else "# of Speaker Points"),
+        ("# of Amp Cycles" if using_cycle_contributions else "# of Amp Points")
+    ]
+
+    return multi_line_graph(
+        range(len(speaker_cycles_by_match)),
+        [speaker_cycles_by_match, amp_cycles_by_match],
+        x_axis_label="Match Index",
+        y_axis_label=line_names,
+        y_axis_title=f"# of Autonomous {'Cycles' if using_cycle_contributions else 'Points'}",
+        title=f"Speaker/Amp {'Cycles' if using_cycle_contributions else 'Points'} During Autonomous Over Time",
+        color_map=dict(zip(line_names, (GeneralConstants.GOLD_GRADIENT[0], GeneralConstants.GOLD_GRADIENT[-1])))
+    )
+
+
+@profiled("computations")
+@shared_result
+def team_teleop_graphs(
+    calculated_stats: CalculatedStats,
+    team_number: int,
+    type_of_graph: GraphType
+) -> tuple[Figure, Figure]:
+    """Creates the teleop graphs of a team.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_number: The team to create the graphs for.
+    :param type_of_graph: The type of graph to create (cycle contributions / point contributions).
+    :return: The Speaker/Amp/feeding cycles over time and the breakdown of the team's climb speeds.
+    """
+    using_cycle_contributions = type_of_graph == GraphType.CYCLE_CONTRIBUTIONS
+
+    speaker_cycles_by_match = calculated_stats.cycles_by_structure_per_match(
+        team_number,
+        Queries.TELEOP_SPEAKER
+    ) * (1 if using_cycle_contributions else 5)
+    amp_cycles_by_match = calculated_stats.cycles_by_structure_per_match(
+        team_number,
+        Queries.TELEOP_AMP
+    ) * (1 if using_cycle_contributions else 2)
+    feeding_cycles_by_match = calculated_stats.cycles_by_structure_per_match(
+        team_number,
+        Queries.TELEOP_PASSING
+    )
+    line_names = [
+        ("# of Speaker Cycles" if using_cycle_contributions else "# of Speaker Points"),
+        ("# of Amp Cycles" if using_cycle_contributions else "# of Amp Points"),
+        "# of Passing Cycles"
+    ]
+
+    cycles_over_time = stacked_bar_graph(
+        range(len(speaker_cycles_by_match)),
+        [speaker_cycles_by_match, amp_cycles_by_match, feeding_cycles_by_match],
+        x_axis_label="",
+        y_axis_label=line_names,
+        y_axis_title=f"# of Teleop {'Cycles' if using_cycle_contributions else 'Points'}",
+        title=f"Speaker/Amp/Feeding {'Cycles' if using_cycle_contributions else 'Points'} During Teleop Over Time",
+        color_map=dict(zip(line_names, (GeneralConstants.GOLD_GRADIENT[0], GeneralConstants.GOLD_GRADIENT[-1])))
+    )
+
+    slow_climbs = calculated_stats.cumulative_stat(team_number, Queries.CLIMB_SPEED, {"Slow": 1})
+    fast_climbs = calculated_stats.cumulative_stat(team_number, Queries.CLIMB_SPEED, {"Fast": 1})
+    climb_speeds = bar_graph(
+        ["Slow Climbs", "Fast Climbs"],
+        [slow_climbs, fast_climbs],
+        x_axis_label="Type of Climb",
+        y_axis_label="# of Climbs",
+        title="Climb Speed Breakdown",
+        color={"Slow Climbs": GeneralConstants.LIGHT_RED, "Fast Climbs": GeneralConstants.LIGHT_GREEN},
+        color_indicator="Type of Climb"
+    )
+
+    return cycles_over_time, climb_speeds
+
+
+@profiled("computations")
+@shared_result
+def team_qualitative_graphs(calculated_stats: CalculatedStats, team_number: int) -> tuple[Figure, Figure, Figure]:
+    """Creates the breakdowns of the ratings scouts gave a team.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_number: The team to create the graphs for.
+    :return: The breakdowns of the team's driver rating, defense skill and counter defense skill.
+    """
+    rating_breakdowns = []
+
+    for name, field, criteria in (
+        ("Driver Rating", Queries.DRIVER_RATING, Criteria.DRIVER_RATING_CRITERIA),
+        ("Defense Skill", Queries.DEFENSE_SKILL, Criteria.BASIC_RATING_CRITERIA),
+        ("Counter Defense Skill", Queries.COUNTER_DEFENSE_SKIll, Criteria.BASIC_RATING_CRITERIA)
+    ):
+        rating_types = criteria.keys()
+        rating_breakdowns.append(
+            bar_graph(
+                rating_types,
+                [
+                    calculated_stats.cumulative_stat(team_number, field, {rating_type: 1})
+                    for rating_type in rating_types
+                ],
+                x_axis_label=name,
+                y_axis_label="# of Occurrences",
+                title=f"{name} Breakdown",
+                color=dict(zip(rating_types, GeneralConstants.RED_TO_GREEN_GRADIENT[::-1])),
+                color_indicator=name
+            )
+        )
+
+    return tuple(rating_breakdowns)
+
+
+@profiled("computations")
+@shared_result
+def analyze_team_notes(calculated_stats: CalculatedStats, team_number: int) -> list[AnnotatedNotes]:
+    """Highlights the positive and negative terms in the notes taken on a team and scores how positive they are.
+
+    Each match's score weighs a sentiment score generated from the English vocabulary equally with an estimate
+    from the positive and negative terms in `GeneralConstants`, since the former won't catch terms that are only
+    negative in the context of a robot's performance.
+
+    :param calculated_stats: The statistics of the event.
+    :param team_number: The team to analyze the notes of.
+    :return: The annotated notes of each match that has notes.
+    """
+    # Constants used for the sentiment analysis
+    ml_weight = 1
+    estimate_weight = 1
+
+    sentiment = SentimentIntensityAnalyzer()
+    scouting_data = calculated_stats.data_for_team(team_number)
+    notes_by_match = dict(
+        zip(
+            scouting_data[Queries.MATCH_KEY],
+            (
+                scouting_data[Queries.AUTO_NOTES].apply(lambda note: (note + " ").lower() if note else "")
+                + scouting_data[Queries.TELEOP_NOTES].apply(lambda note: (note + " ").lower() if note else "")
+                + scouting_data[Queries.ENDGAME_NOTES].apply(lambda note: (note + " ").lower() if note else "")
+                + scouting_data[Queries.RATING_NOTES].apply(lambda note: note.lower())
+            )
+        )
+    )
+    annotated_notes = []
+
+    for match_key, notes in notes_by_match.items():
+        if not notes.strip().replace("|", ""):
+            continue
+
+        annotated_words = []
+        # Used to create a rough estimate of how positive the notes are. Positive terms have a weight of
+        # one, while negative terms have a weight of negative one and neutral terms have a weight of zero.
+        sentiment_scores = []
+
+        for word in re.split(r"(\s+)", notes):
+            if not word.strip():
+                annotated_words.append(word)
+                continue
+
+            if any(term in word.lower() for term in GeneralConstants.POSITIVE_TERMS):
+                annotated_words.append((word, "", f"{GeneralConstants.LIGHT_GREEN}75"))
+                sentiment_scores.append(1)
+            elif any(term in word.lower() for term in GeneralConstants.NEGATIVE_TERMS):
+                annotated_words.append((word, "", f"{GeneralConstants.LIGHT_RED}75"))
+                sentiment_scores.append(-1)
+            else:
+                annotated_words.append(word)
+
+        ml_generated_score = sentiment.polarity_scores(notes)["compound"]
+        sentiment_estimate = sum(sentiment_scores) / (len(sentiment_scores) or 1)
+        annotated_notes.append(
+            AnnotatedNotes(
+                match_key,
+                annotated_words,
+                (ml_generated_score * ml_weight + sentiment_estimate * estimate_weight) / 2
+            )
+        )
+
+    return annotated_notes
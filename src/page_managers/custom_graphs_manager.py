@@ -8,24 +8,23 @@ import streamlit as st
 
 from .page_manager import PageManager
 from utils import (
-    CalculatedStats,
+    EventData,
     graphing,
+    load_event_data,
     plotly_chart,
     populate_missing_data,
     Queries,
-    retrieve_scouting_data,
-    retrieve_team_list,
-    scouting_data_for_team
+    retrieve_calculated_stats,
+    retrieve_team_list
 )
 
 
 class CustomGraphsManager(PageManager):
     """The page manager for the `Custom Graphs` page."""
 
-    def __init__(self):
-        self.calculated_stats = CalculatedStats(
-            retrieve_scouting_data()
-        )
+    def __init__(self, event_data: EventData | None = None):
+        self.event_data = event_data or load_event_data()
+        self.calculated_stats = retrieve_calculated_stats(self.event_data)
 
     def generate_input_section(self) -> list[list, list, Callable, str]:
         """Creates the input section for the `Custom Graphs` page.
@@ -35,7 +34,7 @@ class CustomGraphsManager(PageManager):
 
         :return: Returns a list containing the x axis, the y axis, the graph type, and the statistic name.
         """
-        team_list = retrieve_team_list()
+        team_list = retrieve_team_list(self.event_data.scouting_data)
 
         names_to_methods = {
             name.replace("_", " ").capitalize(): method
@@ -128,7 +127,7 @@ class CustomGraphsManager(PageManager):
 
         if graph_name == "Line graph":
             return [
-                [scouting_data_for_team(team_number)[Queries.MATCH_KEY] for team_number in teams_selected][0],
+                [self.calculated_stats.data_for_team(team_number)[Queries.MATCH_KEY] for team_number in teams_selected][0],
                 y_data[0],
                 graph_selected,
                 stat_selected
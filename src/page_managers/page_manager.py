@@ -2,10 +2,17 @@
 
 from abc import abstractmethod
 
+from utils import profile_methods
+
 
 class PageManager:
     """The base class for all page managers in FalconVis."""
 
+    def __init_subclass__(cls, **kwargs):
+        """Profiles the `generate_*` methods of every page manager (see `start_profiling`)."""
+        super().__init_subclass__(**kwargs)
+        profile_methods("pages", include=lambda name: name.startswith("generate_"))(cls)
+
     @abstractmethod
     def generate_input_section(self) -> NotImplemented:
         """Abstract method for all page managers to implement.
@@ -1,7 +1,6 @@
 """Creates the `PicklistManager` class used to set up the Picklist page and its table."""
 
 import os
-from functools import partial
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -10,7 +9,15 @@ from notion_client.helpers import get_id
 from pandas import DataFrame, notna
 
 from .page_manager import PageManager
-from utils import CalculatedStats, Criteria, EventSpecificConstants, Queries, retrieve_scouting_data, retrieve_team_list
+from computations import generate_picklist, PICKLIST_STATS
+from utils import (
+    EventData,
+    EventSpecificConstants,
+    load_event_data,
+    Queries,
+    retrieve_calculated_stats,
+    retrieve_team_list
+)
 
 load_dotenv()
 
@@ -19,60 +26,14 @@ class PicklistManager(PageManager):
     """The page manager for the `Picklist` page."""
     TRUNCATE_AT_DIGIT = 2  # Round the decimal to two places
 
-    def __init__(self):
-        self.calculated_stats = CalculatedStats(
-            retrieve_scouting_data()
-        )
-        self.teams = retrieve_team_list()
+    def __init__(self, event_data: EventData | None = None):
+        self.event_data = event_data or load_event_data()
+        self.calculated_stats = retrieve_calculated_stats(self.event_data)
+        self.teams = retrieve_team_list(self.event_data.scouting_data)
         self.client = Client(auth=os.getenv("NOTION_TOKEN"))
 
-        # Requested stats is used to define the stats wanted in the picklist generation.
-        self.requested_stats = {
-            "Average Points Contributed": self.calculated_stats.average_points_contributed,
-            "Average Auto Cycles": partial(
-                self.calculated_stats.average_cycles,
-                mode=Queries.AUTO
-            ),
-            "Average Teleop Cycles": partial(
-                self.calculated_stats.average_cycles,
-                mode=Queries.TELEOP
-            ),
-            "Average Speaker Cycles": partial(
-                self.calculated_stats.average_cycles_for_structure,
-                structure=(Queries.AUTO_SPEAKER, Queries.TELEOP_SPEAKER)
-            ),
-            "Average Amp Cycles": partial(
-                self.calculated_stats.average_cycles_for_structure,
-                structure=(Queries.AUTO_AMP, Queries.TELEOP_AMP)
-            ),
-            "Average Feeding Cycles": self.calculated_stats.average_feeding_cycles_without_full_field,
-            "Avg. Adjusted Teleop Cycles (w/ Feeding)": (
-                lambda team: self.calculated_stats.average_cycles(team, Queries.TELEOP) + self.calculated_stats.average_feeding_cycles_without_full_field(team) / 2
-            ),
-            "Average Trap Cycles": partial(
-                self.calculated_stats.average_cycles_for_structure,
-                structure=Queries.TELEOP_TRAP
-            ),
-            "# of Times Climbed": partial(
-                self.calculated_stats.cumulative_stat,
-                stat=Queries.CLIMBED_CHAIN,
-                criteria=Criteria.BOOLEAN_CRITERIA
-            ),
-            "# of Times Harmonized": partial(
-                self.calculated_stats.cumulative_stat,
-                stat=Queries.HARMONIZED_ON_CHAIN,
-                criteria=Criteria.BOOLEAN_CRITERIA
-            ),
-            "# of Disables": partial(
-                self.calculated_stats.cumulative_stat,
-                stat=Queries.DISABLE,
-                criteria=Criteria.BOOLEAN_CRITERIA
-            ),
-            "Average Driver Rating": self.calculated_stats.average_driver_rating,
-            "Average Defense Skill": self.calculated_stats.average_defense_skill,
-            "Average Defense Time": self.calculated_stats.average_defense_time,
-            "Average Counter Defense Skill": self.calculated_stats.average_counter_defense_skill
-        }
+        # Requested stats maps the stats wanted in the picklist generation to their columns in the event table.
+        self.requested_stats = PICKLIST_STATS
 
     def generate_input_section(self) -> list[list, list]:
         """Creates the input section for the `Picklist` page.
@@ -92,16 +53,7 @@ class PicklistManager(PageManager):
 
         :param stats_requested: The name of the statistics requested (matches the keys in `self.requested_stats`
         """
-        requested_picklist = [
-            {
-                "Team Number": f"FRC {team}"  # We make it a string because otherwise Notion won't recognize the value.
-            } | {
-                stat_name: round(self.requested_stats[stat_name](team), self.TRUNCATE_AT_DIGIT)
-                for stat_name in stats_requested
-            }
-            for team in self.teams
-        ]
-        return DataFrame.from_dict(requested_picklist)
+        return generate_picklist(self.calculated_stats, self.teams, stats_requested, self.TRUNCATE_AT_DIGIT)
 
     def write_to_notion(self, dataframe: DataFrame) -> None:
         """Writes to a Notion picklist entered by the user in the constants file.
@@ -121,18 +73,13 @@ class PicklistManager(PageManager):
         )
 
         # Find percentiles across all teams
-        percentile_75 = self.calculated_stats.quantile_stat(
-            0.75,
-            lambda self_, team: self_.average_cycles(team)
-        )
-        percentile_50 = self.calculated_stats.quantile_stat(
-            0.5,
-            lambda self_, team: self_.average_cycles(team)
-        )
-        percentile_25 = self.calculated_stats.quantile_stat(
-            0.25,
-            lambda self_, team: self_.average_cycles(team)
+        cycle_quantiles = self.calculated_stats.quantile_stats(
+            {"average_cycles": "average_cycles"},
+            quantiles=[0.25, 0.5, 0.75]
         )
+        percentile_75 = cycle_quantiles.threshold("average_cycles", 0.75)
+        percentile_50 = cycle_quantiles.threshold("average_cycles", 0.5)
+        percentile_25 = cycle_quantiles.threshold("average_cycles", 0.25)
 
         for _, row in dataframe.iterrows():
             team_name = row["Team Number"]
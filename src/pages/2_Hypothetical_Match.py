@@ -3,7 +3,7 @@
 import streamlit as st
 
 from page_managers import MatchManager
-from utils import GeneralConstants, GraphType
+from utils import event_data_status, GeneralConstants, GraphType, show_profile, start_profiling
 
 # Configuration for Streamlit
 st.set_page_config(
@@ -11,6 +11,7 @@ st.set_page_config(
     page_title="Hypothetical Match",
     page_icon="🤔",
 )
+profile = start_profiling("Hypothetical Match")
 match_manager = MatchManager()
 
 if __name__ == '__main__':
@@ -163,3 +164,6 @@ if __name__ == '__main__':
                 teams_selected[1],
                 color_gradient=GeneralConstants.BLUE_ALLIANCE_GRADIENT
             )
+
+    # Show where the time went during this rerun if it's being profiled.
+    show_profile(profile, event_data_status())
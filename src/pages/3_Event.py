@@ -3,7 +3,7 @@
 import streamlit as st
 
 from page_managers import EventManager
-from utils import GraphType
+from utils import event_data_status, GraphType, show_profile, start_profiling
 
 
 # Configuration for Streamlit
@@ -12,6 +12,7 @@ st.set_page_config(
     page_title="Event",
     page_icon="🏅",
 )
+profile = start_profiling("Event")
 event_manager = EventManager()
 
 if __name__ == '__main__':
@@ -38,4 +39,6 @@ if __name__ == '__main__':
         event_manager.generate_event_graphs(
             type_of_graph=GraphType.POINT_CONTRIBUTIONS
         )
-    
+
+    # Show where the time went during this rerun if it's being profiled.
+    show_profile(profile, event_data_status())
@@ -2,6 +2,7 @@
 
 import streamlit as st
 from page_managers import PicklistManager
+from utils import event_data_status, show_profile, start_profiling
 
 # Configuration for Streamlit
 st.set_page_config(
@@ -9,6 +10,7 @@ st.set_page_config(
     page_title="Picklist",
     page_icon="🫂",
 )
+profile = start_profiling("Picklist")
 picklist_manager = PicklistManager()
 
 if __name__ == '__main__':
@@ -33,3 +35,6 @@ if __name__ == '__main__':
 
     if st.button("📝  Write to Notion Picklist"):
         picklist_manager.write_to_notion(generated_picklist)
+
+    # Show where the time went during this rerun if it's being profiled.
+    show_profile(profile, event_data_status())
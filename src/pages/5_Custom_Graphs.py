@@ -2,6 +2,7 @@
 
 import streamlit as st
 from page_managers import CustomGraphsManager
+from utils import event_data_status, show_profile, start_profiling
 
 # Configuration for Streamlit
 st.set_page_config(
@@ -9,6 +10,7 @@ st.set_page_config(
     page_title="Custom Graphs",
     page_icon="📊",
 )
+profile = start_profiling("Custom Graphs")
 custom_graphs_manager = CustomGraphsManager()
 
 if __name__ == '__main__':
@@ -27,3 +29,6 @@ if __name__ == '__main__':
     # Generate the custom graph given the input provided.
     with graph_tab:
         custom_graphs_manager.generate_custom_graph(x_data, y_data, type_of_graph, stat_name)
+
+    # Show where the time went during this rerun if it's being profiled.
+    show_profile(profile, event_data_status())
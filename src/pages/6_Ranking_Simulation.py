@@ -2,6 +2,7 @@
 
 import streamlit as st
 from page_managers import RankingSimulatorManager
+from utils import event_data_status, show_profile, start_profiling
 
 # Configuration for Streamlit
 st.set_page_config(
@@ -9,6 +10,7 @@ st.set_page_config(
     page_title="Ranking Simulator",
     page_icon="❓",
 )
+profile = start_profiling("Ranking Simulator")
 ranking_simulator_manager = RankingSimulatorManager()
 
 if __name__ == '__main__':
@@ -19,4 +21,7 @@ if __name__ == '__main__':
     match_chosen = ranking_simulator_manager.generate_input_section()
 
     # Display the simulated rankings.
-    ranking_simulator_manager.generate_simulated_rankings(match_chosen)
\ No newline at end of file
+    ranking_simulator_manager.generate_simulated_rankings(match_chosen)
+
+    # Show where the time went during this rerun if it's being profiled.
+    show_profile(profile, event_data_status())
@@ -0,0 +1,128 @@
+"""Tests for `ConditionalFetcher` against a local stand-in server answering conditional requests."""
+
+import json
+from email.utils import formatdate
+from hashlib import sha1
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+from requests import RequestException
+
+from utils import ConditionalFetcher, DataKind, HTTPSource, pooled_session
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Serves the server's payload with an ETag and a Last-Modified header, answering with a 304 when unchanged."""
+
+    def do_GET(self) -> None:
+        payload = self.server.payload
+        etag = f'"{sha1(payload).hexdigest()}"'
+        last_modified = formatdate(self.server.modified, usegmt=True)
+
+        unchanged = (
+            self.headers.get("If-None-Match") == etag
+            if self.server.send_etag
+            else self.headers.get("If-Modified-Since") == last_modified
+        )
+        self.send_response(304 if unchanged else 200)
+
+        if self.server.send_etag:
+            self.send_header("ETag", etag)
+
+        self.send_header("Last-Modified", last_modified)
+        self.send_header("Content-Length", "0" if unchanged else str(len(payload)))
+        self.end_headers()
+
+        if not unchanged:
+            self.wfile.write(payload)
+
+    def log_message(self, *args) -> None:
+        """Keeps the test output quiet."""
+
+
+@pytest.fixture(params=[True, False], ids=["etag", "last_modified"])
+def server(request):
+    """Starts a stand-in server on a free port in a thread, versioning its payload by ETag or by Last-Modified."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.payload = json.dumps([{"MatchKey": "qm1", "TeamNumber": 4099}]).encode()
+    server.modified = 1_700_000_000
+    server.send_etag = request.param
+
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def source(server) -> HTTPSource:
+    """A source fetching the scouting data from the stand-in server."""
+    session = pooled_session()
+    session.trust_env = False  # Never route the local server through a proxy
+    return HTTPSource({DataKind.SCOUTING_DATA: f"http://127.0.0.1:{server.server_port}/data.json"}, session=session)
+
+
+def _fetcher(tmp_path) -> ConditionalFetcher:
+    return ConditionalFetcher(str(tmp_path / "cache"), str(tmp_path / "snapshots"))
+
+
+def test_unchanged_data_is_not_downloaded_again(server, source, tmp_path):
+    fetcher = _fetcher(tmp_path)
+    location = source.location(DataKind.SCOUTING_DATA)
+
+    first = fetcher.fetch(source, DataKind.SCOUTING_DATA, json.loads)
+    second = fetcher.fetch(source, DataKind.SCOUTING_DATA, json.loads)
+
+    assert first == [{"MatchKey": "qm1", "TeamNumber": 4099}]
+    assert second is first  # The payload parsed the first time is reused
+    assert fetcher.statistics[location] == {
+        "requests": 2, "not_modified": 1, "bytes_downloaded": len(server.payload)
+    }
+
+
+def test_changed_data_is_downloaded_again(server, source, tmp_path):
+    fetcher = _fetcher(tmp_path)
+    location = source.location(DataKind.SCOUTING_DATA)
+    fetcher.fetch(source, DataKind.SCOUTING_DATA, json.loads)
+
+    server.payload = json.dumps([{"MatchKey": "qm2", "TeamNumber": 254}]).encode()
+    server.modified += 60
+
+    assert fetcher.fetch(source, DataKind.SCOUTING_DATA, json.loads) == [{"MatchKey": "qm2", "TeamNumber": 254}]
+    assert fetcher.statistics[location]["requests"] == 2
+    assert fetcher.statistics[location]["not_modified"] == 0
+
+
+def test_disk_cache_is_reused_after_a_restart(server, source, tmp_path):
+    _fetcher(tmp_path).fetch(source, DataKind.SCOUTING_DATA, json.loads)
+
+    # A new fetcher (as after a restart) sends the version stored on disk and parses the copy on disk.
+    restarted_fetcher = _fetcher(tmp_path)
+    location = source.location(DataKind.SCOUTING_DATA)
+
+    assert restarted_fetcher.fetch(source, DataKind.SCOUTING_DATA, json.loads) == json.loads(server.payload)
+    assert restarted_fetcher.statistics[location] == {"requests": 1, "not_modified": 1}
+
+
+def test_copy_on_disk_is_served_when_the_server_is_down(server, source, tmp_path):
+    fetcher = _fetcher(tmp_path)
+    location = source.location(DataKind.SCOUTING_DATA)
+    payload = fetcher.fetch(source, DataKind.SCOUTING_DATA, json.loads)
+
+    server.shutdown()
+    server.server_close()
+
+    assert fetcher.fetch(source, DataKind.SCOUTING_DATA, json.loads) == payload
+    assert _fetcher(tmp_path).fetch(source, DataKind.SCOUTING_DATA, json.loads) == payload
+    assert fetcher.statistics[location]["served_from_disk"] == 1
+
+
+def test_missing_copy_raises_when_the_server_is_down(server, source, tmp_path):
+    server.shutdown()
+    server.server_close()
+
+    with pytest.raises(RequestException):
+        _fetcher(tmp_path).fetch(source, DataKind.SCOUTING_DATA, json.loads)
@@ -0,0 +1,33 @@
+"""Tests for `BackgroundRefresher` and the hooks it runs after each refresh."""
+
+from itertools import count
+from threading import Event
+
+from utils import BackgroundRefresher
+
+
+def test_hooks_run_in_the_background_after_every_refresh():
+    versions = count(1)
+    refresher = BackgroundRefresher(lambda: next(versions), interval=0.05)
+    hooked, second_refresh = [], Event()
+
+    def hook(data: int) -> None:
+        hooked.append(data)
+
+        if data >= 2:
+            second_refresh.set()
+
+    def failing_hook(data: int) -> None:
+        raise ValueError(f"Couldn't precompute version {data}")
+
+    refresher.add_refresh_hook(failing_hook)
+    refresher.add_refresh_hook(hook)
+
+    try:
+        assert refresher.current() == 1
+        assert second_refresh.wait(timeout=5)
+    finally:
+        refresher.stop()
+
+    assert hooked[:2] == [1, 2]
+    assert refresher.status().failures == 0  # A failing hook doesn't fail the refresh
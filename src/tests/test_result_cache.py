@@ -0,0 +1,92 @@
+"""Tests for `ResultCache` and the results shared across sessions with `shared_result`."""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
+
+import pytest
+
+from utils import ResultCache, result_cache, shared_result
+
+
+class _Versioned:
+    """Stands in for the versioned event data or `CalculatedStats` passed first to shared functions."""
+
+    def __init__(self, version: str | None):
+        self.version = version
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    result_cache.clear()
+    yield
+    result_cache.clear()
+
+
+def test_concurrent_identical_calls_compute_once():
+    calls = []
+
+    @shared_result
+    def slow(data, team, modes=("auto", "teleop")):
+        calls.append(team)
+        sleep(0.2)
+        return [team]
+
+    barrier = Barrier(8)
+
+    def call(index: int):
+        barrier.wait()
+        # Passed differently every other call, which is still the same call.
+        return slow(_Versioned("v1"), 4099, modes=["auto", "teleop"]) if index % 2 else slow(_Versioned("v1"), 4099)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(call, range(8)))
+
+    assert calls == [4099]
+    assert all(result is results[0] for result in results)
+
+
+def test_failures_are_raised_to_every_caller_and_not_cached():
+    cache = ResultCache()
+    barrier = Barrier(4)
+    calls = []
+
+    def fail():
+        calls.append(1)
+        sleep(0.1)
+        raise ValueError("No data")
+
+    def call(_):
+        barrier.wait()
+
+        with pytest.raises(ValueError):
+            cache.get_or_compute("key", fail)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(call, range(4)))
+
+    assert len(calls) == 1
+    assert cache.get_or_compute("key", lambda: 1) == 1
+
+
+def test_least_recently_used_results_are_evicted():
+    cache = ResultCache(max_entries=2)
+
+    for key in ("a", "b", "a", "c"):
+        cache.get_or_compute(key, lambda: key)
+
+    assert list(cache._results) == ["a", "c"]
+    assert cache.statistics == {"misses": 3, "hits": 1, "evictions": 1}
+
+
+def test_unversioned_data_and_callables_skip_the_cache():
+    @shared_result
+    def quantiles(data, stats):
+        return dict(stats)
+
+    quantiles(_Versioned(None), {"stat": "average_cycles"})
+    quantiles(_Versioned("v1"), {"stat": lambda self, team: team})
+    assert len(result_cache) == 0
+
+    quantiles(_Versioned("v1"), {"stat": "average_cycles"})
+    assert len(result_cache) == 1
@@ -0,0 +1,110 @@
+"""Tests for parsing scouting data and ingesting new submissions into it."""
+
+import json
+import os
+
+import pytest
+
+from benchmarks.synthetic_event import generate_synthetic_event
+from utils import ConditionalFetcher, DataKind, functions, ingest_scouting_submissions, LocalDirectorySource, Queries
+from utils.functions import _parse_note_scouting_data, _parse_scouting_data, _parse_scouting_submissions
+
+
+@pytest.fixture(scope="module")
+def submissions() -> list[dict]:
+    """The submissions of a small synthetic event, with two scouts watching every robot."""
+    event = generate_synthetic_event(teams=12, matches_per_team=2, scouts_per_robot=2)
+    return json.loads(event.scouting_data)
+
+
+def _without_scouts(submissions: list[dict]) -> list[dict]:
+    return [
+        {field: value for field, value in submission.items() if field != Queries.SCOUT_ID}
+        for submission in submissions
+    ]
+
+
+@pytest.mark.parametrize("with_scouts", [True, False], ids=["with_scouts", "without_scouts"])
+def test_only_new_submissions_are_ingested(submissions, with_scouts):
+    submissions = submissions if with_scouts else _without_scouts(submissions)
+    scouting_data = _parse_scouting_submissions(submissions[:30])
+
+    updated_scouting_data = ingest_scouting_submissions(scouting_data, submissions)
+
+    assert len(updated_scouting_data) == len(submissions)
+    assert updated_scouting_data[Queries.SUBMISSION_KEY].is_unique
+    assert set(updated_scouting_data.attrs["changed_matches"]) == {
+        submission[Queries.MATCH_KEY] for submission in submissions[30:]
+    }
+
+    unchanged_scouting_data = ingest_scouting_submissions(updated_scouting_data, submissions)
+    assert len(unchanged_scouting_data) == len(submissions)
+    assert unchanged_scouting_data.attrs["changed_teams"] == []
+
+
+def test_submissions_without_scouts_for_the_same_robot_are_kept(submissions):
+    first_scout = _without_scouts(submissions)[0]
+    second_scout = first_scout | {Queries.TELEOP_SPEAKER: first_scout[Queries.TELEOP_SPEAKER] + 1}
+    scouting_data = _parse_scouting_submissions([first_scout])
+
+    updated_scouting_data = ingest_scouting_submissions(scouting_data, [first_scout, second_scout])
+
+    assert len(updated_scouting_data) == 2
+    assert sorted(updated_scouting_data[Queries.TELEOP_SPEAKER]) == [
+        first_scout[Queries.TELEOP_SPEAKER], second_scout[Queries.TELEOP_SPEAKER]
+    ]
+
+
+def test_submissions_with_scouts_are_keyed_by_scout(submissions):
+    first_scout, second_scout = submissions[0], submissions[1]
+    assert first_scout[Queries.TEAM_NUMBER] == second_scout[Queries.TEAM_NUMBER]
+    scouting_data = _parse_scouting_submissions([first_scout])
+
+    updated_scouting_data = ingest_scouting_submissions(scouting_data, [first_scout, second_scout])
+
+    assert sorted(updated_scouting_data[Queries.SCOUT_ID]) == sorted(
+        [first_scout[Queries.SCOUT_ID], second_scout[Queries.SCOUT_ID]]
+    )
+
+
+def test_scouting_data_parsed_before_submissions_were_keyed_is_parsed_again(submissions):
+    scouting_data = _parse_scouting_submissions(submissions[:30]).drop(columns=Queries.SUBMISSION_KEY)
+
+    assert len(ingest_scouting_submissions(scouting_data, submissions)) == len(submissions)
+
+
+def test_raw_control_characters_in_notes_are_parsed_and_removed(submissions):
+    submission = submissions[0] | {Queries.AUTO_NOTES: "NOTE_PLACEHOLDER"}
+    payload = json.dumps([submission]).replace("NOTE_PLACEHOLDER", "Fast\ncycles\tnear the amp\x07").encode()
+    assert b"\n" in payload and b"\t" in payload  # Raw control characters, not JSON escapes
+
+    scouting_data = _parse_scouting_data(payload)
+
+    assert scouting_data[Queries.AUTO_NOTES].tolist() == ["Fastcyclesnear the amp"]
+
+
+def test_raw_control_characters_in_notes_are_parsed_and_removed_from_note_scouting_data(submissions):
+    submission = submissions[0] | {Queries.AUTO_NOTES: "NOTE_PLACEHOLDER"}
+    payload = json.dumps([submission]).replace("NOTE_PLACEHOLDER", "Fast\ncycles\tnear the amp\x07").encode()
+    assert b"\n" in payload and b"\t" in payload  # Raw control characters, not JSON escapes
+
+    note_scouting_data = _parse_note_scouting_data(payload)
+
+    assert note_scouting_data[Queries.AUTO_NOTES].tolist() == ["Fastcyclesnear the amp"]
+
+
+def test_note_scouting_data_that_fails_to_parse_falls_back_to_no_notes(submissions, monkeypatch, tmp_path):
+    source = LocalDirectorySource(str(tmp_path))
+    scouting_data_path = source.location(DataKind.SCOUTING_DATA)
+    os.makedirs(os.path.dirname(scouting_data_path), exist_ok=True)
+
+    with open(scouting_data_path, "w") as file:
+        json.dump([submission | {Queries.MATCH_KEY: "practice"} for submission in submissions], file)
+
+    monkeypatch.setattr(functions, "fetcher", ConditionalFetcher(str(tmp_path / "cache"), str(tmp_path / "snapshots")))
+    monkeypatch.setitem(functions._data_sources, DataKind.SCOUTING_DATA, source)
+
+    note_scouting_data = functions._fetch_note_scouting_data()
+
+    assert note_scouting_data.empty
+    assert functions.note_scouting_data_for_team(submissions[0][Queries.TEAM_NUMBER], note_scouting_data).empty
@@ -1,5 +1,14 @@
 from .calculated_stats import *
 from .components import *
 from .constants import *
+from .data_sources import *
+from .fetching import *
 from .functions import *
 from .graphing import *
+from .match_predictions import *
+from .profiling import *
+from .quantile_stats import *
+from .ranking_simulation import *
+from .refreshing import *
+from .result_cache import *
+from .snapshots import *
@@ -6,6 +6,7 @@ import numpy as np
 from numpy import percentile
 from pandas import DataFrame, Series
 
+from .constants import Queries
 from .functions import retrieve_team_list
 
 
@@ -15,6 +16,40 @@ class BaseCalculatedStats:
     def __init__(self, data: DataFrame):
         self.data = data
 
+    @property
+    def data(self) -> DataFrame:
+        """The scouting data that statistics are calculated from."""
+        return self._data
+
+    @data.setter
+    def data(self, data: DataFrame) -> None:
+        """Sets the scouting data and rebuilds the per-team row index for the new snapshot.
+
+        The rows are stably sorted by team so that each team's submissions form one contiguous block (still in
+        match order), letting lookups slice that block instead of scanning every row in the event.
+
+        :param data: The scouting data to calculate statistics from.
+        """
+        self._data = data
+
+        if Queries.TEAM_NUMBER in data.columns:
+            self._data_by_team = data.sort_values(by=Queries.TEAM_NUMBER, kind="stable")
+            self._team_index = {
+                team: slice(positions[0], positions[-1] + 1)
+                for team, positions in self._data_by_team.groupby(Queries.TEAM_NUMBER, sort=False).indices.items()
+            }
+        else:
+            self._data_by_team = data
+            self._team_index = {}
+
+    def data_for_team(self, team_number: int) -> DataFrame:
+        """Retrieves the submissions within the scouting data for a certain team using the per-team row index.
+
+        :param team_number: The number of the team to retrieve the submissions for.
+        :return: A dataframe containing the submissions within the scouting data for the team passed in.
+        """
+        return self._data_by_team.iloc[self._team_index.get(team_number, slice(0, 0))]
+
     # Percentile methods
     def quantile_stat(self, quantile: float, predicate: Callable) -> float:
         """Calculates a scalar value for a percentile of a dataset.
@@ -54,4 +89,55 @@ class BaseCalculatedStats:
         return np.array([
             (x + y + z if reduce_with_sum else (x, y, z))
             for x in dataset_x for y in dataset_y for z in dataset_z
-        ])
\ No newline at end of file
+        ])
+
+    def sum_distribution(self, *datasets: list) -> tuple[np.ndarray, np.ndarray]:
+        """Calculates the exact distribution of the sum of one value drawn from each dataset (eg an alliance's total cycles).
+
+        Rather than materializing every combination like `cartesian_product`, each dataset is turned into a histogram
+        of its integer values and the histograms are convolved together, so any number of datasets can be combined.
+        Missing values (NaN) never contribute to a sum, mirroring how they fail every comparison in a cartesian product.
+
+        :param datasets: The datasets (integer-valued) to add together, such as each team's cycles by match.
+        :return: The possible sums and the number of combinations that reach each sum.
+        """
+        smallest_sum = 0
+        combinations = np.ones(1, dtype=np.int64)
+
+        for dataset in datasets:
+            values = np.asarray(dataset, dtype=float)
+            values = values[~np.isnan(values)]
+
+            if not len(values):
+                return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+            if not np.array_equal(values, np.round(values)):
+                raise ValueError("Sum distributions can only be calculated for integer-valued datasets.")
+
+            values = values.astype(np.int64)
+            smallest_value = values.min()
+            smallest_sum += smallest_value
+            combinations = np.convolve(combinations, np.bincount(values - smallest_value))
+
+        return np.arange(smallest_sum, smallest_sum + len(combinations)), combinations
+
+    def chance_of_sum_at_least(self, threshold: float, *datasets: list) -> float:
+        """Calculates the chance that the sum of one value drawn from each dataset is at least the threshold.
+
+        :param threshold: The value that the sum must reach.
+        :param datasets: The datasets (integer-valued) to add together, such as each team's cycles by match.
+        :return: A float from 0 to 1 representing the chance of the sum reaching the threshold.
+        """
+        total_combinations = np.prod([len(dataset) for dataset in datasets], dtype=float)
+
+        if not total_combinations:
+            return 0.0
+
+        sums, combinations = self.sum_distribution(*datasets)
+        combinations_reaching_threshold = combinations[::-1].cumsum()[::-1]
+        first_sum_reaching_threshold = np.searchsorted(sums, threshold, side="left")
+
+        if first_sum_reaching_threshold >= len(sums):
+            return 0.0
+
+        return float(combinations_reaching_threshold[first_sum_reaching_threshold] / total_combinations)
@@ -5,24 +5,91 @@ from functools import reduce
 from typing import Callable
 
 import numpy as np
-from numpy import percentile
+import streamlit as st
 from pandas import DataFrame, Series, isna
-from scipy.integrate import quad
 from scipy.stats import norm
 
 
 from .base_calculated_stats import BaseCalculatedStats
-from .constants import Criteria, Queries
-from .functions import _convert_to_float_from_numpy_type, scouting_data_for_team, retrieve_team_list, retrieve_pit_scouting_data
-
-__all__ = ["CalculatedStats"]
-
-
+from .constants import Criteria, GeneralConstants, Queries
+from .functions import (
+    _convert_to_float_from_numpy_type,
+    add_derived_scouting_fields,
+    EventData,
+    load_event_data,
+    map_criteria,
+    retrieve_team_list,
+    retrieve_pit_scouting_data
+)
+from .profiling import profile_methods, profiled
+from .quantile_stats import QuantileStats
+from .result_cache import shared_result
+
+__all__ = ["CalculatedStats", "retrieve_calculated_stats"]
+
+
+@profile_methods("stats")
 class CalculatedStats(BaseCalculatedStats):
     """Utility class for calculating statistics in an event."""
 
-    def __init__(self, data: DataFrame):
+    # How each event-wide statistic in `event_table` aggregates its per-submission values.
+    EVENT_STAT_AGGREGATIONS = {
+        "matches_scouted": "count",
+        "average_points_contributed": "mean",
+        "average_auto_points": "mean",
+        "average_teleop_points": "mean",
+        "average_endgame_points": "mean",
+        "average_cycles": "mean",
+        "average_auto_cycles": "mean",
+        "average_teleop_cycles": "mean",
+        "average_cycles_for_AutoSpeaker": "mean",
+        "average_cycles_for_AutoAmp": "mean",
+        "average_cycles_for_TeleopSpeaker": "mean",
+        "average_cycles_for_TeleopAmp": "mean",
+        "average_cycles_for_TeleopTrap": "mean",
+        "average_cycles_for_TeleopPassing": "mean",
+        "average_cycles_for_AutoSpeaker+TeleopSpeaker": "mean",
+        "average_cycles_for_AutoAmp+TeleopAmp": "mean",
+        "average_feeding_cycles_without_full_field": "mean",
+        "average_potential_amplification_periods": "mean",
+        "average_coop_bonus_rate": "mean",
+        "average_driver_rating": "mean",
+        "average_defense_time": "mean",
+        "average_defense_skill": "mean",
+        "average_counter_defense_skill": "mean",
+        "times_left_starting_zone": "sum",
+        "times_went_to_centerline": "sum",
+        "times_climbed": "sum",
+        "times_harmonized": "sum",
+        "times_disabled": "sum"
+    }
+
+    # Boolean fields whose `cumulative_stat` is read from `event_table`.
+    BOOLEAN_EVENT_STATS = {
+        Queries.LEFT_STARTING_ZONE: "times_left_starting_zone",
+        Queries.AUTO_USED_CENTERLINE: "times_went_to_centerline",
+        Queries.CLIMBED_CHAIN: "times_climbed",
+        Queries.HARMONIZED_ON_CHAIN: "times_harmonized",
+        Queries.DISABLE: "times_disabled"
+    }
+
+    def __init__(self, data: DataFrame, version: str | None = None):
         super().__init__(data)
+        self.version = version  # The version of the event data, which `shared_result` shares results by
+
+    @BaseCalculatedStats.data.setter
+    def data(self, data: DataFrame) -> None:
+        """Sets the scouting data, deriving its point/cycle fields if missing, rebuilding the per-team row index and clearing the event-wide caches.
+
+        :param data: The scouting data to calculate statistics from.
+        """
+        if Queries.TEAM_NUMBER in data.columns and Queries.TOTAL_POINTS not in data.columns:
+            data = add_derived_scouting_fields(data)
+
+        BaseCalculatedStats.data.fset(self, data)
+        self._event_table = None
+        self._point_distributions = None
+        self.version = None  # The data no longer matches a version of the event data
 
     # Point contribution methods
     @_convert_to_float_from_numpy_type
@@ -34,7 +101,7 @@ class CalculatedStats(BaseCalculatedStats):
 
         :param team_number: The team number to calculate the average points contributed for.
         """
-        return self.points_contributed_by_match(team_number).mean()
+        return self._event_stat(team_number, "average_points_contributed")
 
     def points_contributed_by_match(self, team_number: int, mode: str = "") -> Series:
         """Returns the points contributed by match for a team.
@@ -48,46 +115,16 @@ class CalculatedStats(BaseCalculatedStats):
         :param mode: Optional argument defining which mode to return the total points for (Auto/Teleop)
         :return: A Series containing the points contributed by said team per match.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
-
-        # Autonomous calculations
-        auto_speaker_points = team_data[Queries.AUTO_SPEAKER].apply(lambda cycle: cycle * 5)
-        auto_amp_points = team_data[Queries.AUTO_AMP].apply(lambda cycle: cycle * 2)
-        auto_leave_points = team_data[Queries.LEFT_STARTING_ZONE].apply(
-            lambda left_starting_zone: Criteria.BOOLEAN_CRITERIA[left_starting_zone]
-        )
-        total_auto_points = auto_speaker_points + auto_amp_points + auto_leave_points
-
-        # Teleop calculations
-        teleop_speaker_points = team_data[Queries.TELEOP_SPEAKER].apply(lambda cycle: cycle * 2)
-        teleop_amp_points = team_data[Queries.TELEOP_AMP]
-        total_teleop_points = teleop_speaker_points + teleop_amp_points
-
-        # Endgame (stage) calculations
-        park_points = team_data[Queries.PARKED_UNDER_STAGE].apply(
-            lambda parking_state: Criteria.BOOLEAN_CRITERIA[parking_state]
-        )
-        climb_points = team_data[Queries.CLIMBED_CHAIN].apply(
-            lambda climbing_state: Criteria.BOOLEAN_CRITERIA[climbing_state] * 3
-        )
-        harmony_points = team_data[Queries.HARMONIZED_ON_CHAIN].apply(
-            lambda harmonized: Criteria.BOOLEAN_CRITERIA[harmonized] * 2
-        )
-        trap_points = team_data[Queries.TELEOP_TRAP].apply(lambda cycle: cycle * 5)
-        total_endgame_points = park_points + climb_points + harmony_points + trap_points
+        team_data = self.data_for_team(team_number)
 
         if mode == Queries.AUTO:
-            return total_auto_points
+            return team_data[Queries.AUTO_POINTS]
         elif mode == Queries.TELEOP:
-            return total_teleop_points
+            return team_data[Queries.TELEOP_POINTS]
         elif mode == Queries.ENDGAME:
-            return total_endgame_points
+            return team_data[Queries.ENDGAME_POINTS]
 
-        return (
-            total_auto_points
-            + total_teleop_points
-            + total_endgame_points
-        )
+        return team_data[Queries.TOTAL_POINTS]
 
     # Cycle calculation methods
     @_convert_to_float_from_numpy_type
@@ -101,10 +138,12 @@ class CalculatedStats(BaseCalculatedStats):
         :param mode: The mode to calculate said cycles for (Auto/Teleop)
         :return: A float representing the average cycles for said team in the mode specified.
         """
-        if mode is not None:
-            return self.cycles_by_match(team_number, mode).mean()
+        if mode == Queries.AUTO:
+            return self._event_stat(team_number, "average_auto_cycles")
+        elif mode == Queries.TELEOP:
+            return self._event_stat(team_number, "average_teleop_cycles")
         else:
-            return (self.cycles_by_match(team_number, Queries.AUTO) + self.cycles_by_match(team_number, Queries.TELEOP)).mean()
+            return self._event_stat(team_number, "average_cycles")
 
     @_convert_to_float_from_numpy_type
     def average_passing_cycles(self, team_number) -> float:
@@ -129,6 +168,11 @@ class CalculatedStats(BaseCalculatedStats):
         :param structure: The structure to return cycles for (AutoSpeaker/AutoAmp/TeleopSpeaker/TeleopAmp/TeleopTrap)
         :return: A float representing the average cycles for said team in the structure specified.
         """
+        stat = f"average_cycles_for_{'+'.join(structure) if isinstance(structure, tuple) else structure}"
+
+        if stat in self.EVENT_STAT_AGGREGATIONS:
+            return self._event_stat(team_number, stat)
+
         return self.cycles_by_structure_per_match(team_number, structure).mean()
 
     def average_potential_amplification_periods(self, team_number: int) -> float:
@@ -140,7 +184,7 @@ class CalculatedStats(BaseCalculatedStats):
         The amplification periods that a team is capable of is decided by their auto + teleop amp cycles divided by two
         :param team_number: The team to determine the potential amplification periods for.
         """
-        return self.potential_amplification_periods_by_match(team_number).mean()
+        return self._event_stat(team_number, "average_potential_amplification_periods")
 
     def cycles_by_match(self, team_number: int, mode: str = None) -> Series:
         """Returns the cycles for a certain mode (autonomous/teleop) in a match
@@ -154,17 +198,14 @@ class CalculatedStats(BaseCalculatedStats):
         :param mode: The mode to return cycles by match for (Auto/Teleop)
         :return: A series containing the cycles per match for the mode specified.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
+        team_data = self.data_for_team(team_number)
 
         if mode == Queries.AUTO:
-            return team_data[Queries.AUTO_SPEAKER] + team_data[Queries.AUTO_AMP]
+            return team_data[Queries.AUTO_CYCLES]
         elif mode == Queries.TELEOP:
-            return team_data[Queries.TELEOP_SPEAKER] + team_data[Queries.TELEOP_AMP] + team_data[Queries.TELEOP_TRAP]
+            return team_data[Queries.TELEOP_CYCLES]
         else:
-            return (
-                team_data[Queries.AUTO_SPEAKER] + team_data[Queries.AUTO_AMP]
-                + team_data[Queries.TELEOP_SPEAKER] + team_data[Queries.TELEOP_AMP] + team_data[Queries.TELEOP_TRAP]
-            )
+            return team_data[Queries.TOTAL_CYCLES]
 
     def passing_shots_by_match(self, team_number: int) -> Series:
         """Returns the cycles for a certain mode (autonomous/teleop) in a match
@@ -178,7 +219,7 @@ class CalculatedStats(BaseCalculatedStats):
         :param mode: The mode to return cycles by match for (Auto/Teleop)
         :return: A series containing the cycles per match for the mode specified.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
+        team_data = self.data_for_team(team_number)
 
         return team_data[Queries.TELEOP_PASSING]
 
@@ -194,7 +235,7 @@ class CalculatedStats(BaseCalculatedStats):
         :param structure: The structure to return cycles for (AutoSpeaker/AutoAmp/TeleopSpeaker/TeleopAmp/TeleopTrap)
         :return: A series containing the cycles per match for the structure specified.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
+        team_data = self.data_for_team(team_number)
 
         if isinstance(structure, tuple):
             return reduce(lambda x, y: x + y, [team_data[struct] for struct in structure])
@@ -212,7 +253,7 @@ class CalculatedStats(BaseCalculatedStats):
         The amplification periods that a team is capable of is decided by their auto + teleop amp cycles divided by two
         :param team_number: The team to determine the potential amplification periods for.
         """
-        return self.cycles_by_structure_per_match(team_number, (Queries.AUTO_AMP, Queries.TELEOP_AMP)) // 2
+        return self.data_for_team(team_number)[Queries.POTENTIAL_AMPLIFICATION_PERIODS]
 
     # Alliance-wide methods
     @_convert_to_float_from_numpy_type
@@ -226,7 +267,7 @@ class CalculatedStats(BaseCalculatedStats):
         :param team_number: The team to calculate the average coop bonus rate for.
         :return: A float representing the % rate of the alliance reaching the coopertition bonus.
         """
-        return self.reaches_coop_bonus_by_match(team_number).astype(int).mean()
+        return self._event_stat(team_number, "average_coop_bonus_rate")
 
     def reaches_coop_bonus_by_match(self, team_number: int) -> Series:
         """Returns whether three teams within an alliance are able to reach the coopertition bonus within the first
@@ -240,12 +281,8 @@ class CalculatedStats(BaseCalculatedStats):
         :param team_number: The team to determine the coop bonus rate by match for.
         :return: Whether or not the alliance would reach the coopertition bonus requirement of one amp cycle in 45 sec.
         """
-        auto_amp_sufficient = self.cycles_by_structure_per_match(
-            team_number, Queries.AUTO_AMP
-        ).apply(lambda total_auto_amp: total_auto_amp >= 1)
-        teleop_amp_sufficient = (
-            self.cycles_by_structure_per_match(team_number, Queries.TELEOP_AMP)
-        ).apply(lambda total_teleop_amp: total_teleop_amp >= 1)
+        auto_amp_sufficient = self.cycles_by_structure_per_match(team_number, Queries.AUTO_AMP) >= 1
+        teleop_amp_sufficient = self.cycles_by_structure_per_match(team_number, Queries.TELEOP_AMP) >= 1
 
         return auto_amp_sufficient | teleop_amp_sufficient
 
@@ -257,16 +294,12 @@ class CalculatedStats(BaseCalculatedStats):
         :param team_number: The team to determine the driver rating for.
         :return: A float representing the average driver rating of said team.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.DRIVER_RATING].apply(
-            lambda driver_rating: Criteria.DRIVER_RATING_CRITERIA.get(driver_rating, float("nan"))
-        ).mean()
+        return self._event_stat(team_number, "average_driver_rating")
 
     @_convert_to_float_from_numpy_type
     def average_feeding_cycles_without_full_field(self, team_number: int) -> float:
         """Returns the average feeding cycles without matches where they ran full field cycles."""
-        team_scouting_data = scouting_data_for_team(team_number, self.data)
-        passing_cycles = team_scouting_data[team_scouting_data[Queries.TELEOP_PASSING] != 0][Queries.TELEOP_PASSING]
-        return (passing_cycles.mean()) if not passing_cycles.empty else 0
+        return self._event_stat(team_number, "average_feeding_cycles_without_full_field", default=0)
 
     @_convert_to_float_from_numpy_type
     def average_defense_rating(self, team_number: int) -> float:
@@ -276,9 +309,7 @@ class CalculatedStats(BaseCalculatedStats):
         :return: A series with the teams defense data.
         """
 
-        return scouting_data_for_team(team_number, self.data)[Queries.DRIVER_RATING].apply(
-            lambda driver_rating: Criteria.BASIC_RATING_CRITERIA.get(driver_rating, float("nan"))
-        )
+        return map_criteria(self.data_for_team(team_number)[Queries.DRIVER_RATING], Criteria.BASIC_RATING_CRITERIA)
 
     @_convert_to_float_from_numpy_type
     def average_defense_time(self, team_number: int) -> float:
@@ -287,9 +318,7 @@ class CalculatedStats(BaseCalculatedStats):
         :param team_number: The team to determine the defense time for.
         :return: A float representing the average defense time of said team.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.DEFENSE_TIME].apply(
-            lambda defense_time: Criteria.DEFENSE_TIME_CRITERIA.get(defense_time, float("nan"))
-        ).mean()
+        return self._event_stat(team_number, "average_defense_time")
 
     @_convert_to_float_from_numpy_type
     def average_defense_skill(self, team_number: int) -> float:
@@ -298,9 +327,7 @@ class CalculatedStats(BaseCalculatedStats):
         :param team_number: The team to determine the defense skill for.
         :return: A float representing the average defense skill of said team.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.DEFENSE_SKILL].apply(
-            lambda defense_skill: Criteria.BASIC_RATING_CRITERIA.get(defense_skill, float("nan"))
-        ).mean()
+        return self._event_stat(team_number, "average_defense_skill")
 
     @_convert_to_float_from_numpy_type
     def average_counter_defense_skill(self, team_number: int) -> float:
@@ -309,9 +336,7 @@ class CalculatedStats(BaseCalculatedStats):
         :param team_number: The team to determine the counter defense skill for.
         :return: A float representing the average counter defense skill of said team.
         """
-        return scouting_data_for_team(team_number, self.data)[Queries.COUNTER_DEFENSE_SKIll].apply(
-            lambda counter_defense_skill: Criteria.BASIC_RATING_CRITERIA.get(counter_defense_skill, float("nan"))
-        ).mean()
+        return self._event_stat(team_number, "average_counter_defense_skill")
     
     def drivetrain_width_by_team(self, team_number: int) -> float:
         """Returns a float representing the teams drivetrain width
@@ -325,17 +350,134 @@ class CalculatedStats(BaseCalculatedStats):
                         ].iloc[0]["Drivetrain Width"]
 
     # Percentile methods
-    def quantile_stat(self, quantile: float, predicate: Callable) -> float:
+    def quantile_stat(self, quantile: float, predicate: Callable | str) -> float:
         """Calculates a scalar value for a percentile of a dataset.
 
         Used for comparisons between teams (eg passing in 0.5 will return the median).
 
         :param quantile: Quantile used to find the scalar value at.
-        :param predicate: Predicate called per team in the scouting data to create the dataset (self and team number must be arguments).
+        :param predicate: Predicate called per team in the scouting data to create the dataset (self and team number must be arguments), or the name of a statistic in `event_table`.
         :return: A float representing the scalar value for a percentile of a dataset.
         """
-        dataset = [predicate(self, team) for team in retrieve_team_list()]
-        return percentile(dataset, quantile * 100)
+        return self.quantile_stats({"stat": predicate}, quantiles=[quantile]).threshold("stat", quantile)
+
+    @shared_result
+    def quantile_stats(
+        self,
+        stats: dict[str, Callable | str],
+        quantiles: list[float] = (0.25, 0.5, 0.75)
+    ) -> QuantileStats:
+        """Calculates the quantiles of several statistics across every team, evaluating each statistic only once.
+
+        Results are only shared across sessions (see `shared_result`) when every statistic is named by its column in
+        `event_table`; calls with a predicate are calculated every time.
+
+        :param stats: Maps the name of each statistic to either a predicate called per team (self and team number must be arguments) or the name of a statistic in `event_table`.
+        :param quantiles: The quantiles to find the thresholds at (eg 0.5 for the median).
+        :return: A `QuantileStats` containing the thresholds and percentile ranks of each statistic.
+        """
+        teams = retrieve_team_list(self.data)
+        event_table = self.event_table()
+
+        return QuantileStats(
+            DataFrame(
+                {
+                    name: (
+                        event_table[stat].reindex(teams)
+                        if isinstance(stat, str)
+                        else [stat(self, team) for team in teams]
+                    )
+                    for name, stat in stats.items()
+                },
+                index=teams
+            ),
+            quantiles
+        )
+
+    # Event-wide methods
+    def event_table(self, stats: list[str] | None = None) -> DataFrame:
+        """Calculates event-wide statistics for every team in one vectorized pass over the scouting data.
+
+        The table is built once per data snapshot and reused by the per-team `average_*` methods.
+
+        :param stats: The statistics to return (keys of `EVENT_STAT_AGGREGATIONS`), defaults to every statistic.
+        :return: A dataframe indexed by team number with a column per statistic requested.
+        """
+        if self._event_table is None:
+            event_table = self._event_stats_by_submission().groupby(
+                self.data[Queries.TEAM_NUMBER], sort=True
+            ).agg(self.EVENT_STAT_AGGREGATIONS)
+
+            # Teams that never fed have an average of zero feeding cycles rather than no average.
+            event_table["average_feeding_cycles_without_full_field"] = (
+                event_table["average_feeding_cycles_without_full_field"].fillna(0)
+            )
+            self._event_table = event_table
+
+        return self._event_table if stats is None else self._event_table[list(stats)]
+
+    def _event_stat(self, team_number: int, stat: str, default: float = float("nan")) -> float:
+        """Retrieves an event-wide statistic for a team from `event_table`.
+
+        :param team_number: The team to retrieve the statistic for.
+        :param stat: The statistic to retrieve (a key of `EVENT_STAT_AGGREGATIONS`).
+        :param default: The value returned if the team hasn't been scouted.
+        :return: The statistic for said team.
+        """
+        event_table = self.event_table()
+        return event_table.at[team_number, stat] if team_number in event_table.index else default
+
+    def _event_stats_by_submission(self) -> DataFrame:
+        """Calculates the per-submission values that each statistic in `event_table` aggregates.
+
+        :return: A dataframe aligned with the scouting data containing a column per event-wide statistic.
+        """
+        data = self.data
+        boolean_fields = {
+            field: map_criteria(data[field], Criteria.BOOLEAN_CRITERIA, default=0)
+            for field in (
+                Queries.LEFT_STARTING_ZONE, Queries.AUTO_USED_CENTERLINE,
+                Queries.CLIMBED_CHAIN, Queries.HARMONIZED_ON_CHAIN, Queries.DISABLE
+            )
+        }
+
+        return DataFrame(
+            {
+                "matches_scouted": data[Queries.TEAM_NUMBER],
+                "average_points_contributed": data[Queries.TOTAL_POINTS],
+                "average_auto_points": data[Queries.AUTO_POINTS],
+                "average_teleop_points": data[Queries.TELEOP_POINTS],
+                "average_endgame_points": data[Queries.ENDGAME_POINTS],
+                "average_cycles": data[Queries.TOTAL_CYCLES],
+                "average_auto_cycles": data[Queries.AUTO_CYCLES],
+                "average_teleop_cycles": data[Queries.TELEOP_CYCLES],
+                "average_cycles_for_AutoSpeaker": data[Queries.AUTO_SPEAKER],
+                "average_cycles_for_AutoAmp": data[Queries.AUTO_AMP],
+                "average_cycles_for_TeleopSpeaker": data[Queries.TELEOP_SPEAKER],
+                "average_cycles_for_TeleopAmp": data[Queries.TELEOP_AMP],
+                "average_cycles_for_TeleopTrap": data[Queries.TELEOP_TRAP],
+                "average_cycles_for_TeleopPassing": data[Queries.TELEOP_PASSING],
+                "average_cycles_for_AutoSpeaker+TeleopSpeaker": data[Queries.AUTO_SPEAKER] + data[Queries.TELEOP_SPEAKER],
+                "average_cycles_for_AutoAmp+TeleopAmp": data[Queries.AUTO_AMP] + data[Queries.TELEOP_AMP],
+                "average_feeding_cycles_without_full_field": data[Queries.TELEOP_PASSING].where(
+                    data[Queries.TELEOP_PASSING] != 0
+                ),
+                "average_potential_amplification_periods": data[Queries.POTENTIAL_AMPLIFICATION_PERIODS],
+                "average_coop_bonus_rate": ((data[Queries.AUTO_AMP] >= 1) | (data[Queries.TELEOP_AMP] >= 1)).astype(int),
+                "average_driver_rating": map_criteria(data[Queries.DRIVER_RATING], Criteria.DRIVER_RATING_CRITERIA),
+                "average_defense_time": map_criteria(data[Queries.DEFENSE_TIME], Criteria.DEFENSE_TIME_CRITERIA),
+                "average_defense_skill": map_criteria(data[Queries.DEFENSE_SKILL], Criteria.BASIC_RATING_CRITERIA),
+                "average_counter_defense_skill": map_criteria(
+                    data[Queries.COUNTER_DEFENSE_SKIll], Criteria.BASIC_RATING_CRITERIA
+                ),
+                "times_left_starting_zone": boolean_fields[Queries.LEFT_STARTING_ZONE],
+                "times_went_to_centerline": boolean_fields[Queries.AUTO_USED_CENTERLINE],
+                "times_climbed": boolean_fields[Queries.CLIMBED_CHAIN],
+                "times_harmonized": boolean_fields[Queries.HARMONIZED_ON_CHAIN],
+                "times_disabled": boolean_fields[Queries.DISABLE]
+            },
+            index=data.index
+        )
 
     # General methods
     @_convert_to_float_from_numpy_type
@@ -358,6 +500,9 @@ class CalculatedStats(BaseCalculatedStats):
         :param criteria: An optional criteria used to determine what the weightage of the statistic is.
         :return: A float representing the "cumulative statistic".
         """
+        if criteria is Criteria.BOOLEAN_CRITERIA and stat in self.BOOLEAN_EVENT_STATS:
+            return self._event_stat(team_number, self.BOOLEAN_EVENT_STATS[stat], default=0)
+
         return self.stat_per_match(team_number, stat, criteria).sum()
 
     def stat_per_match(self, team_number: int, stat: str, criteria: dict | None = None) -> Series:
@@ -368,10 +513,8 @@ class CalculatedStats(BaseCalculatedStats):
         :param criteria: An optional criteria used to determine what the weightage of the statistic is.
         :return: A series representing the statistic for the team for each match.
         """
-        team_data = scouting_data_for_team(team_number, self.data)
-        return team_data[stat].apply(
-            lambda datum: criteria.get(datum, 0) if criteria is not None else datum
-        )
+        team_data = self.data_for_team(team_number)
+        return map_criteria(team_data[stat], criteria, default=0) if criteria is not None else team_data[stat]
 
     def driving_index(self, team_number: int) -> float:
         """Determines how fast a team is based on multiplying their teleop cycles by their counter defense rating
@@ -389,37 +532,27 @@ class CalculatedStats(BaseCalculatedStats):
 
     # Methods for ranking simulation
     def chance_of_coop_bonus(self, alliance: list[int]) -> float:
-        """Determines the chance of the coop bonus using all possible permutations with an alliance.
+        """Determines the chance of the coop bonus using the distribution of coop bonuses reached within an alliance.
 
-        :param alliance: The three teams on the alliance.
+        :param alliance: The teams on the alliance.
         """
-        coop_by_match = [self.reaches_coop_bonus_by_match(team) for team in alliance]
-        possible_coop_combos = self.cartesian_product(*coop_by_match)
-        return len([combo for combo in possible_coop_combos if any(combo)]) / len(possible_coop_combos)
+        return self.chance_of_sum_at_least(1, *[self.reaches_coop_bonus_by_match(team) for team in alliance])
 
     def chance_of_bonuses(self, alliance: list[int]) -> tuple[float, float, float]:
-        """Determines the chance of the coopertition bonus, the melody bonus and the ensemble bonus using all possible permutations with an alliance.
+        """Determines the chance of the coopertition bonus, the melody bonus and the ensemble bonus using the distribution of cycles and endgame points of an alliance.
 
-        :param alliance: The three teams on the alliance.
+        :param alliance: The teams on the alliance.
         """
         chance_of_coop = self.chance_of_coop_bonus(alliance)
-        cycles_for_alliance = [self.cycles_by_match(team) for team in alliance]
 
         # Melody RP calculations
-        possible_cycle_combos = self.cartesian_product(*cycles_for_alliance, reduce_with_sum=True)
-        chance_of_reaching_21_cycles = (
-            len([combo for combo in possible_cycle_combos if combo >= 21]) / len(possible_cycle_combos)
-        )
-        chance_of_reaching_25_cycles = (
-            len([combo for combo in possible_cycle_combos if combo >= 25]) / len(possible_cycle_combos)
-        )
+        cycles_for_alliance = [self.cycles_by_match(team) for team in alliance]
+        chance_of_reaching_21_cycles = self.chance_of_sum_at_least(21, *cycles_for_alliance)
+        chance_of_reaching_25_cycles = self.chance_of_sum_at_least(25, *cycles_for_alliance)
 
         # Ensemble RP calculations
         endgame_points_by_team = [self.points_contributed_by_match(team, Queries.ENDGAME) for team in alliance]
-        possible_endgame_combos = self.cartesian_product(*endgame_points_by_team, reduce_with_sum=True)
-        chance_of_reaching_10_points = (
-            len([combo for combo in possible_endgame_combos if combo >= 10]) / len(possible_endgame_combos)
-        )
+        chance_of_reaching_10_points = self.chance_of_sum_at_least(10, *endgame_points_by_team)
 
         ability_to_climb_by_team = [True in self.stat_per_match(team, Queries.CLIMBED_CHAIN) for team in alliance]
 
@@ -434,69 +567,89 @@ class CalculatedStats(BaseCalculatedStats):
             chance_of_ensemble_rp
         )
         
+    @shared_result
     def chance_of_winning(self, alliance_one: list[int], alliance_two: list[int]) -> tuple:
-        """Returns the chance of winning between two alliances using integrals."""
-        alliance_one_points = [
-            self.points_contributed_by_match(team)
-            for team in alliance_one
-        ]
-        alliance_two_points = [
-            self.points_contributed_by_match(team)
-            for team in alliance_two
-        ]
-
-        # Calculate mean and standard deviation of the point distribution of the red alliance.
-        alliance_one_std = (
-                sum(
-                    [
-                        np.std(team_distribution) ** 2
-                        for team_distribution in alliance_one_points
-                    ]
-                )
-                ** 0.5
-        )
-        alliance_one_mean = sum(
-            [
-                np.mean(team_distribution)
-                for team_distribution in alliance_one_points
-            ]
-        )
+        """Returns the chance of winning between two alliances (wrapper around `predict_matchups`).
 
-        # Calculate mean and standard deviation of the point distribution of the blue alliance.
-        alliance_two_std = (
-                sum(
-                    [
-                        np.std(team_distribution) ** 2
-                        for team_distribution in alliance_two_points
-                    ]
-                )
-                ** 0.5
-        )
-        alliance_two_mean = sum(
-            [
-                np.mean(team_distribution)
-                for team_distribution in alliance_two_points
-            ]
-        )
+        :param alliance_one: The teams on the first alliance.
+        :param alliance_two: The teams on the second alliance.
+        :return: The odds of each alliance winning, followed by the predicted score of each alliance.
+        """
+        return tuple(float(prediction[0]) for prediction in self.predict_matchups([alliance_one], [alliance_two]))
+
+    def predict_matchups(
+        self,
+        red_alliances: list[list[int]],
+        blue_alliances: list[list[int]]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Predicts the odds of winning and the scores of many matchups at once.
+
+        Each alliance's score is modeled as a normal distribution whose mean and variance are the sums of its teams'
+        means and variances of points contributed, so the odds of Red winning are the chance that Red - Blue > 0.
+
+        :param red_alliances: The teams on the Red Alliance of each matchup (one row per matchup).
+        :param blue_alliances: The teams on the Blue Alliance of each matchup (one row per matchup).
+        :return: The odds of Red winning, the odds of Blue winning, the predicted Red score and the predicted Blue score of each matchup.
+        """
+        red_alliance_means, red_alliance_variances = self._alliance_point_distributions(red_alliances)
+        blue_alliance_means, blue_alliance_variances = self._alliance_point_distributions(blue_alliances)
 
         # Calculate mean and standard deviation of the point distribution of red alliance - blue alliance
-        compared_std = (alliance_one_std ** 2 + alliance_two_std ** 2) ** 0.5
-        compared_mean = alliance_one_mean - alliance_two_mean
+        compared_mean = red_alliance_means - blue_alliance_means
+        compared_std = np.sqrt(red_alliance_variances + blue_alliance_variances)
 
         # Use sentinel value if there isn't enough of a distribution yet to determine standard deviation.
-        if not compared_std and compared_mean:
-            compared_std = abs(compared_mean)
-        elif not compared_std:
-            compared_std = 0.5
-
-        compared_distribution = norm(loc=compared_mean, scale=compared_std)
-
-        # Calculate odds of red/blue winning using integrals.
-        odds_of_red_winning = quad(
-            lambda x: compared_distribution.pdf(x), 0, np.inf
-        )[0]
-        odds_of_blue_winning = quad(
-            lambda x: compared_distribution.pdf(x), -np.inf, 0
-        )[0]
-
-        return odds_of_red_winning, odds_of_blue_winning, alliance_one_mean, alliance_two_mean
+        compared_std = np.where(
+            compared_std == 0,
+            np.where(compared_mean != 0, np.abs(compared_mean), 0.5),
+            compared_std
+        )
+
+        return (
+            norm.sf(0, loc=compared_mean, scale=compared_std),
+            norm.cdf(0, loc=compared_mean, scale=compared_std),
+            red_alliance_means,
+            blue_alliance_means
+        )
+
+    def _alliance_point_distributions(self, alliances: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+        """Sums the means and variances of points contributed by the teams on each alliance.
+
+        :param alliances: The teams on each alliance (one row per alliance).
+        :return: The mean and the variance of the points scored by each alliance (NaN if a team hasn't been scouted).
+        """
+        if self._point_distributions is None:
+            points_by_team = self.data[Queries.TOTAL_POINTS].groupby(self.data[Queries.TEAM_NUMBER])
+            self._point_distributions = DataFrame(
+                {"mean": points_by_team.mean(), "variance": points_by_team.var(ddof=0)}
+            )
+
+        alliances = np.asarray(alliances, dtype=np.int64)
+        alliances = alliances.reshape(len(alliances), -1 if alliances.size else 0)
+        positions = self._point_distributions.index.get_indexer(alliances.ravel()).reshape(alliances.shape)
+
+        # Teams that haven't been scouted are at position -1, which points to the NaN appended at the end.
+        means = np.append(self._point_distributions["mean"].to_numpy(dtype=float), np.nan)[positions]
+        variances = np.append(self._point_distributions["variance"].to_numpy(dtype=float), np.nan)[positions]
+
+        return means.sum(axis=1), variances.sum(axis=1)
+
+
+@st.cache_resource(max_entries=GeneralConstants.DATA_VERSIONS_TO_CACHE)
+def _calculated_stats_for_version(version: str, _scouting_data: DataFrame) -> CalculatedStats:
+    """Creates the `CalculatedStats` of a version of the event data."""
+    return CalculatedStats(_scouting_data, version)
+
+
+@profiled("data")
+def retrieve_calculated_stats(event_data: EventData | None = None) -> CalculatedStats:
+    """Retrieves the `CalculatedStats` of the event data, shared by every page and session using the same version.
+
+    Since the instance is shared, the statistics it computes (e.g. `event_table`) are only computed once per
+    version of the event data rather than once per rerun.
+
+    :param event_data: The event data to calculate statistics from, defaulting to the latest event data.
+    :return: The `CalculatedStats` of the event data's scouting data.
+    """
+    event_data = event_data or load_event_data()
+    return _calculated_stats_for_version(event_data.version, event_data.scouting_data)
@@ -2,9 +2,12 @@
 
 from streamlit.components.v1 import html
 
+from ..profiling import profiled
+
 __all__ = ["alliance_breakdown"]
 
 
+@profiled("components")
 def alliance_breakdown(
     team_numbers: list[int],
     average_points_contributed: list[int],
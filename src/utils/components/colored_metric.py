@@ -3,9 +3,12 @@
 from typing import Any, Callable
 from streamlit.components.v1 import html
 
+from ..profiling import profiled
+
 __all__ = ["colored_metric"]
 
 
+@profiled("components")
 def colored_metric(
     metric_title: str,
     metric_value: Any,
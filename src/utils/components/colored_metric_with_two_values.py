@@ -3,9 +3,12 @@
 from typing import Any, Callable
 from streamlit.components.v1 import html
 
+from ..profiling import profiled
+
 __all__ = ["colored_metric_with_two_values"]
 
 
+@profiled("components")
 def colored_metric_with_two_values(
     metric_title: str,
     metric_subtitle: str,
@@ -2,9 +2,12 @@
 
 from streamlit.components.v1 import html
 
+from ..profiling import profiled
+
 __all__ = ["win_percentages"]
 
 
+@profiled("components")
 def win_percentages(red_odds: float, blue_odds: float) -> None:
     """Creates a component used for match predictions to display the odds for a certain alliance at winning the match.
 
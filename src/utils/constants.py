@@ -1,5 +1,6 @@
 """Defines the constants for FalconVis."""
 
+import os
 from enum import Enum
 
 __all__ = [
@@ -7,7 +8,8 @@ __all__ = [
     "EventSpecificConstants",
     "GeneralConstants",
     "GraphType",
-    "Queries"
+    "Queries",
+    "ScoutingSchema"
 ]
 
 
@@ -19,6 +21,25 @@ class GeneralConstants:
         "Average Auto Cycles"
     ]
     SECONDS_TO_CACHE = 60 * 1.5
+    REFRESH_INTERVAL = SECONDS_TO_CACHE // 2
+    DATA_VERSIONS_TO_CACHE = 4
+    RESULTS_TO_CACHE = 2048  # Results of computations shared across sessions (see `ResultCache`)
+    FETCH_CACHE_DIRECTORY = "src/data/cache"
+    FETCH_TIMEOUT = 10
+    FETCH_POOL_SIZE = 8
+    SNAPSHOT_DIRECTORY = "src/data/snapshots"
+    REPORTS_DIRECTORY = "src/data/reports"
+    TBA_API_URL = "https://www.thebluealliance.com/api/v3"
+
+    # Where the event data is read from (see `create_data_sources`): "live" (GitHub and TBA), "local" (a directory
+    # laid out like `benchmarks.synthetic_event` writes an event) or "local_http" (a server serving such a directory).
+    LOCAL_DATA_DIRECTORY = os.getenv("FALCONVIS_LOCAL_DATA", "src/data/local")
+    LOCAL_SERVER_URL = os.getenv("FALCONVIS_LOCAL_SERVER", "http://localhost:8000")
+    DATA_SOURCE = os.getenv("FALCONVIS_DATA_SOURCE", "local" if os.getenv("FALCONVIS_LOCAL_DATA") else "live")
+
+    # Whether every rerun is profiled (see `start_profiling`), rather than only the reruns opened with `?profile=true`.
+    PROFILING_ENABLED = bool(os.getenv("FALCONVIS_PROFILE"))
+
     PRIMARY_COLOR = "#EFAE09"
     AVERAGE_FOUL_RATE = 1.06
 
@@ -77,6 +98,8 @@ class Queries:
     MATCH_KEY = "MatchKey"
     MATCH_NUMBER = "MatchNumber"
     TEAM_NUMBER = "TeamNumber"
+    SCOUT_ID = "ScoutId"  # Not sent by every scouting app (see `_submission_key`)
+    SUBMISSION_KEY = "SubmissionKey"  # Added when submissions are parsed, identifying each one
 
     AUTO_SPEAKER = "AutoSpeaker"
     AUTO_AMP = "AutoAmp"
@@ -99,6 +122,16 @@ class Queries:
     COUNTER_DEFENSE_SKIll = "CounterDefenseSkill"
     DISABLE = "Disabled"
 
+    # Fields derived from the scouting data when it's loaded
+    AUTO_POINTS = "AutoPoints"
+    TELEOP_POINTS = "TeleopPoints"
+    ENDGAME_POINTS = "EndgamePoints"
+    TOTAL_POINTS = "TotalPoints"
+    AUTO_CYCLES = "AutoCycles"
+    TELEOP_CYCLES = "TeleopCycles"
+    TOTAL_CYCLES = "TotalCycles"
+    POTENTIAL_AMPLIFICATION_PERIODS = "PotentialAmplificationPeriods"
+
     # Notes
     AUTO_NOTES = "AutoNotes"
     TELEOP_NOTES = "TeleopNotes"
@@ -162,3 +195,35 @@ class Criteria:
         "Poor": 2,
         "Very Poor": 1
     }
+
+
+class ScoutingSchema:
+    """The types each field in the scouting data is converted to when it's loaded (see `apply_scouting_schema`)."""
+
+    # Fields stored as booleans, converted from 0/1/"true"/"false"/True/False using `Criteria.BOOLEAN_CRITERIA`.
+    BOOLEAN_FIELDS = [
+        Queries.LEFT_STARTING_ZONE,
+        Queries.AUTO_USED_CENTERLINE,
+        Queries.PARKED_UNDER_STAGE,
+        Queries.CLIMBED_CHAIN,
+        Queries.HARMONIZED_ON_CHAIN,
+        Queries.DISABLE
+    ]
+
+    # Game piece counts, stored as small integers.
+    COUNT_FIELDS = {
+        Queries.AUTO_SPEAKER: "int16",
+        Queries.AUTO_AMP: "int16",
+        Queries.TELEOP_SPEAKER: "int16",
+        Queries.TELEOP_AMP: "int16",
+        Queries.TELEOP_TRAP: "int8",
+        Queries.TELEOP_PASSING: "int16"
+    }
+
+    # Ratings, stored as ordered categoricals whose categories are ordered by their weightage in the criteria.
+    RATING_FIELDS = {
+        Queries.DRIVER_RATING: Criteria.DRIVER_RATING_CRITERIA,
+        Queries.DEFENSE_TIME: Criteria.DEFENSE_TIME_CRITERIA,
+        Queries.DEFENSE_SKILL: Criteria.BASIC_RATING_CRITERIA,
+        Queries.COUNTER_DEFENSE_SKIll: Criteria.BASIC_RATING_CRITERIA
+    }
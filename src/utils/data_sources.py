@@ -0,0 +1,220 @@
+"""Defines the sources the event data can be read from (GitHub and TBA, a local directory or a local server)."""
+
+import os
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import NamedTuple
+
+from requests import RequestException, Session
+from requests.adapters import HTTPAdapter
+
+from .constants import EventSpecificConstants, GeneralConstants
+
+__all__ = [
+    "create_data_sources",
+    "DataKind",
+    "DataSource",
+    "DataUnavailableError",
+    "Fetched",
+    "GitHubSource",
+    "HTTPSource",
+    "LocalDirectorySource",
+    "LocalHTTPSource",
+    "local_path",
+    "pooled_session",
+    "TBASource"
+]
+
+_TBA_AUTH_KEY = "6lcmneN5bBDYpC47FolBxp2RZa4AbQCVpmKMSKw9x9btKt7da5yMzVamJYk0XDBm"  # For testing purposes
+
+
+class DataKind(Enum):
+    """The kinds of raw data retrieved for an event."""
+
+    SCOUTING_DATA = 0
+    PIT_SCOUTING_DATA = 1
+    EVENT_MATCHES = 2
+
+
+class Fetched(NamedTuple):
+    """The result of fetching a kind of data from a `DataSource`."""
+
+    payload: bytes | None  # None when the data hasn't changed since the version passed in
+    version: str | None  # Passed back in as `since` to only fetch the data again once it has changed
+
+
+class DataUnavailableError(RequestException):
+    """Raised when a source doesn't have a kind of data, handled like an unreachable server by callers."""
+
+
+def local_path(kind: DataKind) -> str:
+    """Returns where each kind of data is stored in a local directory (and served from by a local server).
+
+    The layout mirrors the URLs the data is retrieved from on GitHub and TBA.
+
+    :param kind: The kind of data.
+    :return: The path of the data relative to the local directory.
+    """
+    return {
+        DataKind.SCOUTING_DATA: os.path.basename(EventSpecificConstants.URL),
+        DataKind.PIT_SCOUTING_DATA: os.path.basename(EventSpecificConstants.PIT_SCOUTING_URL),
+        DataKind.EVENT_MATCHES: f"tba/event/{EventSpecificConstants.EVENT_CODE}/matches"
+    }[kind]
+
+
+def pooled_session() -> Session:
+    """Creates a session keeping enough connections alive per host for every source to be fetched at once."""
+    session = Session()
+    adapter = HTTPAdapter(
+        pool_connections=GeneralConstants.FETCH_POOL_SIZE,
+        pool_maxsize=GeneralConstants.FETCH_POOL_SIZE
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# The session shared by every HTTP source, so requests to the same host reuse the same connections.
+_shared_session = pooled_session()
+
+
+class DataSource(ABC):
+    """The base class for every source of event data."""
+
+    @abstractmethod
+    def location(self, kind: DataKind) -> str:
+        """Returns where a kind of data is read from (e.g. its URL), which identifies it in the fetch cache.
+
+        :param kind: The kind of data.
+        :return: The location of the data.
+        """
+
+    @abstractmethod
+    def fetch(self, kind: DataKind, since: str | None = None) -> Fetched:
+        """Fetches a kind of data, conditionally on it having changed since the version passed in.
+
+        :param kind: The kind of data to fetch.
+        :param since: The version returned by a previous fetch, if any.
+        :return: The payload (None if it hasn't changed since `since`) and its version.
+        :raises RequestException: If the data can't be fetched (`DataUnavailableError` if the source doesn't have it).
+        """
+
+
+class HTTPSource(DataSource):
+    """Fetches each kind of data from a URL with conditional requests (using the ETag or Last-Modified header)."""
+
+    def __init__(
+        self,
+        urls: dict[DataKind, str],
+        headers: dict[str, str] | None = None,
+        session: Session | None = None
+    ):
+        self.urls = urls
+        self.headers = headers or {}
+        self.session = session or _shared_session
+
+    def location(self, kind: DataKind) -> str:
+        """Returns the URL a kind of data is fetched from."""
+        if kind not in self.urls:
+            raise DataUnavailableError(f"{type(self).__name__} doesn't provide {kind.name}.")
+
+        return self.urls[kind]
+
+    def fetch(self, kind: DataKind, since: str | None = None) -> Fetched:
+        """Fetches a kind of data from its URL, which answers with a 304 if it hasn't changed since `since`."""
+        headers = dict(self.headers)
+
+        # Versions are the ETag of the payload when the server sends one (always quoted), otherwise its Last-Modified.
+        if since is not None:
+            headers["If-None-Match" if since.startswith(('"', 'W/"')) else "If-Modified-Since"] = since
+
+        response = self.session.get(self.location(kind), headers=headers, timeout=GeneralConstants.FETCH_TIMEOUT)
+
+        if response.status_code == 304 and since is not None:
+            return Fetched(None, since)
+
+        response.raise_for_status()
+        return Fetched(response.content, response.headers.get("ETag") or response.headers.get("Last-Modified"))
+
+
+class GitHubSource(HTTPSource):
+    """Fetches the scouting data from team4099/ScoutingAppData on GitHub."""
+
+    def __init__(self, session: Session | None = None):
+        super().__init__(
+            {
+                DataKind.SCOUTING_DATA: EventSpecificConstants.URL,
+                DataKind.PIT_SCOUTING_DATA: EventSpecificConstants.PIT_SCOUTING_URL
+            },
+            session=session
+        )
+
+
+class TBASource(HTTPSource):
+    """Fetches the matches at the current event from The Blue Alliance."""
+
+    def __init__(self, api_url: str = GeneralConstants.TBA_API_URL, session: Session | None = None):
+        super().__init__(
+            {DataKind.EVENT_MATCHES: f"{api_url}/event/{EventSpecificConstants.EVENT_CODE}/matches"},
+            headers={"X-TBA-Auth-Key": _TBA_AUTH_KEY},
+            session=session
+        )
+
+
+class LocalHTTPSource(HTTPSource):
+    """Fetches every kind of data from a local stand-in server (e.g. `python -m http.server` in a local directory)."""
+
+    def __init__(self, server_url: str = GeneralConstants.LOCAL_SERVER_URL, session: Session | None = None):
+        super().__init__({kind: f"{server_url.rstrip('/')}/{local_path(kind)}" for kind in DataKind}, session=session)
+
+
+class LocalDirectorySource(DataSource):
+    """Reads every kind of data from a local directory (see `local_path`), such as one containing a synthetic event.
+
+    The version of each file is its modification time and size, so a file is only read again once it's rewritten.
+    """
+
+    def __init__(self, directory: str = GeneralConstants.LOCAL_DATA_DIRECTORY):
+        self.directory = directory
+
+    def location(self, kind: DataKind) -> str:
+        """Returns the path of the file a kind of data is read from."""
+        return os.path.join(self.directory, local_path(kind))
+
+    def fetch(self, kind: DataKind, since: str | None = None) -> Fetched:
+        """Reads a kind of data from its file, unless the file hasn't changed since `since`."""
+        path = self.location(kind)
+
+        try:
+            status = os.stat(path)
+            version = f"{status.st_mtime_ns:x}-{status.st_size:x}"
+
+            if version == since:
+                return Fetched(None, since)
+
+            with open(path, "rb") as file:
+                return Fetched(file.read(), version)
+        except OSError as error:
+            raise DataUnavailableError(f"Couldn't read {path}: {error}") from error
+
+
+def create_data_sources(data_source: str = GeneralConstants.DATA_SOURCE) -> dict[DataKind, DataSource]:
+    """Creates the source each kind of data is read from.
+
+    :param data_source: Either "live" (GitHub and TBA), "local" (a local directory) or "local_http" (a local
+        stand-in server), defaulting to `GeneralConstants.DATA_SOURCE`.
+    :return: The source of each kind of data.
+    """
+    if data_source == "live":
+        github, tba = GitHubSource(), TBASource()
+        return {
+            DataKind.SCOUTING_DATA: github,
+            DataKind.PIT_SCOUTING_DATA: github,
+            DataKind.EVENT_MATCHES: tba
+        }
+    elif data_source == "local":
+        return dict.fromkeys(DataKind, LocalDirectorySource())
+    elif data_source == "local_http":
+        return dict.fromkeys(DataKind, LocalHTTPSource())
+
+    raise ValueError(f"Unknown data source {data_source!r} (expected 'live', 'local' or 'local_http').")
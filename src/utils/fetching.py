@@ -0,0 +1,231 @@
+"""Defines the `ConditionalFetcher` class used to download event data only when it has changed."""
+
+import json
+import os
+from collections import Counter, defaultdict
+from concurrent.futures import Future
+from hashlib import sha1
+from threading import get_ident, Lock, Thread
+from typing import Any, Callable
+
+from requests import RequestException
+
+from .constants import GeneralConstants
+from .data_sources import DataKind, DataSource
+from .snapshots import read_snapshot, write_snapshot
+
+__all__ = [
+    "ConditionalFetcher",
+    "fetcher"
+]
+
+
+class ConditionalFetcher:
+    """Fetches data from a `DataSource` conditionally, keeping the last payload of each location on disk.
+
+    The version of the last payload is passed with every fetch so unchanged data isn't fetched again,
+    in which case the payload parsed last time is reused instead of parsing it again.
+    When the source can't be reached, the copy on disk is served instead.
+
+    Fetching data that's already being fetched waits for the fetch in flight instead of starting another one,
+    or returns the last parsed payload right away when stale payloads are allowed.
+    """
+
+    def __init__(
+        self,
+        cache_directory: str = GeneralConstants.FETCH_CACHE_DIRECTORY,
+        snapshot_directory: str = GeneralConstants.SNAPSHOT_DIRECTORY
+    ):
+        self.cache_directory = cache_directory
+        self.snapshot_directory = snapshot_directory
+        self.statistics = defaultdict(Counter)  # Keyed by the location of the data (e.g. its URL)
+
+        # Keyed by location and parser, since the same payload can be parsed differently by different pages.
+        self._parsed_payloads = {}
+        self._refreshes = {}  # The futures of the requests in flight
+        self._lock = Lock()
+
+    def _count(self, location: str, event: str, amount: int) -> None:
+        """Adds to the number of times an event (a request, a 304, bytes downloaded, etc.) happened for a location."""
+        with self._lock:
+            self.statistics[location][event] += amount
+
+    def _paths_for(self, location: str) -> tuple[str, str]:
+        """Returns the paths of the payload and the metadata stored on disk for a location."""
+        name = f"{sha1(location.encode()).hexdigest()[:12]}_{os.path.basename(location)}"
+        return os.path.join(self.cache_directory, name), os.path.join(self.cache_directory, f"{name}.meta.json")
+
+    def _read_metadata(self, location: str) -> dict | None:
+        """Reads the metadata (version and digest) of the payload stored on disk for a location."""
+        try:
+            with open(self._paths_for(location)[1]) as metadata_file:
+                return json.load(metadata_file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_to_disk(self, location: str, payload: bytes, metadata: dict) -> None:
+        """Stores a payload and its metadata on disk, replacing the previous copy atomically."""
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+        for path, contents, mode in zip(self._paths_for(location), (payload, json.dumps(metadata)), ("wb", "w")):
+            # Unique per thread since the same location can be fetched by several threads at once.
+            temporary_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+
+            with open(temporary_path, mode) as file:
+                file.write(contents)
+
+            os.replace(temporary_path, path)
+
+    def _parse_from_disk(
+        self,
+        location: str,
+        parse: Callable[[bytes], Any],
+        metadata: dict,
+        snapshot: str | None
+    ) -> Any:
+        """Parses the payload stored on disk for a location, reusing the last parsed payload if it's the same one.
+
+        When the payload hasn't been parsed by this process yet, its snapshot is loaded instead if there is one.
+        """
+        with self._lock:
+            parsed_metadata, parsed_payload = self._parsed_payloads.get((location, parse), (None, None))
+
+        if parsed_metadata == metadata:
+            return parsed_payload
+
+        parsed_payload = (
+            read_snapshot(snapshot, version=metadata.get("digest"), directory=self.snapshot_directory)
+            if snapshot is not None
+            else None
+        )
+
+        if parsed_payload is None:
+            with open(self._paths_for(location)[0], "rb") as payload_file:
+                parsed_payload = parse(payload_file.read())
+
+        with self._lock:
+            self._parsed_payloads[location, parse] = (metadata, parsed_payload)
+
+        return parsed_payload
+
+    def _refresh(
+        self,
+        source: DataSource,
+        kind: DataKind,
+        parse: Callable[[bytes], Any],
+        update: Callable[[Any, bytes], Any] | None,
+        snapshot: str | None
+    ) -> Any:
+        """Fetches data from a source if it changed since it was last fetched and parses it (see `fetch`)."""
+        location = source.location(kind)
+        metadata = self._read_metadata(location)
+        self._count(location, "requests", 1)
+
+        try:
+            fetched = source.fetch(kind, since=metadata.get("version") if metadata is not None else None)
+        except RequestException:
+            # Serve the copy on disk when the source can't be reached.
+            if metadata is None:
+                raise
+
+            self._count(location, "served_from_disk", 1)
+            return self._parse_from_disk(location, parse, metadata, snapshot)
+
+        if fetched.payload is None:
+            self._count(location, "not_modified", 1)
+            return self._parse_from_disk(location, parse, metadata, snapshot)
+
+        payload = fetched.payload
+        metadata = {"version": fetched.version, "digest": sha1(payload).hexdigest()}
+        self._count(location, "bytes_downloaded", len(payload))
+
+        with self._lock:
+            _, last_parsed_payload = self._parsed_payloads.get((location, parse), (None, None))
+
+        if update is not None and last_parsed_payload is not None:
+            parsed_payload = update(last_parsed_payload, payload)
+        else:
+            parsed_payload = parse(payload)
+
+        self._write_to_disk(location, payload, metadata)
+
+        if snapshot is not None:
+            write_snapshot(snapshot, parsed_payload, version=metadata["digest"], directory=self.snapshot_directory)
+
+        with self._lock:
+            self._parsed_payloads[location, parse] = (metadata, parsed_payload)
+
+        return parsed_payload
+
+    def _run_refresh(
+        self,
+        refresh: Future,
+        source: DataSource,
+        kind: DataKind,
+        parse: Callable[[bytes], Any],
+        update: Callable[[Any, bytes], Any] | None,
+        snapshot: str | None
+    ) -> None:
+        """Refreshes data, resolving the future that callers fetching the same data meanwhile wait on."""
+        try:
+            refresh.set_result(self._refresh(source, kind, parse, update, snapshot))
+        except Exception as error:
+            refresh.set_exception(error)
+        finally:
+            with self._lock:
+                del self._refreshes[source.location(kind), parse]
+
+    def fetch(
+        self,
+        source: DataSource,
+        kind: DataKind,
+        parse: Callable[[bytes], Any],
+        update: Callable[[Any, bytes], Any] | None = None,
+        snapshot: str | None = None,
+        stale_while_revalidate: bool = False
+    ) -> Any:
+        """Fetches a kind of data from a source and parses it, reusing the last parsed payload when it hasn't changed.
+
+        Only one fetch per location and parser is in flight at once; fetching data that's already being fetched
+        waits for that fetch instead of starting another one.
+
+        :param source: The source to fetch the data from.
+        :param kind: The kind of data to fetch.
+        :param parse: The function used to parse the raw payload.
+        :param update: An optional function that updates the last parsed payload with a changed raw payload,
+            used instead of `parse` when the data has already been parsed.
+        :param snapshot: An optional name to store the parsed payload (a dataframe) under as a columnar snapshot,
+            which is loaded instead of parsing the payload again after a restart.
+        :param stale_while_revalidate: Whether to return the last parsed payload right away, if there is one,
+            while the data is refreshed in the background.
+        :return: The parsed payload.
+        :raises RequestException: If the data can't be fetched and there's no copy of it on disk.
+        """
+        location = source.location(kind)
+
+        with self._lock:
+            _, last_parsed_payload = self._parsed_payloads.get((location, parse), (None, None))
+            refresh = self._refreshes.get((location, parse))
+            in_flight = refresh is not None
+
+            if not in_flight:
+                refresh = self._refreshes[location, parse] = Future()
+
+        serve_stale = stale_while_revalidate and last_parsed_payload is not None
+        arguments = (refresh, source, kind, parse, update, snapshot)
+
+        if not in_flight:
+            if serve_stale:
+                Thread(target=self._run_refresh, args=arguments, daemon=True).start()
+            else:
+                self._run_refresh(*arguments)
+
+        if serve_stale:
+            self._count(location, "served_stale", 1)
+            return last_parsed_payload
+
+        return refresh.result()
+
+
+# The fetcher shared by every page, so payloads parsed by one page are reused by the others.
+fetcher = ConditionalFetcher()
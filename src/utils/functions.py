@@ -1,22 +1,45 @@
 """Defines utility functions that are later used in FalconVis."""
-from io import StringIO
-from json import load, loads
-from re import search, sub
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+from io import BytesIO
+from json import dumps, load, loads
+from re import compile, search
+from typing import Any, Callable, NamedTuple
 
 import streamlit as st
+import numpy as np
 from numpy import int64
-from pandas import DataFrame, read_csv
-from requests import get
-from tbapy import TBA
+from pandas import Categorical, CategoricalDtype, concat, DataFrame, Index, isna, read_csv, Series, to_numeric
+from pandas.api.types import infer_dtype, is_bool_dtype
+from pandas.util import hash_pandas_object
+from requests import RequestException
 
-from .constants import EventSpecificConstants, GeneralConstants, Queries
+from .constants import Criteria, EventSpecificConstants, GeneralConstants, Queries, ScoutingSchema
+from .data_sources import create_data_sources, DataKind
+from .fetching import fetcher
+from .profiling import profiled
+from .refreshing import BackgroundRefresher, RefreshStatus
 
 __all__ = [
+    "add_derived_scouting_fields",
+    "after_event_data_refresh",
+    "apply_scouting_schema",
+    "appearances_for_team",
+    "clean_text_columns",
+    "data_version",
+    "event_data_status",
+    "EventData",
+    "fetch_event_data",
+    "ingest_scouting_submissions",
+    "load_event_data",
+    "map_criteria",
+    "match_appearances",
     "note_scouting_data_for_team",
     "populate_missing_data",
     "retrieve_match_schedule",
+    "retrieve_match_schedule_appearances",
     "retrieve_match_data",
+    "retrieve_match_data_appearances",
     "retrieve_note_scouting_data",
     "retrieve_pit_scouting_data",
     "retrieve_team_list",
@@ -24,6 +47,13 @@ __all__ = [
     "scouting_data_for_team"
 ]
 
+# Where each kind of data is read from, selected with `GeneralConstants.DATA_SOURCE`.
+_data_sources = create_data_sources()
+
+# The control characters (C0 and C1) that can end up in scouting submissions.
+_CONTROL_CHARACTERS = compile(r"[\x00-\x1F\x7F-\x9F]")
+_TEXT_SEPARATOR = "\uffff"  # A noncharacter, so it shouldn't appear in any submission
+
 
 def populate_missing_data(distributions: list[list], sentinel: Any = None) -> tuple[range, list]:
     """Populates missing data points when plotting multiple distributions.
@@ -44,16 +74,149 @@ def populate_missing_data(distributions: list[list], sentinel: Any = None) -> tu
     )
 
 
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
-def retrieve_scouting_data() -> DataFrame:
-    """Retrieves the latest scouting data from team4099/ScoutingAppData on GitHub based on the current event.
+def map_criteria(values: Series, criteria: dict, default: Any = float("nan")) -> Series:
+    """Maps each value of a field to its weightage within a criteria.
 
-    :return: A dataframe containing the scouting data from an event.
+    Categorical and boolean fields are mapped through their codes, so the criteria is only looked up once per
+    category instead of once per value.
+
+    :param values: The values of the field to map.
+    :param criteria: The criteria mapping each value to its weightage.
+    :param default: The weightage of values that aren't in the criteria.
+    :return: A series containing the weightage of each value.
+    """
+    if isinstance(values.dtype, CategoricalDtype):
+        weights = np.array([criteria.get(category, default) for category in values.cat.categories] + [default])
+        return Series(weights[values.cat.codes.to_numpy()], index=values.index, name=values.name)
+    elif is_bool_dtype(values.dtype):
+        weights = np.array([criteria.get(False, default), criteria.get(True, default)])
+        return Series(weights[values.to_numpy(dtype=int)], index=values.index, name=values.name)
+
+    mapped_values = values.map(criteria)
+    return mapped_values if isna(default) else mapped_values.fillna(default)
+
+
+def apply_scouting_schema(scouting_data: DataFrame) -> DataFrame:
+    """Converts the fields in the scouting data to the compact types declared in `ScoutingSchema`.
+
+    :param scouting_data: The scouting data to convert.
+    :return: A copy of the scouting data with booleans, small integer counts and ordered categorical ratings.
+    """
+    typed_fields = {}
+
+    for field in ScoutingSchema.BOOLEAN_FIELDS:
+        if field in scouting_data:
+            typed_fields[field] = map_criteria(scouting_data[field], Criteria.BOOLEAN_CRITERIA, default=0).astype(bool)
+
+    for field, dtype in ScoutingSchema.COUNT_FIELDS.items():
+        if field in scouting_data:
+            limits = np.iinfo(dtype)
+            typed_fields[field] = (
+                to_numeric(scouting_data[field], errors="coerce")
+                .fillna(0)
+                .clip(limits.min, limits.max)
+                .astype(dtype)
+            )
+
+    for field, criteria in ScoutingSchema.RATING_FIELDS.items():
+        if field in scouting_data:
+            typed_fields[field] = Categorical(
+                scouting_data[field], categories=sorted(criteria, key=criteria.get), ordered=True
+            )
+
+    return scouting_data.assign(**typed_fields)
+
+
+def add_derived_scouting_fields(scouting_data: DataFrame) -> DataFrame:
+    """Adds the point contributions, cycles and potential amplification periods of each submission as columns.
+
+    These are calculated once when the scouting data is loaded so that `CalculatedStats` only has to slice them.
+
+    :param scouting_data: The scouting data to derive the fields from.
+    :return: A copy of the scouting data with the derived fields added.
+    """
+    left_starting_zone = map_criteria(scouting_data[Queries.LEFT_STARTING_ZONE], Criteria.BOOLEAN_CRITERIA)
+    parked_under_stage = map_criteria(scouting_data[Queries.PARKED_UNDER_STAGE], Criteria.BOOLEAN_CRITERIA)
+    climbed_chain = map_criteria(scouting_data[Queries.CLIMBED_CHAIN], Criteria.BOOLEAN_CRITERIA)
+    harmonized_on_chain = map_criteria(scouting_data[Queries.HARMONIZED_ON_CHAIN], Criteria.BOOLEAN_CRITERIA)
+
+    auto_points = scouting_data[Queries.AUTO_SPEAKER] * 5 + scouting_data[Queries.AUTO_AMP] * 2 + left_starting_zone
+    teleop_points = scouting_data[Queries.TELEOP_SPEAKER] * 2 + scouting_data[Queries.TELEOP_AMP]
+    endgame_points = (
+        parked_under_stage + climbed_chain * 3 + harmonized_on_chain * 2 + scouting_data[Queries.TELEOP_TRAP] * 5
+    )
+
+    auto_cycles = scouting_data[Queries.AUTO_SPEAKER] + scouting_data[Queries.AUTO_AMP]
+    teleop_cycles = (
+        scouting_data[Queries.TELEOP_SPEAKER] + scouting_data[Queries.TELEOP_AMP] + scouting_data[Queries.TELEOP_TRAP]
+    )
+
+    return scouting_data.assign(
+        **{
+            Queries.AUTO_POINTS: auto_points,
+            Queries.TELEOP_POINTS: teleop_points,
+            Queries.ENDGAME_POINTS: endgame_points,
+            Queries.TOTAL_POINTS: auto_points + teleop_points + endgame_points,
+            Queries.AUTO_CYCLES: auto_cycles,
+            Queries.TELEOP_CYCLES: teleop_cycles,
+            Queries.TOTAL_CYCLES: auto_cycles + teleop_cycles,
+            Queries.POTENTIAL_AMPLIFICATION_PERIODS: (
+                scouting_data[Queries.AUTO_AMP] + scouting_data[Queries.TELEOP_AMP]
+            ) // 2
+        }
+    )
+
+
+def clean_text_columns(data: DataFrame) -> DataFrame:
+    """Removes control characters from the strings in the object columns of a dataframe, used to clean scouting data.
+
+    The strings in each column are joined and cleaned with one pass of a precompiled regex, and columns without
+    any control characters are left as is, so only the object columns that need cleaning are touched.
+
+    :param data: The dataframe to clean.
+    :return: A dataframe with the text columns cleaned.
     """
+    cleaned_columns = {}
+
+    for column in data.select_dtypes(include="object").columns:
+        values = data[column].to_numpy()
+        is_string = (
+            np.ones(len(values), dtype=bool)
+            if infer_dtype(values, skipna=False) == "string"
+            else np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=len(values))
+        )
+        strings = values[is_string].tolist()
+        joined_strings = _TEXT_SEPARATOR.join(strings)
+
+        if not _CONTROL_CHARACTERS.search(joined_strings):
+            continue
 
-    scouting_data = DataFrame.from_dict(check_utf8(
-        loads(get(EventSpecificConstants.URL).text.replace("\n", "").replace("\t", "").encode('unicode_escape'))
-    ))
+        # Clean each string separately if one of them happens to contain the separator.
+        if joined_strings.count(_TEXT_SEPARATOR) == len(strings) - 1:
+            cleaned_strings = _CONTROL_CHARACTERS.sub("", joined_strings).split(_TEXT_SEPARATOR)
+        else:
+            cleaned_strings = [_CONTROL_CHARACTERS.sub("", string) for string in strings]
+
+        cleaned_values = values.copy()
+        cleaned_values[is_string] = cleaned_strings
+        cleaned_columns[column] = cleaned_values
+
+    return data.assign(**cleaned_columns) if cleaned_columns else data
+
+
+def _load_scouting_submissions(payload: bytes) -> list[dict]:
+    """Loads the submissions from the raw scouting data JSON.
+
+    Notes can contain raw newlines and tabs, which strict JSON doesn't allow in strings, so they're let through
+    here and removed by `clean_text_columns` when the submissions are parsed.
+    """
+    return loads(payload, strict=False)
+
+
+def _parse_scouting_submissions(submissions: list[dict]) -> DataFrame:
+    """Parses scouting submissions, adding the match number and the derived fields to each submission."""
+    scouting_data = apply_scouting_schema(clean_text_columns(DataFrame.from_dict(submissions)))
+    scouting_data[Queries.SUBMISSION_KEY] = [_submission_key(submission) for submission in submissions]
 
     scouting_data[Queries.MATCH_NUMBER] = scouting_data[Queries.MATCH_KEY].apply(
         lambda match_key: int(search(r"\d+", match_key).group(0))
@@ -61,18 +224,82 @@ def retrieve_scouting_data() -> DataFrame:
 
     scouting_data[Queries.TEAM_NUMBER] = scouting_data[Queries.TEAM_NUMBER].apply(int)
 
-    return scouting_data.sort_values(by=Queries.MATCH_NUMBER).reset_index(drop=True)
+    scouting_data = add_derived_scouting_fields(
+        scouting_data.sort_values(by=Queries.MATCH_NUMBER, kind="stable").reset_index(drop=True)
+    )
+    scouting_data.attrs["changed_teams"] = sorted(scouting_data[Queries.TEAM_NUMBER].unique().tolist())
+    scouting_data.attrs["changed_matches"] = scouting_data[Queries.MATCH_KEY].unique().tolist()
 
+    return scouting_data
 
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
-def retrieve_note_scouting_data() -> DataFrame:
-    """Retrieves the latest note scouting data from team4099/ScoutingAppData on GitHub based on the current event.
 
-    :return: A dataframe containing the scouting data from an event.
+def _submission_key(submission: dict) -> str:
+    """Returns the key identifying a raw scouting submission.
+
+    Submissions sent with a scout are keyed by their match, team and scout. Submissions without one are keyed by a
+    hash of their contents instead, so the submissions of two scouts for the same team and match are both kept.
     """
-    scouting_data = DataFrame.from_dict(
-        loads(get(EventSpecificConstants.URL).text)
-    )
+    scout = submission.get(Queries.SCOUT_ID)
+
+    if scout is None or scout == "":
+        return sha1(dumps(submission, sort_keys=True, default=str).encode()).hexdigest()
+
+    return f"{submission.get(Queries.MATCH_KEY)}|{submission.get(Queries.TEAM_NUMBER)}|{scout}"
+
+
+def ingest_scouting_submissions(scouting_data: DataFrame, submissions: list[dict]) -> DataFrame:
+    """Appends the submissions that aren't in the scouting data yet, parsing only the new submissions.
+
+    Submissions are identified by the key stored in their `SubmissionKey` field (see `_submission_key`), and the
+    scouting data is assumed to only grow, so a submission that's already been ingested isn't parsed again. The
+    teams and matches with new submissions are reported in `attrs["changed_teams"]` and `attrs["changed_matches"]`.
+
+    :param scouting_data: The scouting data that's already been parsed.
+    :param submissions: Every submission in the latest scouting data.
+    :return: A dataframe containing the scouting data with the new submissions appended, sorted by match number.
+    """
+    # A payload smaller than the existing data means submissions were removed, so everything is parsed again
+    # (as it is when the existing data was parsed before submissions were keyed).
+    if (
+        scouting_data.empty
+        or Queries.SUBMISSION_KEY not in scouting_data.columns
+        or len(submissions) < len(scouting_data)
+    ):
+        return _parse_scouting_submissions(submissions)
+
+    existing_keys = set(scouting_data[Queries.SUBMISSION_KEY])
+    new_submissions = [
+        submission for submission in submissions
+        if _submission_key(submission) not in existing_keys
+    ]
+
+    if not new_submissions:
+        updated_scouting_data = scouting_data.copy(deep=False)
+        updated_scouting_data.attrs.update(changed_teams=[], changed_matches=[])
+        return updated_scouting_data
+
+    new_scouting_data = _parse_scouting_submissions(new_submissions)
+    updated_scouting_data = concat(
+        [scouting_data, new_scouting_data], ignore_index=True
+    ).sort_values(by=Queries.MATCH_NUMBER, kind="stable").reset_index(drop=True)
+    updated_scouting_data.attrs = dict(new_scouting_data.attrs)
+
+    return updated_scouting_data
+
+
+def _parse_scouting_data(payload: bytes) -> DataFrame:
+    """Parses the raw scouting data JSON, adding the match number and the derived fields to each submission."""
+    return _parse_scouting_submissions(_load_scouting_submissions(payload))
+
+
+def _update_scouting_data(scouting_data: DataFrame, payload: bytes) -> DataFrame:
+    """Updates already parsed scouting data with the new submissions in the raw scouting data JSON."""
+    return ingest_scouting_submissions(scouting_data, _load_scouting_submissions(payload))
+
+
+def _parse_note_scouting_data(payload: bytes) -> DataFrame:
+    """Parses the raw note scouting data JSON, adding the match number to each submission."""
+    scouting_data = clean_text_columns(DataFrame.from_dict(_load_scouting_submissions(payload)))
     scouting_data[Queries.MATCH_NUMBER] = scouting_data[Queries.MATCH_KEY].apply(
         lambda match_key: int(search(r"\d+", match_key).group(0))
     )
@@ -80,31 +307,65 @@ def retrieve_note_scouting_data() -> DataFrame:
     return scouting_data.sort_values(by=Queries.MATCH_NUMBER).reset_index(drop=True)
 
 
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE)
-def retrieve_pit_scouting_data() -> DataFrame | None:
-    """Retrieves the latest pit scouting data from team4099/ScoutingAppData on GitHub based on the current event.
+def _parse_pit_scouting_data(payload: bytes) -> DataFrame:
+    """Parses the raw pit scouting data CSV."""
+    return read_csv(BytesIO(payload))
+
+
+def _fetch_scouting_data() -> DataFrame:
+    """Fetches the scouting data, only downloading it when it has changed and only parsing new submissions."""
+    return fetcher.fetch(
+        _data_sources[DataKind.SCOUTING_DATA],
+        DataKind.SCOUTING_DATA,
+        _parse_scouting_data,
+        update=_update_scouting_data,
+        snapshot="scouting_data"
+    )
 
-    :return: A dataframe containing the scouting data from an event.
-    """
-    response = get(EventSpecificConstants.PIT_SCOUTING_URL)
 
-    if response.status_code == 200:
-        return read_csv(
-            StringIO(response.text)
+def _fetch_note_scouting_data() -> DataFrame:
+    """Fetches the note scouting data, only downloading it when it has changed."""
+    try:
+        return fetcher.fetch(
+            _data_sources[DataKind.SCOUTING_DATA],
+            DataKind.SCOUTING_DATA,
+            _parse_note_scouting_data,
+            snapshot="note_scouting_data"
+        )
+    except (RequestException, ValueError, KeyError, AttributeError):
+        # Fall back to no notes so a bad submission doesn't fail the rest of the event data; the scouting data
+        # is parsed from the same payload and raises the error itself.
+        return DataFrame(
+            columns=[
+                Queries.MATCH_KEY,
+                Queries.TEAM_NUMBER,
+                Queries.AUTO_NOTES,
+                Queries.TELEOP_NOTES,
+                Queries.ENDGAME_NOTES,
+                Queries.RATING_NOTES,
+                Queries.MATCH_NUMBER
+            ]
         )
 
 
-# Cache for longer because match schedule is relatively constant.
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE * 4)
-def retrieve_match_schedule() -> DataFrame:
-    """Retrieves the match schedule for the current event using TBA."""
-    tba_instance = TBA(
-        auth_key="6lcmneN5bBDYpC47FolBxp2RZa4AbQCVpmKMSKw9x9btKt7da5yMzVamJYk0XDBm"  # For testing purposes
-    )
-    match_levels_to_order = {"qm": 0, "sf": 1, "f": 2}
+def _fetch_pit_scouting_data() -> DataFrame | None:
+    """Fetches the pit scouting data, only downloading it when it has changed."""
+    try:
+        return fetcher.fetch(
+            _data_sources[DataKind.PIT_SCOUTING_DATA],
+            DataKind.PIT_SCOUTING_DATA,
+            _parse_pit_scouting_data,
+            snapshot="pit_scouting_data"
+        )
+    except RequestException:
+        return None
 
+
+def _match_schedule_from(event_matches: list[dict]) -> DataFrame:
+    """Creates the match schedule from the matches at an event, falling back to the local schedule."""
+    match_levels_to_order = {"qm": 0, "sf": 1, "f": 2}
     event_matches = sorted(
-        tba_instance.event_matches(EventSpecificConstants.EVENT_CODE),
+        event_matches,
         key=lambda match_info: (match_levels_to_order[match_info["comp_level"]], match_info["match_number"])
     )
 
@@ -124,16 +385,11 @@ def retrieve_match_schedule() -> DataFrame:
             return DataFrame.from_dict(load(file))
 
 
-@st.cache_data(ttl=GeneralConstants.SECONDS_TO_CACHE // 2)
-def retrieve_match_data() -> DataFrame:
-    """Retrieves the TBA match data at an event up to the latest matches they've played."""
-    tba_instance = TBA(
-        auth_key="6lcmneN5bBDYpC47FolBxp2RZa4AbQCVpmKMSKw9x9btKt7da5yMzVamJYk0XDBm"  # For testing purposes
-    )
-
+def _match_data_from(event_matches: list[dict]) -> DataFrame:
+    """Creates the results of the qualification matches played so far from the matches at an event."""
     event_matches = [
         match
-        for match in tba_instance.event_matches(EventSpecificConstants.EVENT_CODE)
+        for match in event_matches
         if match["comp_level"] == "qm"
     ]
 
@@ -161,6 +417,260 @@ def retrieve_match_data() -> DataFrame:
         return DataFrame()
 
 
+def _parse_tba_event_matches(payload: bytes) -> tuple[DataFrame, DataFrame]:
+    """Parses the matches at an event from TBA into both the match schedule and the match results.
+
+    :param payload: The raw JSON payload of TBA's event matches endpoint.
+    :return: The match schedule and the results of the qualification matches played so far.
+    """
+    event_matches = loads(payload)
+    return _match_schedule_from(event_matches), _match_data_from(event_matches)
+
+
+def _fetch_tba_event_matches() -> tuple[DataFrame, DataFrame]:
+    """Fetches the matches at the current event from TBA, shared by the match schedule and the match results.
+
+    Only downloaded and parsed when the matches on TBA have changed.
+    """
+    try:
+        return fetcher.fetch(
+            _data_sources[DataKind.EVENT_MATCHES], DataKind.EVENT_MATCHES, _parse_tba_event_matches
+        )
+    except RequestException:
+        # Fall back to the local schedule when TBA has never been reached.
+        return _parse_tba_event_matches(b"[]")
+
+
+def _fetch_match_schedule() -> DataFrame:
+    """Fetches the match schedule from TBA."""
+    match_schedule, _ = _fetch_tba_event_matches()
+    return match_schedule
+
+
+def _fetch_match_data() -> DataFrame:
+    """Fetches the results of the qualification matches played so far from TBA."""
+    _, match_data = _fetch_tba_event_matches()
+    return match_data
+
+
+def data_version(*sources: DataFrame | None) -> str:
+    """Hashes the contents of several dataframes into a version that changes only when the data changes.
+
+    :param sources: The dataframes to hash (None for a source that couldn't be retrieved).
+    :return: A hex digest of the columns, types, index and values of every dataframe.
+    """
+    digest = sha1()
+
+    for source in sources:
+        if source is None:
+            digest.update(b"None")
+            continue
+
+        digest.update(repr((source.columns.tolist(), source.dtypes.astype(str).tolist())).encode())
+        digest.update(hash_pandas_object(source.index).to_numpy().tobytes())
+
+        for column in source.columns:
+            try:
+                hashes = hash_pandas_object(source[column], index=False)
+            except TypeError:  # Columns containing lists/dicts are hashed by their representation.
+                hashes = hash_pandas_object(source[column].map(repr), index=False)
+
+            digest.update(hashes.to_numpy().tobytes())
+
+    return digest.hexdigest()[:16]
+
+
+class EventData(NamedTuple):
+    """All of the data retrieved for the current event, loaded at once by `load_event_data`.
+
+    The version is a hash of the contents of every source (see `data_version`), so computations derived from the
+    event data can be cached by it and only redone when the data actually changes.
+    """
+
+    scouting_data: DataFrame
+    note_scouting_data: DataFrame
+    pit_scouting_data: DataFrame | None
+    match_schedule: DataFrame
+    match_data: DataFrame
+    version: str
+
+
+# The function fetching each source in `EventData`.
+_EVENT_DATA_FETCHERS = {
+    "scouting_data": _fetch_scouting_data,
+    "note_scouting_data": _fetch_note_scouting_data,
+    "pit_scouting_data": _fetch_pit_scouting_data,
+    "match_schedule": _fetch_match_schedule,
+    "match_data": _fetch_match_data
+}
+
+
+def fetch_event_data() -> EventData:
+    """Loads every source of data for the current event at once, without refreshing it in the background.
+
+    Each source is fetched on its own thread through the shared HTTP session, so loading takes as long as the
+    slowest source rather than the sum of all of them. Used outside of a Streamlit server (e.g. by
+    `computations.batch`); pages use `load_event_data` instead.
+
+    :return: An `EventData` bundle containing the data from every source.
+    """
+    with ThreadPoolExecutor(max_workers=len(_EVENT_DATA_FETCHERS)) as executor:
+        futures = {field: executor.submit(fetch) for field, fetch in _EVENT_DATA_FETCHERS.items()}
+        sources = {field: future.result() for field, future in futures.items()}
+
+    return EventData(**sources, version=data_version(*sources.values()))
+
+
+# Shared by every session, so the event data is reloaded in the background once for all of them.
+_event_data_refresher = BackgroundRefresher(fetch_event_data, interval=GeneralConstants.REFRESH_INTERVAL)
+
+
+@profiled("data")
+def load_event_data() -> EventData:
+    """Returns the latest event data, which is reloaded in the background every `GeneralConstants.REFRESH_INTERVAL`.
+
+    Pages are served the last version loaded while a newer one is being loaded, so only the very first call waits
+    on every source being fetched (which takes as long as the slowest source, since they're fetched at once).
+
+    :return: An `EventData` bundle containing the data from every source.
+    """
+    return _event_data_refresher.current()
+
+
+def after_event_data_refresh(hook: Callable[[EventData], Any]) -> None:
+    """Registers a function called with each version of the event data in the background once it's loaded.
+
+    :param hook: The function called with the event data (see `BackgroundRefresher.add_refresh_hook`).
+    """
+    _event_data_refresher.add_refresh_hook(hook)
+
+
+def event_data_status() -> RefreshStatus:
+    """Returns when the event data was last refreshed, how long that took and how many refreshes have failed.
+
+    :return: The status of the background refresh of the event data.
+    """
+    return _event_data_refresher.status()
+
+
+@profiled("data")
+def retrieve_scouting_data() -> DataFrame:
+    """Retrieves the latest scouting data from team4099/ScoutingAppData on GitHub based on the current event.
+
+    Only downloaded when the data on GitHub has changed (see `ConditionalFetcher`), and only the new submissions
+    are parsed (see `ingest_scouting_submissions`).
+
+    :return: A dataframe containing the scouting data from an event.
+    """
+    return load_event_data().scouting_data
+
+
+@profiled("data")
+def retrieve_note_scouting_data() -> DataFrame:
+    """Retrieves the latest note scouting data from team4099/ScoutingAppData on GitHub based on the current event.
+
+    :return: A dataframe containing the scouting data from an event.
+    """
+    return load_event_data().note_scouting_data
+
+
+@profiled("data")
+def retrieve_pit_scouting_data() -> DataFrame | None:
+    """Retrieves the latest pit scouting data from team4099/ScoutingAppData on GitHub based on the current event.
+
+    :return: A dataframe containing the scouting data from an event.
+    """
+    return load_event_data().pit_scouting_data
+
+
+@profiled("data")
+def retrieve_match_schedule() -> DataFrame:
+    """Retrieves the match schedule for the current event using TBA."""
+    return load_event_data().match_schedule
+
+
+@profiled("data")
+def retrieve_match_data() -> DataFrame:
+    """Retrieves the TBA match data at an event up to the latest matches they've played."""
+    return load_event_data().match_data
+
+
+def match_appearances(matches: DataFrame) -> DataFrame:
+    """Normalizes the alliances in a set of matches into one row per team per match.
+
+    Works for both the match schedule (alliances as lists of team numbers) and the TBA match data
+    (alliances as comma-separated team numbers).
+
+    :param matches: The matches to normalize (with the `match_key`, `red_alliance` and `blue_alliance` fields).
+    :return: A dataframe indexed by team number (sorted) with the `match_key`, `alliance` and `station` of each appearance.
+    """
+    if matches.empty:
+        return DataFrame(columns=["match_key", "alliance", "station"], index=Index([], name="team", dtype=int))
+
+    appearances = []
+
+    for alliance in ("red", "blue"):
+        teams_on_alliance = matches[f"{alliance}_alliance"].apply(
+            lambda teams: teams.split(",") if isinstance(teams, str) else list(teams)
+        )
+        alliance_appearances = DataFrame(
+            {"match_key": matches["match_key"], "alliance": alliance, "team": teams_on_alliance}
+        ).explode("team").dropna(subset="team")
+        alliance_appearances["station"] = alliance_appearances.groupby(level=0).cumcount() + 1
+        appearances.append(alliance_appearances)
+
+    return (
+        concat(appearances, ignore_index=True)
+        .astype({"team": int})
+        .set_index("team")
+        .sort_index(kind="stable")
+    )
+
+
+def appearances_for_team(team_number: int, appearances: DataFrame) -> DataFrame:
+    """Retrieves the matches a team appears in from a table created by `match_appearances`.
+
+    :param team_number: The number of the team to retrieve the appearances for.
+    :param appearances: The appearances to look through, indexed by team number.
+    :return: A dataframe containing the `match_key`, `alliance` and `station` of each of the team's appearances.
+    """
+    return appearances.loc[team_number:team_number]
+
+
+@st.cache_data(max_entries=GeneralConstants.DATA_VERSIONS_TO_CACHE)
+def _match_schedule_appearances(version: str, _event_data: EventData) -> DataFrame:
+    """Builds the appearances of each team in the match schedule of a version of the event data."""
+    return match_appearances(_event_data.match_schedule)
+
+
+@st.cache_data(max_entries=GeneralConstants.DATA_VERSIONS_TO_CACHE)
+def _match_data_appearances(version: str, _event_data: EventData) -> DataFrame:
+    """Builds the appearances of each team in the TBA match data of a version of the event data."""
+    return match_appearances(_event_data.match_data)
+
+
+@profiled("data")
+def retrieve_match_schedule_appearances(event_data: EventData | None = None) -> DataFrame:
+    """Retrieves the appearances of each team in the match schedule, built once per version of the event data.
+
+    :param event_data: The event data to use, defaulting to the latest event data.
+    :return: A dataframe indexed by team number containing each of the team's appearances (see `match_appearances`).
+    """
+    event_data = event_data or load_event_data()
+    return _match_schedule_appearances(event_data.version, event_data)
+
+
+@profiled("data")
+def retrieve_match_data_appearances(event_data: EventData | None = None) -> DataFrame:
+    """Retrieves the appearances of each team in the TBA match data, built once per version of the event data.
+
+    :param event_data: The event data to use, defaulting to the latest event data.
+    :return: A dataframe indexed by team number containing each of the team's appearances (see `match_appearances`).
+    """
+    event_data = event_data or load_event_data()
+    return _match_data_appearances(event_data.version, event_data)
+
+
 def scouting_data_for_team(team_number: int, scouting_data: DataFrame | None = None) -> DataFrame:
     """Retrieves the submissions within the scouting data for a certain team.
 
@@ -191,6 +701,7 @@ def note_scouting_data_for_team(team_number: int, scouting_data: DataFrame | Non
         ]
 
 
+@profiled("data")
 def retrieve_team_list(scouting_data: DataFrame = None) -> list:
     """Retrieves the team list at the current event via the scouting data.
 
@@ -221,19 +732,3 @@ def _convert_to_float_from_numpy_type(function):
         return int(result) if isinstance(result, int64) else float(result) # Converts numpy dtype to native python type
 
     return wrapper
-
-
-def check_utf8(list_of_dicts: list[dict]) -> list[dict]:
-    """
-    Removes all non-UTF-8 characters from values of dictionaries contained in lists, used to clean scouting data.
-
-    :param list_of_dicts: The list of dictionaries with values to be cleaned
-    :return: The cleaned list of dictionaries
-    """
-
-    for d in list_of_dicts:
-        for key, value in d.items():
-            if isinstance(value, str):
-                d[key] = sub(r'[\x00-\x1F\x7F-\x9F]', '', value)  # Replace illegal chars with ''
-
-    return list_of_dicts
@@ -8,6 +8,7 @@ from pandas import DataFrame
 from plotly.graph_objects import Box, Figure
 
 from .constants import GeneralConstants
+from .profiling import profiled
 
 __all__ = [
     "box_plot",
@@ -138,6 +139,7 @@ def _create_multicolumn_df(
 
   
 # Wrapper around `st.plotly_chart` for attaching a configuration making graphs static.
+@profiled("graphing")
 def plotly_chart(fig: Figure, use_container_width: bool = True, legend_on_bottom: bool = False, **kwargs) -> None:
     """A wrapper around `st.plotly_chart` for plotting Plotly figures.
 
@@ -161,6 +163,7 @@ def plotly_chart(fig: Figure, use_container_width: bool = True, legend_on_bottom
 
 
 # Primitive graphs
+@profiled("graphing")
 def bar_graph(
     x: list,
     y: list,
@@ -207,6 +210,7 @@ def bar_graph(
     )
 
 
+@profiled("graphing")
 def box_plot(
     x: list,
     y: list,
@@ -253,6 +257,7 @@ def box_plot(
     )
 
 
+@profiled("graphing")
 def line_graph(
     x: list,
     y: list,
@@ -277,6 +282,7 @@ def line_graph(
 
 
 # Add-on graphs
+@profiled("graphing")
 def multi_line_graph(
     x: list,
     y: list,
@@ -311,6 +317,7 @@ def multi_line_graph(
     )
 
 
+@profiled("graphing")
 def stacked_bar_graph(
     x: list,
     y: list,
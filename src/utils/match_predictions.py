@@ -0,0 +1,82 @@
+"""Defines functions that predict every match in the schedule so pages can look predictions up instead of recalculating them."""
+
+import streamlit as st
+from pandas import DataFrame
+
+from .calculated_stats import CalculatedStats, retrieve_calculated_stats
+from .constants import GeneralConstants
+from .functions import after_event_data_refresh, EventData, load_event_data
+from .profiling import profiled
+
+__all__ = [
+    "predict_match_schedule",
+    "retrieve_match_predictions"
+]
+
+
+def predict_match_schedule(calculated_stats: CalculatedStats, match_schedule: DataFrame) -> DataFrame:
+    """Predicts the odds of winning, the scores and the chance of each bonus for every match in a schedule.
+
+    :param calculated_stats: The calculated stats of the scouting data to predict the matches with.
+    :param match_schedule: The match schedule (with the `match_key`, `red_alliance` and `blue_alliance` fields).
+    :return: A dataframe indexed by match key containing the predictions for each match.
+    """
+    if match_schedule.empty:
+        return DataFrame()
+
+    red_alliances = match_schedule["red_alliance"].apply(tuple)
+    blue_alliances = match_schedule["blue_alliance"].apply(tuple)
+    red_win_chance, blue_win_chance, red_score, blue_score = calculated_stats.predict_matchups(
+        red_alliances.tolist(), blue_alliances.tolist()
+    )
+
+    # Alliances can appear in several matches, so each alliance's bonuses are only calculated once.
+    bonuses_by_alliance = {
+        alliance: calculated_stats.chance_of_bonuses(list(alliance))
+        for alliance in set(red_alliances) | set(blue_alliances)
+    }
+    red_bonuses = [bonuses_by_alliance[alliance] for alliance in red_alliances]
+    blue_bonuses = [bonuses_by_alliance[alliance] for alliance in blue_alliances]
+
+    return DataFrame(
+        {
+            "red_alliance": red_alliances.tolist(),
+            "blue_alliance": blue_alliances.tolist(),
+            "red_win_chance": red_win_chance,
+            "blue_win_chance": blue_win_chance,
+            "red_score": red_score,
+            "blue_score": blue_score,
+            "red_coop_chance": [bonuses[0] for bonuses in red_bonuses],
+            "red_melody_chance": [bonuses[1] for bonuses in red_bonuses],
+            "red_ensemble_chance": [bonuses[2] for bonuses in red_bonuses],
+            "blue_coop_chance": [bonuses[0] for bonuses in blue_bonuses],
+            "blue_melody_chance": [bonuses[1] for bonuses in blue_bonuses],
+            "blue_ensemble_chance": [bonuses[2] for bonuses in blue_bonuses]
+        },
+        index=match_schedule["match_key"].tolist()
+    )
+
+
+@st.cache_data(max_entries=GeneralConstants.DATA_VERSIONS_TO_CACHE)
+def _match_predictions_for_version(version: str, _event_data: EventData) -> DataFrame:
+    """Predicts every match in the schedule of a version of the event data."""
+    return predict_match_schedule(retrieve_calculated_stats(_event_data), _event_data.match_schedule)
+
+
+@profiled("data")
+def retrieve_match_predictions(event_data: EventData | None = None) -> DataFrame:
+    """Retrieves the predictions for every match in the schedule based on the latest scouting data.
+
+    Cached by the version of the event data, so the schedule is only predicted again when the data changes
+    and the predictions are shared across pages and sessions. Each version loaded in the background is predicted
+    right after it's loaded, so pages find its predictions already cached.
+
+    :param event_data: The event data to predict the schedule from, defaulting to the latest event data.
+    :return: A dataframe indexed by match key containing the predictions for each match.
+    """
+    event_data = event_data or load_event_data()
+    return _match_predictions_for_version(event_data.version, event_data)
+
+
+# Predicts the schedule of each new version of the event data before a page asks for it.
+after_event_data_refresh(retrieve_match_predictions)
@@ -0,0 +1,249 @@
+"""Defines the opt-in profiler used to find where the time goes during a rerun of a page."""
+
+import json
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import getattr_static, isfunction, signature
+from threading import get_ident
+from time import perf_counter
+from typing import Callable, Iterator, NamedTuple, TypeVar
+from weakref import WeakSet
+
+import streamlit as st
+from pandas import DataFrame
+
+from .constants import GeneralConstants
+from .refreshing import RefreshStatus
+from .result_cache import result_cache
+
+__all__ = [
+    "Profile",
+    "profile_methods",
+    "profiled",
+    "profiled_section",
+    "ProfiledCall",
+    "show_profile",
+    "start_profiling"
+]
+
+T = TypeVar("T")
+
+# The profile of the rerun running in the current thread, if it's being profiled.
+_active_profile: ContextVar["Profile | None"] = ContextVar("active_profile", default=None)
+
+# The functions wrapped by `profiled`, so methods inherited from a profiled class aren't wrapped twice.
+_profiled_functions = WeakSet()
+
+
+class ProfiledCall(NamedTuple):
+    """A call recorded by a `Profile`."""
+
+    name: str
+    category: str
+    start: float  # Seconds since the profile started
+    duration: float  # Seconds, including the calls made within it
+    thread_id: int
+
+
+class Profile:
+    """Records the calls made by profiled functions during one rerun of a page."""
+
+    def __init__(self, page_name: str):
+        self.page_name = page_name
+        self.started = perf_counter()
+        self.calls: list[ProfiledCall] = []
+
+    @contextmanager
+    def record(self, name: str, category: str) -> Iterator[None]:
+        """Records the time spent within the block as a call.
+
+        :param name: The name of the call (e.g. the qualified name of the function called).
+        :param category: The category of the call (e.g. "stats" or "graphing").
+        """
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.calls.append(ProfiledCall(name, category, start - self.started, perf_counter() - start, get_ident()))
+
+    def summary(self) -> DataFrame:
+        """Summarizes the calls recorded by name, from the most to the least time spent.
+
+        :return: A dataframe with the category, number of calls, total time and mean time of each name.
+        """
+        calls = DataFrame(self.calls, columns=ProfiledCall._fields)
+        summary = calls.groupby(["category", "name"]).agg(
+            calls=("duration", "count"),
+            total_time=("duration", "sum"),
+            mean_time=("duration", "mean")
+        ).reset_index()
+        summary[["total_time", "mean_time"]] *= 1000
+
+        return summary.sort_values(by="total_time", ascending=False, ignore_index=True).rename(
+            columns={
+                "category": "Category",
+                "name": "Name",
+                "calls": "Calls",
+                "total_time": "Total (ms)",
+                "mean_time": "Mean (ms)"
+            }
+        )
+
+    def to_trace(self) -> dict:
+        """Converts the calls recorded into the Chrome trace event format (viewable in Perfetto or chrome://tracing).
+
+        :return: The trace, ready to be written as JSON.
+        """
+        return {
+            "traceEvents": [
+                {
+                    "name": call.name,
+                    "cat": call.category,
+                    "ph": "X",
+                    "ts": call.start * 1e6,
+                    "dur": call.duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": call.thread_id
+                }
+                for call in self.calls
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {"page": self.page_name}
+        }
+
+
+def profiled(category: str, name: str | None = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorates a function so its calls are recorded while a rerun is being profiled.
+
+    The function keeps its name, docstring and signature, which the `Custom Graphs` page reads. When no rerun
+    is being profiled, the only overhead is checking whether one is.
+
+    :param category: The category the calls are recorded under (e.g. "stats" or "graphing").
+    :param name: The name the calls are recorded under, defaulting to the qualified name of the function.
+    :return: The decorator.
+    """
+    def decorator(function: Callable[..., T]) -> Callable[..., T]:
+        call_name = name or function.__qualname__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> T:
+            if (profile := _active_profile.get()) is None:
+                return function(*args, **kwargs)
+
+            with profile.record(call_name, category):
+                return function(*args, **kwargs)
+
+        wrapper.__signature__ = signature(function)
+        _profiled_functions.add(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def profile_methods(
+    category: str,
+    include: Callable[[str], bool] = lambda name: not name.startswith("_")
+) -> Callable[[type], type]:
+    """Decorates a class so the calls to its methods (including inherited ones) are recorded (see `profiled`).
+
+    :param category: The category the calls are recorded under.
+    :param include: Whether a method should be profiled given its name, defaulting to every public method.
+    :return: The class decorator.
+    """
+    def decorator(cls: type) -> type:
+        for name in dir(cls):
+            method = getattr_static(cls, name)
+
+            # Static methods, class methods and properties aren't plain functions, so they're left as is.
+            if include(name) and isfunction(method) and method not in _profiled_functions:
+                setattr(cls, name, profiled(category, name=f"{cls.__name__}.{name}")(method))
+
+        return cls
+
+    return decorator
+
+
+@contextmanager
+def profiled_section(name: str, category: str = "section") -> Iterator[None]:
+    """Records the time spent within a block of code while a rerun is being profiled.
+
+    :param name: The name the block is recorded under.
+    :param category: The category the block is recorded under.
+    """
+    if (profile := _active_profile.get()) is None:
+        yield
+        return
+
+    with profile.record(name, category):
+        yield
+
+
+def start_profiling(page_name: str) -> Profile | None:
+    """Starts profiling the current rerun if profiling is enabled, with `FALCONVIS_PROFILE` or `?profile=true`.
+
+    Called at the top of each page, before its page manager is created.
+
+    :param page_name: The name of the page being rerun.
+    :return: The profile of the rerun, or None if profiling is disabled.
+    """
+    profile = (
+        Profile(page_name)
+        if GeneralConstants.PROFILING_ENABLED or "true" in st.experimental_get_query_params().get("profile", [])
+        else None
+    )
+    _active_profile.set(profile)
+    return profile
+
+
+def show_profile(profile: Profile | None, refresh_status: RefreshStatus | None = None) -> None:
+    """Stops profiling the current rerun and shows where its time went in the sidebar.
+
+    Called at the bottom of each page; does nothing if the rerun isn't being profiled.
+
+    :param profile: The profile returned by `start_profiling`.
+    :param refresh_status: The status of the event data being served (see `event_data_status`).
+    """
+    if profile is None:
+        return
+
+    _active_profile.set(None)
+    rerun_time = perf_counter() - profile.started
+    profile.calls.append(ProfiledCall("rerun", "page", 0, rerun_time, get_ident()))
+
+    with st.sidebar.expander("🐢 Profile", expanded=True):
+        st.caption(f"This rerun of {profile.page_name} took {rerun_time * 1000:.0f} ms.")
+        st.dataframe(
+            profile.summary().style.format({"Total (ms)": "{:.1f}", "Mean (ms)": "{:.2f}"}),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.download_button(
+            "Download Trace",
+            json.dumps(profile.to_trace()),
+            file_name=f"falconvis_{profile.page_name.lower().replace(' ', '_')}_trace.json",
+            mime="application/json"
+        )
+
+        statistics = result_cache.statistics
+        st.caption(
+            f"{len(result_cache):,} results shared across sessions ({statistics['hits']:,} hits, "
+            f"{statistics['misses']:,} misses, {statistics['waits']:,} waits for a computation in flight and "
+            f"{statistics['evictions']:,} evictions)."
+        )
+
+        if refresh_status is not None:
+            st.caption(
+                f"Event data refresh #{refresh_status.refresh_count}"
+                + (
+                    f", refreshed at {refresh_status.last_refreshed:%H:%M:%S} in {refresh_status.last_duration:.2f} s"
+                    if refresh_status.last_refreshed is not None
+                    else ""
+                )
+                + f" ({refresh_status.failures} failed refreshes)."
+            )
+
+            if refresh_status.last_error is not None:
+                st.caption(f"Last refresh failed: {refresh_status.last_error}")
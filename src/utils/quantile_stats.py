@@ -0,0 +1,66 @@
+"""File that contains the class which holds thresholds and percentile ranks of statistics across an event."""
+
+import numpy as np
+from numpy import percentile
+from pandas import DataFrame
+
+__all__ = ["QuantileStats"]
+
+
+class QuantileStats:
+    """Holds the quantiles of statistics calculated for every team in an event, along with their percentile ranks.
+
+    Each statistic is evaluated once across all teams, and its values are kept sorted so that the percentile rank of
+    any value can be found with a binary search.
+    """
+
+    def __init__(self, stats_by_team: DataFrame, quantiles: list[float]):
+        """Creates the thresholds and sorted distributions of the statistics passed in.
+
+        :param stats_by_team: A dataframe indexed by team number with a column per statistic.
+        :param quantiles: The quantiles to find the thresholds at (eg 0.5 for the median).
+        """
+        self.stats_by_team = stats_by_team
+        self.thresholds = DataFrame(
+            {
+                stat: [percentile(values, quantile * 100) for quantile in quantiles]
+                for stat, values in stats_by_team.items()
+            },
+            index=list(quantiles)
+        )
+        self._sorted_values = {
+            stat: np.sort(values.dropna().to_numpy(dtype=float))
+            for stat, values in stats_by_team.items()
+        }
+
+    def threshold(self, stat: str, quantile: float) -> float:
+        """Returns the scalar value of a statistic at a quantile (eg passing in 0.5 will return the median).
+
+        :param stat: The name of the statistic.
+        :param quantile: The quantile to return the value at (must be one of the quantiles calculated).
+        :return: A float representing the scalar value for the quantile of said statistic.
+        """
+        return float(self.thresholds.at[quantile, stat])
+
+    def percentile_rank(self, stat: str, value: float) -> float:
+        """Returns the fraction of teams whose statistic is less than or equal to the value passed in.
+
+        :param stat: The name of the statistic.
+        :param value: The value to find the percentile rank of.
+        :return: A float from 0 to 1 representing the percentile rank of the value.
+        """
+        sorted_values = self._sorted_values[stat]
+
+        if not len(sorted_values):
+            return float("nan")
+
+        return float(np.searchsorted(sorted_values, value, side="right") / len(sorted_values))
+
+    def team_percentile_rank(self, stat: str, team_number: int) -> float:
+        """Returns the percentile rank of a team's statistic among every team at the event.
+
+        :param stat: The name of the statistic.
+        :param team_number: The team to find the percentile rank of.
+        :return: A float from 0 to 1 representing the percentile rank of said team.
+        """
+        return self.percentile_rank(stat, self.stats_by_team.at[team_number, stat])
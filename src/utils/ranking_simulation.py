@@ -0,0 +1,342 @@
+"""Defines the Monte Carlo engine that simulates the rest of the qualification matches at an event."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from pandas import DataFrame, Index
+from scipy.sparse import csr_matrix
+
+from .functions import match_appearances
+
+__all__ = [
+    "alliance_incidence",
+    "project_rankings",
+    "remaining_rp_distributions",
+    "simulate_rankings"
+]
+
+# The most ranking points an alliance can earn in a match (two for a win, one each for the melody and ensemble).
+_MAX_RP_PER_MATCH = 4
+
+# Simulations are sampled in batches so memory stays bounded for large events.
+_SIMULATIONS_PER_BATCH = 1000
+_PREDICTION_FIELDS = [
+    "red_win_chance",
+    "blue_win_chance",
+    "red_score",
+    "blue_score",
+    "red_coop_chance",
+    "red_melody_chance",
+    "red_ensemble_chance",
+    "blue_coop_chance",
+    "blue_melody_chance",
+    "blue_ensemble_chance"
+]
+
+
+def alliance_incidence(appearances: DataFrame, match_keys: list[str], teams: list[int], alliance: str) -> csr_matrix:
+    """Creates a sparse (match x team) matrix marking which teams play on an alliance in each match.
+
+    :param appearances: The appearances of each team in the matches, created by `match_appearances`.
+    :param match_keys: The matches to include, which determine the order of the rows.
+    :param teams: The teams at the event, which determine the order of the columns.
+    :param alliance: The alliance to mark the teams of (red/blue).
+    :return: A sparse matrix where each row has a one in the column of every team on the alliance.
+    """
+    alliance_appearances = appearances[appearances["alliance"] == alliance]
+    rows = Index(match_keys).get_indexer(alliance_appearances["match_key"])
+    columns = Index(teams).get_indexer(alliance_appearances.index)
+    in_matrix = (rows >= 0) & (columns >= 0)
+
+    return csr_matrix(
+        (np.ones(in_matrix.sum()), (rows[in_matrix], columns[in_matrix])),
+        shape=(len(match_keys), len(teams))
+    )
+
+
+def _rank_histogram(
+    seed: np.random.SeedSequence,
+    simulations: int,
+    chances: dict[str, np.ndarray],
+    red_incidence: csr_matrix,
+    blue_incidence: csr_matrix,
+    current_totals: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """Simulates the remaining matches and counts how often each team finishes in each rank.
+
+    :param seed: The seed sequence used to sample the outcomes of the matches.
+    :param simulations: The number of times to simulate the remaining matches.
+    :param chances: The chance of each alliance winning and earning each bonus in every remaining match.
+    :param red_incidence: The (match x team) matrix of which teams are on the red alliance.
+    :param blue_incidence: The (match x team) matrix of which teams are on the blue alliance.
+    :param current_totals: The ranking points, coopertition bonuses and points each team has so far, and how many
+        matches each team will have played by the end of qualifications.
+    :return: A (team x rank) array counting how often each team finished in each rank.
+    """
+    generator = np.random.default_rng(seed)
+    rps_so_far, coops_so_far, points_so_far, total_matches = current_totals
+    team_count = len(rps_so_far)
+    match_count = red_incidence.shape[0]
+    rank_histogram = np.zeros(team_count * team_count, dtype=np.int64)
+
+    for batch_start in range(0, simulations, _SIMULATIONS_PER_BATCH):
+        batch_size = min(_SIMULATIONS_PER_BATCH, simulations - batch_start)
+        match_outcome = generator.random((batch_size, match_count))
+        red_wins = match_outcome < chances["red_win_chance"]
+        blue_wins = match_outcome >= 1 - chances["blue_win_chance"]
+        ties = ~(red_wins | blue_wins)
+
+        red_rps = (
+            2 * red_wins + ties
+            + (generator.random((batch_size, match_count)) < chances["red_melody_chance"])
+            + (generator.random((batch_size, match_count)) < chances["red_ensemble_chance"])
+        )
+        blue_rps = (
+            2 * blue_wins + ties
+            + (generator.random((batch_size, match_count)) < chances["blue_melody_chance"])
+            + (generator.random((batch_size, match_count)) < chances["blue_ensemble_chance"])
+        )
+        red_coops = generator.random((batch_size, match_count)) < chances["red_coop_chance"]
+        blue_coops = generator.random((batch_size, match_count)) < chances["blue_coop_chance"]
+
+        # (team x match) @ (match x simulation) sums the outcomes of each team's matches in every simulation.
+        total_rps = rps_so_far + (red_incidence.T @ red_rps.T + blue_incidence.T @ blue_rps.T).T
+        total_coops = coops_so_far + (
+            red_incidence.T @ red_coops.T.astype(float) + blue_incidence.T @ blue_coops.T.astype(float)
+        ).T
+        average_points = np.broadcast_to(points_so_far / total_matches, total_rps.shape)
+
+        # Teams are ordered by average ranking points, then coopertition bonuses, then match points.
+        order = np.lexsort((-average_points, -total_coops / total_matches, -total_rps / total_matches), axis=-1)
+        rank_histogram += np.bincount(
+            (order * team_count + np.arange(team_count)).ravel(), minlength=team_count * team_count
+        )
+
+    return rank_histogram.reshape(team_count, team_count)
+
+
+def simulate_rankings(
+    rankings: DataFrame,
+    remaining_matches: DataFrame,
+    match_predictions: DataFrame,
+    simulations: int = 10_000,
+    seed: int = 0,
+    processes: int | None = None
+) -> DataFrame:
+    """Simulates the remaining qualification matches to find the distribution of where each team ranks.
+
+    Each simulation samples the winner and the bonuses of every remaining match from its predicted chances,
+    adding the ranking points and coopertition bonuses earned to what each team has so far.
+
+    :param rankings: The current rankings (with the `team`, `rp`, `coop`, `match_score` and `matches_played` fields).
+    :param remaining_matches: The remaining matches (with the `match_key`, `red_alliance` and `blue_alliance` fields).
+    :param match_predictions: The predictions for each match, indexed by match key.
+    :param simulations: The number of times to simulate the remaining matches.
+    :param seed: The seed used to sample the outcomes, so the same inputs always produce the same distribution.
+    :param processes: The number of processes to split the simulations across (runs in this process if not given).
+    :return: A dataframe with the expected rank, median rank and the chance of ranking in the top 8 and 16 for each team.
+    """
+    teams = rankings["team"].tolist()
+
+    if not teams:
+        return DataFrame(columns=["team", "expected_rank", "median_rank", "chance_of_top_8", "chance_of_top_16"])
+
+    predictions = match_predictions.reindex(
+        index=remaining_matches["match_key"].tolist(), columns=_PREDICTION_FIELDS
+    ).fillna(0)
+
+    match_keys = remaining_matches["match_key"].tolist()
+    appearances = match_appearances(remaining_matches)
+    red_incidence = alliance_incidence(appearances, match_keys, teams, "red")
+    blue_incidence = alliance_incidence(appearances, match_keys, teams, "blue")
+    chances = {
+        field: predictions[field].to_numpy()
+        for field in predictions.columns
+        if field.endswith("_chance")
+    }
+
+    # The expected score of each remaining match is used for the match points tiebreaker.
+    matches_played = rankings["matches_played"].to_numpy()
+    matches_left = np.asarray(red_incidence.sum(axis=0) + blue_incidence.sum(axis=0)).ravel()
+    total_matches = np.maximum(matches_played + matches_left, 1)
+    current_totals = (
+        np.nan_to_num(rankings["rp"].to_numpy() * matches_played),
+        np.nan_to_num(rankings["coop"].to_numpy() * matches_played),
+        np.nan_to_num(rankings["match_score"].to_numpy() * matches_played)
+        + red_incidence.T @ predictions["red_score"].to_numpy()
+        + blue_incidence.T @ predictions["blue_score"].to_numpy(),
+        total_matches
+    )
+
+    # Each chunk gets its own independent stream of random numbers spawned from the seed.
+    chunk_count = max(processes or 1, 1)
+    chunk_seeds = np.random.SeedSequence(seed).spawn(chunk_count)
+    chunk_sizes = [
+        simulations // chunk_count + (chunk_idx < simulations % chunk_count)
+        for chunk_idx in range(chunk_count)
+    ]
+    arguments = [
+        (chunk_seed, chunk_size, chances, red_incidence, blue_incidence, current_totals)
+        for chunk_seed, chunk_size in zip(chunk_seeds, chunk_sizes)
+    ]
+
+    if processes and processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            rank_histogram = sum(executor.map(_rank_histogram, *zip(*arguments)))
+    else:
+        rank_histogram = sum(_rank_histogram(*chunk_arguments) for chunk_arguments in arguments)
+
+    team_count = len(teams)
+    ranks = np.arange(1, team_count + 1)
+    rank_chances = rank_histogram / max(simulations, 1)
+    cumulative_chances = rank_chances.cumsum(axis=1)
+
+    return DataFrame(
+        {
+            "team": teams,
+            "expected_rank": rank_chances @ ranks,
+            "median_rank": ranks[np.argmax(cumulative_chances >= 0.5, axis=1)],
+            "chance_of_top_8": cumulative_chances[:, min(8, team_count) - 1],
+            "chance_of_top_16": cumulative_chances[:, min(16, team_count) - 1]
+        }
+    ).sort_values(by="expected_rank", kind="stable").reset_index(drop=True)
+
+
+def _match_rp_distributions(predictions: DataFrame, alliance_color: str) -> np.ndarray:
+    """Calculates the chance of an alliance earning 0-4 ranking points in each match.
+
+    :param predictions: The predictions for each match.
+    :param alliance_color: The color of the alliance to calculate the distributions for (red/blue).
+    :return: A (match x ranking points) array with the chance of earning each amount of ranking points.
+    """
+    opposing_color = "blue" if alliance_color == "red" else "red"
+    win_chance = predictions[f"{alliance_color}_win_chance"].to_numpy()
+    loss_chance = predictions[f"{opposing_color}_win_chance"].to_numpy()
+
+    rp_distributions = np.zeros((len(predictions), _MAX_RP_PER_MATCH + 1))
+    rp_distributions[:, 0] = loss_chance
+    rp_distributions[:, 1] = np.clip(1 - win_chance - loss_chance, 0, 1)
+    rp_distributions[:, 2] = win_chance
+
+    # Each bonus is independent of the result, so it either adds a ranking point or doesn't.
+    for bonus in ("melody", "ensemble"):
+        bonus_chance = predictions[f"{alliance_color}_{bonus}_chance"].to_numpy()[:, None]
+        shifted_distributions = np.zeros_like(rp_distributions)
+        shifted_distributions[:, 1:] = rp_distributions[:, :-1]
+        rp_distributions = rp_distributions * (1 - bonus_chance) + shifted_distributions * bonus_chance
+
+    return rp_distributions
+
+
+def remaining_rp_distributions(
+    teams: list[int],
+    remaining_matches: DataFrame,
+    match_predictions: DataFrame
+) -> np.ndarray:
+    """Calculates the exact distribution of ranking points each team earns over their remaining matches.
+
+    Each team's total is a sum of independent matches, so its distribution is built one match at a time
+    (convolving with that match's 0-4 ranking point distribution) for every team at once.
+
+    :param teams: The teams at the event, which determine the order of the rows.
+    :param remaining_matches: The remaining matches (with the `match_key`, `red_alliance` and `blue_alliance` fields).
+    :param match_predictions: The predictions for each match, indexed by match key.
+    :return: A (team x ranking points) array with the chance of each team earning each total.
+    """
+    predictions = match_predictions.reindex(
+        index=remaining_matches["match_key"].tolist(), columns=_PREDICTION_FIELDS
+    ).fillna(0)
+
+    # Pair every team with the distribution of each match they play in.
+    match_keys = remaining_matches["match_key"].tolist()
+    appearances = match_appearances(remaining_matches)
+    team_positions, match_distributions = [], []
+
+    for alliance_color in ("red", "blue"):
+        incidence = alliance_incidence(appearances, match_keys, teams, alliance_color).tocoo()
+        team_positions.append(incidence.col)
+        match_distributions.append(_match_rp_distributions(predictions, alliance_color)[incidence.row])
+
+    team_positions = np.concatenate(team_positions)
+    match_distributions = np.concatenate(match_distributions)
+
+    # Lay each team's matches out in its own row, padding teams with fewer matches with certain zero point matches.
+    order = np.argsort(team_positions, kind="stable")
+    team_positions, match_distributions = team_positions[order], match_distributions[order]
+    matches_per_team = np.bincount(team_positions, minlength=len(teams))
+    slots = np.arange(len(team_positions)) - np.repeat(np.cumsum(matches_per_team) - matches_per_team, matches_per_team)
+
+    most_matches_left = matches_per_team.max(initial=0)
+    distributions_by_slot = np.zeros((len(teams), most_matches_left, _MAX_RP_PER_MATCH + 1))
+    distributions_by_slot[:, :, 0] = 1
+    distributions_by_slot[team_positions, slots] = match_distributions
+
+    rp_distributions = np.zeros((len(teams), _MAX_RP_PER_MATCH * most_matches_left + 1))
+    rp_distributions[:, 0] = 1
+
+    for slot in range(most_matches_left):
+        next_distributions = np.zeros_like(rp_distributions)
+
+        for rp_earned in range(_MAX_RP_PER_MATCH + 1):
+            next_distributions[:, rp_earned:] += (
+                rp_distributions[:, :rp_distributions.shape[1] - rp_earned]
+                * distributions_by_slot[:, slot, rp_earned, None]
+            )
+
+        rp_distributions = next_distributions
+
+    return rp_distributions
+
+
+def project_rankings(
+    rankings: DataFrame,
+    remaining_matches: DataFrame,
+    match_predictions: DataFrame,
+    cutoffs: tuple[int, ...] = (8, 16)
+) -> DataFrame:
+    """Projects each team's final ranking points exactly from the chances of each remaining match.
+
+    The chance of reaching a cutoff is the chance that a team ends with at least as many ranking points as
+    the team projected to finish at that rank is expected to have.
+
+    :param rankings: The current rankings (with the `team`, `rp` and `matches_played` fields).
+    :param remaining_matches: The remaining matches (with the `match_key`, `red_alliance` and `blue_alliance` fields).
+    :param match_predictions: The predictions for each match, indexed by match key.
+    :param cutoffs: The ranks to calculate the chance of each team reaching.
+    :return: A dataframe with the expected ranking points, the 10th-90th percentile and the chance of reaching each cutoff.
+    """
+    teams = rankings["team"].tolist()
+    rp_distributions = remaining_rp_distributions(teams, remaining_matches, match_predictions)
+
+    current_rps = np.nan_to_num(rankings["rp"].to_numpy() * rankings["matches_played"].to_numpy())
+    remaining_rps = np.arange(rp_distributions.shape[1])
+    cumulative_chances = rp_distributions.cumsum(axis=1)
+    expected_rps = current_rps + rp_distributions @ remaining_rps
+
+    projections = DataFrame(
+        {
+            "team": teams,
+            "expected_rp": expected_rps,
+            "rp_10th_percentile": current_rps + np.argmax(cumulative_chances >= 0.1 - 1e-9, axis=1),
+            "rp_90th_percentile": current_rps + np.argmax(cumulative_chances >= 0.9 - 1e-9, axis=1)
+        }
+    )
+
+    # P(final RP >= cutoff) = P(remaining RP >= cutoff - current RP), read off each team's survival function.
+    survival_chances = np.hstack(
+        [1 - cumulative_chances + rp_distributions, np.zeros((len(teams), 1))]
+    )
+    projected_totals = np.sort(expected_rps)[::-1]
+
+    for cutoff in cutoffs:
+        if not teams:
+            projections[f"chance_of_top_{cutoff}"] = []
+            continue
+
+        cutoff_rps = projected_totals[min(cutoff, len(teams)) - 1]
+        rps_needed = np.clip(
+            np.ceil(cutoff_rps - current_rps - 1e-9), 0, rp_distributions.shape[1]
+        ).astype(int)
+        projections[f"chance_of_top_{cutoff}"] = survival_chances[np.arange(len(teams)), rps_needed]
+
+    return projections.sort_values(by="expected_rp", ascending=False, kind="stable").reset_index(drop=True)
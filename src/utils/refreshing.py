@@ -0,0 +1,149 @@
+"""Defines the `BackgroundRefresher` class used to keep event data fresh without making pages wait on it."""
+
+from datetime import datetime
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Any, Callable, Generic, NamedTuple, TypeVar
+
+__all__ = [
+    "BackgroundRefresher",
+    "RefreshStatus"
+]
+
+T = TypeVar("T")
+
+
+class RefreshStatus(NamedTuple):
+    """The state of a `BackgroundRefresher`, used to tell how fresh the data being served is."""
+
+    refresh_count: int  # The number of successful refreshes (not the content hash in `EventData.version`)
+    last_refreshed: datetime | None
+    last_duration: float | None
+    failures: int
+    last_error: str | None
+
+
+class BackgroundRefresher(Generic[T]):
+    """Reloads data on a background thread on a schedule, serving the last version loaded in the meantime.
+
+    Each version loaded is swapped in atomically once it's completely loaded, so callers either get the previous
+    version or the new one and never wait on a reload (except for the very first load).
+    """
+
+    def __init__(self, load: Callable[[], T], interval: float):
+        """Creates a refresher, which starts refreshing once its data is first requested.
+
+        :param load: The function loading the latest version of the data.
+        :param interval: The number of seconds between the end of a refresh and the start of the next one.
+        """
+        self.load = load
+        self.interval = interval
+
+        self._snapshot: tuple[int, T] | None = None  # The refresh count and its data, swapped in as one
+        self._last_refreshed = None
+        self._last_duration = None
+        self._failures = 0
+        self._last_error = None
+        self._hooks: list[Callable[[T], Any]] = []
+
+        self._lock = Lock()
+        self._first_load_lock = Lock()
+        self._stopped = Event()
+        self._thread = None
+
+    @property
+    def refresh_count(self) -> int:
+        """The number of successful refreshes, which counts the data being served from 1 (0 before the first load)."""
+        snapshot = self._snapshot
+        return snapshot[0] if snapshot is not None else 0
+
+    def add_refresh_hook(self, hook: Callable[[T], Any]) -> None:
+        """Registers a function called with the data each time a new version is loaded.
+
+        Hooks run on a background thread once the new version is swapped in, so the work derived from each version
+        (e.g. predicting the match schedule) is done before a page asks for it rather than on the page's rerun.
+
+        :param hook: The function called with the data loaded.
+        """
+        self._hooks.append(hook)
+
+    def _run_hooks(self, data: T) -> None:
+        """Calls every hook with the data loaded."""
+        for hook in self._hooks:
+            try:
+                hook(data)
+            except Exception:
+                # Whatever the hook precomputes is computed again (raising the error) when a page asks for it.
+                continue
+
+    def refresh(self) -> T:
+        """Loads the latest version of the data and swaps it in.
+
+        :return: The data loaded.
+        :raises Exception: Whichever exception `load` raised, in which case the current version keeps being served.
+        """
+        start = perf_counter()
+
+        try:
+            data = self.load()
+        except Exception as error:
+            with self._lock:
+                self._failures += 1
+                self._last_error = repr(error)
+            raise
+
+        with self._lock:
+            self._snapshot = (self.refresh_count + 1, data)
+            self._last_refreshed = datetime.now()
+            self._last_duration = perf_counter() - start
+            self._last_error = None
+
+        return data
+
+    def current(self) -> T:
+        """Returns the current version of the data, loading it first if it hasn't been loaded yet.
+
+        Also starts the background thread refreshing the data if it isn't running.
+
+        :return: The current version of the data.
+        """
+        if self._snapshot is None:
+            with self._first_load_lock:
+                if self._snapshot is None:
+                    data = self.refresh()
+                    Thread(target=self._run_hooks, args=(data,), name="RefreshHooks", daemon=True).start()
+
+        self.start()
+        return self._snapshot[1]
+
+    def status(self) -> RefreshStatus:
+        """Returns when the data was last refreshed, how long that took and how many refreshes have failed."""
+        with self._lock:
+            return RefreshStatus(
+                self.refresh_count, self._last_refreshed, self._last_duration, self._failures, self._last_error
+            )
+
+    def start(self) -> None:
+        """Starts the background thread refreshing the data, if it isn't running already."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stopped.clear()
+            self._thread = Thread(target=self._run, name="BackgroundRefresher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread refreshing the data after its current refresh."""
+        self._stopped.set()
+
+    def _run(self) -> None:
+        """Refreshes the data every `interval` seconds until stopped."""
+        while not self._stopped.wait(self.interval):
+            try:
+                data = self.refresh()
+            except Exception:
+                # Counted as a failure by `refresh`; the current version keeps being served.
+                continue
+
+            self._run_hooks(data)
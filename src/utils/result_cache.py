@@ -0,0 +1,150 @@
+"""Defines the `ResultCache` class used to share computed results across every session of the app."""
+
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from functools import wraps
+from inspect import signature
+from threading import Lock
+from typing import Any, Callable, Hashable, TypeVar
+
+from .constants import GeneralConstants
+
+__all__ = [
+    "result_cache",
+    "ResultCache",
+    "shared_result"
+]
+
+T = TypeVar("T")
+
+
+class ResultCache:
+    """Keeps the most recently used results of computations, shared by every session and thread in the process.
+
+    Computing a result that's already being computed waits for the computation in flight instead of starting
+    another one, so a burst of identical requests (e.g. the whole drive team opening the same team after a match)
+    only computes it once. Once there are more results than `max_entries`, the least recently used is evicted.
+    """
+
+    def __init__(self, max_entries: int = GeneralConstants.RESULTS_TO_CACHE):
+        self.max_entries = max_entries
+        self.statistics = Counter()  # Hits, misses, waits (for a computation in flight) and evictions
+
+        self._results = OrderedDict()  # Ordered from the least to the most recently used
+        self._computations = {}  # The futures of the computations in flight
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Returns the result cached under a key, computing it if it isn't cached or waiting for it if it's in flight.
+
+        A computation that fails isn't cached, and its error is raised to every caller waiting for it.
+
+        :param key: The key the result is cached under.
+        :param compute: Computes the result when it isn't cached.
+        :return: The result cached under the key.
+        """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.statistics["hits"] += 1
+                return self._results[key]
+
+            computation = self._computations.get(key)
+
+            if computation is None:
+                computation = self._computations[key] = Future()
+                self.statistics["misses"] += 1
+                computing = True
+            else:
+                self.statistics["waits"] += 1
+                computing = False
+
+        if not computing:
+            return computation.result()
+
+        try:
+            result = compute()
+        except BaseException as error:
+            with self._lock:
+                del self._computations[key]
+
+            computation.set_exception(error)
+            raise
+
+        with self._lock:
+            del self._computations[key]
+            self._results[key] = result
+
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+                self.statistics["evictions"] += 1
+
+        computation.set_result(result)
+        return result
+
+    def clear(self) -> None:
+        """Evicts every cached result (computations in flight still finish and are cached)."""
+        with self._lock:
+            self._results.clear()
+
+
+# Shared by every session, so identical computations are only done once per process.
+result_cache = ResultCache()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Converts an argument into a hashable form, raising a `TypeError` if it can't be (e.g. a series).
+
+    Callables raise a `TypeError` too: they hash by identity, so a lambda created on every rerun would never hit,
+    and lambdas sharing the same code can still capture different values.
+    """
+    if callable(value):
+        raise TypeError(f"{value!r} can't be part of a key.")
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    elif isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    elif isinstance(value, set):
+        return frozenset(value)
+
+    hash(value)
+    return value
+
+
+def shared_result(function: Callable[..., T]) -> Callable[..., T]:
+    """Decorates a function so its results are shared through `result_cache` across every session.
+
+    Results are keyed by the function, the `version` of its first argument (the event data or the `CalculatedStats`
+    of a version of it) and the rest of its arguments. Calls whose first argument isn't versioned or whose arguments
+    aren't hashable (e.g. a series) or contain a callable (e.g. a predicate) are computed as is, so they don't fill
+    the cache with entries that are never hit again. Since results are shared, they must not be mutated.
+
+    The function keeps its name, docstring and signature, which the `Custom Graphs` page reads.
+
+    :param function: The function whose results are shared.
+    :return: The decorated function.
+    """
+    function_signature = signature(function)
+
+    @wraps(function)
+    def wrapper(*args, **kwargs) -> T:
+        if not args or (version := getattr(args[0], "version", None)) is None:
+            return function(*args, **kwargs)
+
+        # Binds the arguments so the same call is keyed the same way however its arguments are passed.
+        arguments = function_signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+
+        try:
+            key = (function, version, _freeze(list(arguments.arguments.values())[1:]))
+        except TypeError:
+            return function(*args, **kwargs)
+
+        return result_cache.get_or_compute(key, lambda: function(*args, **kwargs))
+
+    wrapper.__signature__ = function_signature
+    return wrapper
@@ -0,0 +1,106 @@
+"""Defines functions that persist parsed event data as columnar snapshots on disk, which load without parsing."""
+
+import json
+import os
+from threading import get_ident
+
+import pyarrow as pa
+from pandas import DataFrame
+from pyarrow import feather
+
+from .constants import GeneralConstants
+
+__all__ = [
+    "read_snapshot",
+    "write_snapshot"
+]
+
+# The key of the metadata stored in each snapshot's schema.
+_METADATA_KEY = b"falconvis"
+
+
+def _snapshot_path(name: str, directory: str) -> str:
+    """Returns the path of the snapshot with the given name."""
+    return os.path.join(directory, f"{name}.arrow")
+
+
+def write_snapshot(
+    name: str,
+    data: DataFrame,
+    version: str | None = None,
+    directory: str = GeneralConstants.SNAPSHOT_DIRECTORY
+) -> None:
+    """Writes a dataframe as an uncompressed Arrow (Feather v2) file so it can be memory-mapped when loaded.
+
+    Columns Arrow can't store as-is (such as ones mixing booleans, numbers and strings) are stored as JSON text,
+    and list columns are converted back to lists when loaded, so a snapshot loads exactly as it was written.
+
+    :param name: The name of the snapshot (e.g. `scouting_data`).
+    :param data: The dataframe to write.
+    :param version: An optional version (such as the digest of the payload the data was parsed from).
+    :param directory: The directory to write the snapshot to.
+    """
+    json_columns, list_columns, arrays = [], [], {}
+
+    for column in data.columns:
+        try:
+            arrays[column] = pa.array(data[column], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays[column] = pa.array(data[column].apply(json.dumps), type=pa.string())
+            json_columns.append(column)
+            continue
+
+        if pa.types.is_list(arrays[column].type):
+            list_columns.append(column)
+
+    metadata = {
+        "version": version,
+        "json_columns": json_columns,
+        "list_columns": list_columns,
+        "attrs": data.attrs
+    }
+    table = pa.table(arrays).replace_schema_metadata({_METADATA_KEY: json.dumps(metadata)})
+
+    os.makedirs(directory, exist_ok=True)
+    path = _snapshot_path(name, directory)
+    temporary_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+    feather.write_feather(table, temporary_path, compression="uncompressed")
+    os.replace(temporary_path, path)
+
+
+def read_snapshot(
+    name: str,
+    version: str | None = None,
+    directory: str = GeneralConstants.SNAPSHOT_DIRECTORY
+) -> DataFrame | None:
+    """Loads a snapshot written by `write_snapshot`, memory-mapping the file so it's read without extra buffering.
+
+    The columns are copied out of the mapping into the dataframe returned (the rest of FalconVis expects NumPy-backed
+    columns), so the mapping only speeds up the read; processes loading the same snapshot don't share its data.
+
+    :param name: The name of the snapshot (e.g. `scouting_data`).
+    :param version: If given, the snapshot is only loaded if it was written with the same version.
+    :param directory: The directory to load the snapshot from.
+    :return: The dataframe stored in the snapshot, or None if there's no (matching) snapshot.
+    """
+    try:
+        table = feather.read_table(_snapshot_path(name, directory), memory_map=True)
+    except (OSError, pa.ArrowInvalid):
+        return None
+
+    metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b"{}"))
+
+    if version is not None and metadata.get("version") != version:
+        return None
+
+    # Copies every column, so the dataframe outlives the mapping and can be modified like a parsed one.
+    data = table.to_pandas()
+
+    for column in metadata.get("json_columns", []):
+        data[column] = data[column].apply(json.loads)
+
+    for column in metadata.get("list_columns", []):
+        data[column] = data[column].apply(lambda values: values.tolist())
+
+    data.attrs = metadata.get("attrs", {})
+    return data